@@ -0,0 +1,4 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmarks (not packaged). Run from the repo root: python -m benchmarks.<name>."""
@@ -0,0 +1,8 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""python -m benchmarks: run the full suite (see benchmarks/suite.py)."""
+
+from benchmarks.suite import main
+
+main()
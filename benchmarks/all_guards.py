@@ -0,0 +1,84 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""All-guards diagnostics: per-guard calls vs modulate_all_guards vs modulate_batch(all_guards)."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.batch import GuardContextBatch, guard_cooccurrence, modulate_batch
+from dmc_core.dmc.diagnostic import _guard_calls, modulate_all_guards
+from dmc_core.dmc.guards_generic import GUARD_ORDER
+from dmc_core.dmc.policy import GuardPolicy
+
+
+def _contexts(n: int, rng: np.random.Generator) -> list[dict]:
+    last = rng.integers(0, 8000, n).tolist()
+    errors = rng.integers(0, 12, n).tolist()
+    events = rng.integers(0, 14, n).tolist()
+    failures = rng.integers(0, 6, n).tolist()
+    return [
+        {
+            "now_ms": 100_000,
+            "last_event_ts_ms": 100_000 - last[i],
+            "errors_in_window": errors[i],
+            "steps_in_window": 50,
+            "rate_limit_events": events[i],
+            "recent_failures": failures[i],
+        }
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--items", type=int, default=200_000)
+    parser.add_argument("--batch-items", type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    policy = GuardPolicy()
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    contexts = _contexts(args.items, rng)
+
+    t0 = time.perf_counter()
+    per_guard = []
+    for ctx in contexts:  # the workaround: call every guard function separately
+        bits = 0
+        for g, (fn, call_args) in enumerate(_guard_calls(policy, ctx)):
+            if not fn(*call_args)[0]:
+                bits |= 1 << g
+        per_guard.append(bits)
+    loop = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    scalar = [modulate_all_guards(proposal, policy, ctx)[2] for ctx in contexts]
+    all_guards = time.perf_counter() - t0
+    assert scalar == per_guard
+    print(f"per-guard calls      {loop / args.items * 1e9:8.0f} ns/context (bits only)")
+    print(f"modulate_all_guards  {all_guards / args.items * 1e9:8.0f} ns/context (+ decision)")
+
+    repeats = -(-args.batch_items // args.items)
+    columns = GuardContextBatch.from_contexts(contexts)
+    columns = {k: np.tile(v, repeats)[: args.batch_items] for k, v in columns.items()}
+    proposals = [proposal] * args.batch_items
+    t0 = time.perf_counter()
+    result = modulate_batch(proposals, policy, columns, all_guards=True)
+    matrix = guard_cooccurrence(result.failed_bits)
+    batch = time.perf_counter() - t0
+    print(
+        f"modulate_batch(all_guards) + co-occurrence "
+        f"{batch / args.batch_items * 1e9:6.1f} ns/context over {args.batch_items} rows"
+    )
+    width = max(map(len, GUARD_ORDER))
+    for name, row in zip(GUARD_ORDER, matrix):
+        print(f"  {name:{width}s} " + " ".join(f"{v:9d}" for v in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Arrow table of contexts: per-row dicts + modulate vs modulate_columnar (time, peak memory)."""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pyarrow as pa
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.offline.columnar import modulate_columnar
+
+
+def make_table(n: int) -> pa.Table:
+    rng = np.random.default_rng(0)
+    now = rng.integers(0, 1_000_000, n)
+    cooldown = pa.array(now + rng.integers(-500, 500, n), mask=rng.random(n) < 0.8)
+    return pa.table(
+        {
+            "now_ms": now,
+            "last_event_ts_ms": now - rng.integers(0, 6000, n),
+            "ops_state": pa.array(np.where(rng.random(n) < 0.02, "RED", "GREEN")),
+            "errors_in_window": rng.integers(0, 5, n),
+            "steps_in_window": rng.integers(1, 100, n),
+            "rate_limit_events": rng.integers(0, 12, n),
+            "recent_failures": rng.integers(0, 6, n),
+            "cooldown_until_ms": cooldown,
+            "action": pa.array(np.full(n, "ACT")),
+        }
+    )
+
+
+def per_row(table: pa.Table, policy: GuardPolicy) -> int:
+    allowed = 0
+    for row in table.to_pylist():
+        proposal = Proposal(action=Action(row.pop("action")), confidence=0.8)
+        allowed += modulate(proposal, policy, row)[0].allowed
+    return allowed
+
+
+def columnar(table: pa.Table, policy: GuardPolicy) -> int:
+    out = modulate_columnar(table, policy)
+    return np.count_nonzero(out.column("allowed").to_numpy())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    table = make_table(args.rows)
+    policy = GuardPolicy()
+    results = {}
+    for name, run in (("per-row dicts", per_row), ("modulate_columnar", columnar)):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        results[name] = int(run(table, policy))
+        seconds = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:18s} {args.rows / seconds:14,.0f} rows/s  "
+            f"peak {peak / 2**20:8.1f} MiB  allowed {results[name]}"
+        )
+    assert len(set(results.values())) == 1
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Per-call latency: modulate vs compile_policy (pass path and one failing guard)."""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.compiled import compile_policy
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+CONTEXTS = {
+    "pass": {
+        "now_ms": 5000,
+        "last_event_ts_ms": 4000,
+        "errors_in_window": 0,
+        "steps_in_window": 100,
+        "rate_limit_events": 0,
+        "recent_failures": 0,
+    },
+    "cooldown_fail": {
+        "now_ms": 5000,
+        "last_event_ts_ms": 4000,
+        "errors_in_window": 0,
+        "steps_in_window": 100,
+        "rate_limit_events": 0,
+        "recent_failures": 0,
+        "cooldown_until_ms": 6000,
+    },
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    proposal = Proposal(action=Action.ACT, confidence=0.8, reasons=["bench"])
+    policy = GuardPolicy()
+    fn = compile_policy(policy)
+    for name, context in CONTEXTS.items():
+        base = min(
+            timeit.repeat(
+                lambda c=context: modulate(proposal, policy, c), number=args.number, repeat=5
+            )
+        )
+        fast = min(timeit.repeat(lambda c=context: fn(proposal, c), number=args.number, repeat=5))
+        print(
+            f"{name:14s} modulate {base / args.number * 1e9:7.0f} ns/call  "
+            f"compiled {fast / args.number * 1e9:7.0f} ns/call  speedup {base / fast:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""DecisionCache vs modulate for idle keys whose contexts differ only in now_ms."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.cache import DecisionCache
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-k", "--keys", type=int, default=10_000)
+    parser.add_argument("-t", "--ticks", type=int, default=50)
+    parser.add_argument("--tick-ms", type=int, default=250)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    policy = GuardPolicy()
+    proposal = Proposal(action=Action.ACT, confidence=0.8, reasons=["idle"])
+    keys = [
+        {
+            "last_event_ts_ms": rng.randint(0, 20_000),
+            "errors_in_window": rng.randint(0, 2),
+            "steps_in_window": 20,
+            "rate_limit_events": rng.randint(0, 12),
+            "cooldown_until_ms": rng.choice([None, None, None, rng.randint(0, 20_000)]),
+        }
+        for _ in range(args.keys)
+    ]
+    contexts = [
+        dict(base, now_ms=tick * args.tick_ms) for tick in range(args.ticks) for base in keys
+    ]
+
+    t0 = time.perf_counter()
+    for ctx in contexts:
+        modulate(proposal, policy, ctx)
+    plain = time.perf_counter() - t0
+
+    cache = DecisionCache(policy, maxsize=2 * args.keys)
+    t0 = time.perf_counter()
+    for ctx in contexts:
+        cache.modulate(proposal, ctx)
+    cached = time.perf_counter() - t0
+
+    n = len(contexts)
+    stats = cache.stats()
+    print(f"modulate      {plain / n * 1e9:7.0f} ns/decision")
+    print(
+        f"DecisionCache {cached / n * 1e9:7.0f} ns/decision  x{plain / cached:4.2f}  "
+        f"hit rate {stats.hit_rate:.1%}  expired {stats.expired}  size {stats.size}"
+    )
+
+
+if __name__ == "__main__":
+    main()
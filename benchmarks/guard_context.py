@@ -0,0 +1,72 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Memory per context and modulate latency: dict vs GuardContext vs GuardContextBatch."""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import tracemalloc
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+CONTEXT = {
+    "now_ms": 5000,
+    "last_event_ts_ms": 4000,
+    "ops_deny_actions": None,
+    "ops_state": "GREEN",
+    "ops_cooldown_until_ms": None,
+    "errors_in_window": 0,
+    "steps_in_window": 100,
+    "rate_limit_events": 0,
+    "recent_failures": 0,
+    "cooldown_until_ms": None,
+}
+
+
+def _bytes_per_item(make, n: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [make(i) for i in range(n)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return used / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=100_000)
+    args = parser.parse_args()
+    n = args.number
+
+    # Distinct now_ms per item so values are real per-context ints, not shared constants.
+    mem_dict = _bytes_per_item(lambda i: dict(CONTEXT, now_ms=10**6 + i), n)
+    mem_typed = _bytes_per_item(
+        lambda i: GuardContext.from_dict(dict(CONTEXT, now_ms=10**6 + i)), n
+    )
+    print(f"memory  dict         {mem_dict:7.1f} B/context")
+    print(f"memory  GuardContext {mem_typed:7.1f} B/context")
+    try:
+        from dmc_core.dmc.batch import GuardContextBatch
+    except ImportError:
+        print("memory  GuardContextBatch: numpy not installed")
+    else:
+        batch = GuardContextBatch.from_contexts([GuardContext.from_dict(CONTEXT)] * n)
+        print(f"memory  GuardContextBatch {batch.nbytes / n:5.1f} B/context (column buffers)")
+
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    policy = GuardPolicy()
+    typed = GuardContext.from_dict(CONTEXT)
+    for name, context in (("dict", CONTEXT), ("GuardContext", typed)):
+        t = min(timeit.repeat(lambda c=context: modulate(proposal, policy, c), number=n, repeat=5))
+        print(f"latency modulate({name:12s}) {t / n * 1e9:7.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
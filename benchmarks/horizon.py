@@ -0,0 +1,63 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Evaluations until a HOLD lifts: fixed-interval polling vs waking at next_change_ms."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.horizon import NEVER, next_change_ms
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-k", "--keys", type=int, default=2000)
+    parser.add_argument("--poll-ms", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    policy = GuardPolicy()
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    contexts = [
+        {
+            "now_ms": 0,
+            "last_event_ts_ms": 0,
+            "ops_cooldown_until_ms": rng.choice([None, rng.randint(0, 3000)]),
+            "cooldown_until_ms": rng.randint(1, 4000),
+        }
+        for _ in range(args.keys)
+    ]
+
+    def until_allowed(ctx: dict, wake) -> int:
+        evaluations = 0
+        now = 0
+        while True:
+            final, mismatch = modulate(proposal, policy, dict(ctx, now_ms=now))
+            evaluations += 1
+            if final.allowed:
+                return evaluations
+            now = wake(dict(ctx, now_ms=now), now, mismatch)
+            assert now != NEVER
+
+    for name, wake in (
+        ("polling", lambda ctx, now, mi: now + args.poll_ms),
+        ("next_change_ms", lambda ctx, now, mi: next_change_ms(policy, ctx, mi)),
+    ):
+        t0 = time.perf_counter()
+        evaluations = sum(until_allowed(ctx, wake) for ctx in contexts)
+        seconds = time.perf_counter() - t0
+        print(
+            f"{name:15s} {evaluations / args.keys:8.1f} evaluations/key  "
+            f"{seconds / args.keys * 1e6:8.1f} us/key"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+Instrumentation overhead: modulate disabled / enabled vs an unhooked reference.
+
+The reference is modulate without the recorder check; "disabled" should be within noise
+of it (one global load per call).
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from decision_schema.types import Action, MismatchInfo, Proposal
+
+from dmc_core import metrics
+from dmc_core.dmc.modulator import _fail_closed, _modulate_impl, modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+CONTEXT = {
+    "now_ms": 5000,
+    "last_event_ts_ms": 4000,
+    "errors_in_window": 0,
+    "steps_in_window": 100,
+    "rate_limit_events": 0,
+    "recent_failures": 0,
+}
+
+
+def _reference(proposal, policy, context, *, low_alloc=False):
+    try:
+        return _modulate_impl(proposal, policy, context, low_alloc)
+    except Exception as e:  # noqa: BLE001
+        return _fail_closed(policy), MismatchInfo(
+            flags=["modulate_exception"], reason_codes=[type(e).__name__]
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=200_000)
+    parser.add_argument("-r", "--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    proposal = Proposal(action=Action.ACT, confidence=0.8, reasons=["bench"])
+    policy = GuardPolicy()
+
+    def best(fn) -> float:
+        runs = timeit.repeat(
+            lambda: fn(proposal, policy, CONTEXT), number=args.number, repeat=args.repeat
+        )
+        return min(runs) / args.number * 1e9
+
+    reference = best(_reference)
+    disabled = best(modulate)
+    inst = metrics.enable()
+    enabled = best(modulate)
+    metrics.disable()
+    print(f"reference (no hook) {reference:7.0f} ns/call")
+    print(f"disabled            {disabled:7.0f} ns/call  ({disabled / reference - 1:+6.1%})")
+    print(f"enabled             {enabled:7.0f} ns/call  ({enabled / reference - 1:+6.1%})")
+    print("enabled p50/p99 ns:", inst.snapshot().to_dict()["latency_ns"])
+
+
+if __name__ == "__main__":
+    main()
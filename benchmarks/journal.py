@@ -0,0 +1,57 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Per-decision audit cost: DecisionJournal.append vs one JSON line per decision."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.journal import DecisionJournal
+
+CONTEXT = {"now_ms": 5000, "last_event_ts_ms": 4000, "cooldown_until_ms": 6000}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=500_000)
+    args = parser.parse_args()
+
+    proposal = Proposal(action=Action.ACT, confidence=0.8, reasons=["bench"])
+    final, mismatch = modulate(proposal, GuardPolicy(), CONTEXT)
+    n = args.number
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        with open(Path(tmp) / "decisions.jsonl", "w", encoding="utf-8") as f:
+            for i in range(n):
+                record = {
+                    "ts_ms": i,
+                    "key": "k",
+                    "action": final.action.value,
+                    "allowed": final.allowed,
+                    "flags": mismatch.flags,
+                    "reason_codes": mismatch.reason_codes,
+                }
+                f.write(json.dumps(record) + "\n")
+        json_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        with DecisionJournal(Path(tmp) / "journal") as journal:
+            for i in range(n):
+                journal.append(i, final, mismatch, key="k")
+        journal_s = time.perf_counter() - t0
+
+    print(f"json lines  {json_s / n * 1e9:7.0f} ns/decision")
+    print(f"journal     {journal_s / n * 1e9:7.0f} ns/decision  speedup {json_s / journal_s:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""modulate_parallel scaling: shared-memory columns on 1..N worker processes."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.batch import modulate_batch
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.offline.parallel import modulate_parallel
+
+
+def _columns(n: int, rng: np.random.Generator) -> dict:
+    now = np.full(n, 100_000, dtype=np.int64)
+    return {
+        "now_ms": now,
+        "last_event_ts_ms": now - rng.integers(0, 8000, n),
+        "ops_state": np.where(rng.random(n) < 0.05, "RED", "GREEN").astype(object),
+        "errors_in_window": rng.integers(0, 12, n),
+        "steps_in_window": rng.integers(0, 100, n),
+        "rate_limit_events": rng.integers(0, 14, n),
+        "recent_failures": rng.integers(0, 6, n),
+        "cooldown_until_ms": np.where(rng.random(n) < 0.02, 100_010, None).astype(object),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--items", type=int, default=4_000_000)
+    parser.add_argument("-w", "--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--range-size", type=int, default=1 << 18)
+    args = parser.parse_args()
+
+    columns = _columns(args.items, np.random.default_rng(0))
+    proposals = [Proposal(action=Action.ACT, confidence=0.8)] * args.items
+    policy = GuardPolicy()
+
+    t0 = time.perf_counter()
+    expected = modulate_batch(proposals, policy, columns)
+    base = time.perf_counter() - t0
+    print(f"modulate_batch (1 process)  {base:6.2f} s")
+    for workers in range(1, args.max_workers + 1):
+        with ProcessPoolExecutor(workers) as pool:
+            warm = {k: v[:1000] for k, v in columns.items()}
+            modulate_parallel(proposals[:1000], policy, warm, executor=pool)  # start workers
+            t0 = time.perf_counter()
+            result = modulate_parallel(
+                proposals, policy, columns, executor=pool, range_size=args.range_size
+            )
+            seconds = time.perf_counter() - t0
+        assert np.array_equal(result.reason, expected.reason)
+        print(f"modulate_parallel {workers:2d} workers {seconds:6.2f} s  x{base / seconds:4.2f}")
+
+
+if __name__ == "__main__":
+    main()
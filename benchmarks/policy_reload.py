@@ -0,0 +1,78 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""PolicyStore.modulate latency: compiled fn vs store, and store while the file is reloaded."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.compiled import compile_policy
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.policy_store import PolicyStore
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.8)
+CONTEXT = {"now_ms": 10_000, "last_event_ts_ms": 9000, "rate_limit_events": 3}
+
+
+def per_call_ns(fn, n: int) -> float:
+    t0 = time.perf_counter_ns()
+    for _ in range(n):
+        fn(PROPOSAL, CONTEXT)
+    return (time.perf_counter_ns() - t0) / n
+
+
+def _write(path: Path, staleness_ms: int) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"staleness_ms": staleness_ms}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--calls", type=int, default=500_000)
+    parser.add_argument("--interval-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "policy.json"
+        _write(path, 5000)
+        fn = compile_policy(GuardPolicy())
+        with PolicyStore(path) as store:
+            base = per_call_ns(fn, args.calls)
+            print(f"compile_policy fn            {base:7.0f} ns/call")
+            ns = per_call_ns(store.modulate, args.calls)
+            print(f"PolicyStore.modulate         {ns:7.0f} ns/call")
+
+            stop = threading.Event()
+
+            def writer() -> None:
+                i = 0
+                while not stop.wait(args.interval_ms / 1000):
+                    i += 1
+                    _write(path, 5000 + i % 2)
+
+            thread = threading.Thread(target=writer)
+            thread.start()
+            store.watch(interval_s=args.interval_ms / 1000)
+            first = store.version
+            ns = per_call_ns(store.modulate, args.calls)
+            stop.set()
+            thread.join()
+            store.close()
+            print(
+                f"  while reloading            {ns:7.0f} ns/call  "
+                f"({store.version - first} versions published)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Replay throughput: recorded contexts x candidate policies (chunked, from disk)."""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from dmc_core.dmc.batch import UNSET
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.offline import CONTEXT_DTYPE, ContextRecorder, replay
+
+
+def _records(n: int, rng: np.random.Generator) -> np.ndarray:
+    rec = np.zeros(n, dtype=CONTEXT_DTYPE)
+    rec["now_ms"] = 100_000
+    rec["last_event_ts_ms"] = 100_000 - rng.integers(0, 8000, n)
+    rec["ops_deny_actions"] = rng.random(n) < 0.01
+    rec["ops_cooldown_until_ms"] = UNSET
+    rec["errors_in_window"] = rng.integers(0, 12, n)
+    rec["steps_in_window"] = rng.integers(0, 100, n)
+    rec["rate_limit_events"] = rng.integers(0, 14, n)
+    rec["recent_failures"] = rng.integers(0, 6, n)
+    rec["cooldown_until_ms"] = np.where(rng.random(n) < 0.02, 100_010, UNSET)
+    return rec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--records", type=int, default=5_000_000)
+    parser.add_argument("-p", "--policies", type=int, default=8)
+    parser.add_argument("--chunk", type=int, default=1 << 20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    candidates = {
+        f"staleness_{s}": GuardPolicy(staleness_ms=s)
+        for s in np.linspace(1000, 8000, args.policies).astype(int).tolist()
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "contexts.bin"
+        with ContextRecorder(path) as recorder:
+            for start in range(0, args.records, 1 << 20):
+                recorder.append_records(_records(min(1 << 20, args.records - start), rng))
+        t0 = time.perf_counter()
+        report = replay(path, GuardPolicy(), candidates, chunk_size=args.chunk)
+        seconds = time.perf_counter() - t0
+    evaluations = report.records * (len(candidates) + 1)
+    print(
+        f"{report.records} records x {len(candidates) + 1} policies in {seconds:.2f} s "
+        f"({evaluations / seconds / 1e6:.1f} M evaluations/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
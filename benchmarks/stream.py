@@ -0,0 +1,82 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Raw events to decisions: materialized context dicts vs modulate_stream (time, peak memory)."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import tracemalloc
+from collections.abc import Iterator
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import GuardEvent, GuardState
+from dmc_core.dmc.stream import modulate_stream
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.8)
+
+
+def raw_events(n: int, keys: int) -> Iterator[dict]:
+    rng = random.Random(0)
+    for i in range(n):
+        event = {"now_ms": i, "id": rng.randrange(keys), "events": 1}
+        if rng.random() < 0.3:
+            event["steps"] = 1
+            event["errors"] = int(rng.random() < 0.05)
+        if rng.random() < 0.5:
+            event["proposal"] = PROPOSAL
+        yield event
+
+
+def materialized(n: int, keys: int, policy: GuardPolicy) -> int:
+    """Build every context dict up front, then modulate each."""
+    states: dict[int, GuardState] = {}
+    work = []
+    for raw in raw_events(n, keys):
+        state = states.get(raw["id"])
+        if state is None:
+            state = states[raw["id"]] = GuardState(policy)
+        fields = {k: v for k, v in raw.items() if k not in ("id", "proposal")}
+        state.apply(GuardEvent(**fields))
+        if "proposal" in raw:
+            work.append((raw["proposal"], state.context(raw["now_ms"])))
+    decisions = [modulate(proposal, policy, context) for proposal, context in work]
+    return sum(final.allowed for final, _ in decisions)
+
+
+def streamed(n: int, keys: int, policy: GuardPolicy) -> int:
+    allowed = 0
+    for chunk in modulate_stream(raw_events(n, keys), policy, lambda e: e["id"]):
+        allowed += sum(final.allowed for _, _, final, _ in chunk)
+    return allowed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--events", type=int, default=200_000)
+    parser.add_argument("-k", "--keys", type=int, default=1000)
+    args = parser.parse_args()
+
+    policy = GuardPolicy(rate_limit_events_max=1000)
+    results = {}
+    for name, run in (("materialized", materialized), ("modulate_stream", streamed)):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        results[name] = run(args.events, args.keys, policy)
+        seconds = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:16s} {args.events / seconds:12,.0f} events/s  "
+            f"peak {peak / 2**20:8.1f} MiB  allowed {results[name]}"
+        )
+    assert len(set(results.values())) == 1
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC benchmark suite: modulator latency per guard outcome, batch throughput, memory.
+
+    python -m benchmarks --json run.json
+    python -m benchmarks --sizes 1000,100000 --compare previous.json
+
+Results are written as JSON (one record per case) so runs can be diffed across releases.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from decision_schema.types import Action, Proposal
+
+import dmc_core
+from dmc_core.dmc.compiled import compile_policy
+from dmc_core.dmc.guards_generic import GUARD_ORDER
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+PASS_CONTEXT = {
+    "now_ms": 5000,
+    "last_event_ts_ms": 4000,
+    "errors_in_window": 0,
+    "steps_in_window": 100,
+    "rate_limit_events": 0,
+    "recent_failures": 0,
+}
+
+# One context per failure position in GUARD_ORDER, plus the exception path.
+CASES: dict[str, dict] = {
+    "pass": PASS_CONTEXT,
+    "ops_health": dict(PASS_CONTEXT, ops_deny_actions=True),
+    "staleness": dict(PASS_CONTEXT, last_event_ts_ms=-100_000),
+    "error_rate": dict(PASS_CONTEXT, errors_in_window=50),
+    "rate_limit": dict(PASS_CONTEXT, rate_limit_events=50),
+    "circuit_breaker": dict(PASS_CONTEXT, recent_failures=50),
+    "cooldown": dict(PASS_CONTEXT, cooldown_until_ms=10_000),
+    "exception": dict(PASS_CONTEXT, last_event_ts_ms="not_an_int"),
+}
+assert [k for k in CASES if k in GUARD_ORDER] == list(GUARD_ORDER)
+
+DEFAULT_SIZES = (1_000, 100_000, 10_000_000)
+
+
+def _time_per_call(fn: Callable[[], object], number: int, repeat: int) -> dict:
+    """Best-of-repeat mean ns/call, plus p50/p99 of individually timed calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter_ns() - t0) / number)
+    samples = []
+    clock = time.perf_counter_ns
+    for _ in range(min(number, 20_000)):
+        t0 = clock()
+        fn()
+        samples.append(clock() - t0)
+    samples.sort()
+    return {
+        "ns_per_call": round(best, 1),
+        "p50_ns": samples[len(samples) // 2],
+        "p99_ns": samples[int(len(samples) * 0.99)],
+    }
+
+
+def bench_latency(number: int, repeat: int) -> list[dict]:
+    proposal = Proposal(action=Action.ACT, confidence=0.8, reasons=["bench"])
+    policy = GuardPolicy()
+    compiled = compile_policy(policy)
+    compiled_low = compile_policy(policy, low_alloc=True)
+    variants = {
+        "modulate": lambda c: lambda: modulate(proposal, policy, c),
+        "modulate_low_alloc": lambda c: lambda: modulate(proposal, policy, c, low_alloc=True),
+        "compiled": lambda c: lambda: compiled(proposal, c),
+        "compiled_low_alloc": lambda c: lambda: compiled_low(proposal, c),
+    }
+    out = []
+    for case, context in CASES.items():
+        for variant, make in variants.items():
+            stats = _time_per_call(make(context), number, repeat)
+            out.append({"bench": "latency", "case": case, "variant": variant, **stats})
+    return out
+
+
+def bench_memory(number: int) -> list[dict]:
+    """Retained bytes per decision (results kept alive)."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8, reasons=["bench"])
+    policy = GuardPolicy()
+    out = []
+    for case in ("pass", "cooldown"):
+        context = CASES[case]
+        for variant, low_alloc in (("modulate", False), ("modulate_low_alloc", True)):
+            modulate(proposal, policy, context, low_alloc=low_alloc)
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            kept = [modulate(proposal, policy, context, low_alloc=low_alloc) for _ in range(number)]
+            used = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            del kept
+            out.append(
+                {
+                    "bench": "memory",
+                    "case": case,
+                    "variant": variant,
+                    "bytes_per_decision": round(used / number, 1),
+                }
+            )
+    return out
+
+
+def bench_batch(sizes: tuple[int, ...], repeat: int) -> list[dict]:
+    """modulate_batch throughput over random columns (requires numpy)."""
+    try:
+        import numpy as np
+
+        from dmc_core.dmc.batch import UNSET, modulate_batch
+    except ImportError:
+        return [{"bench": "batch", "skipped": "numpy not installed"}]
+
+    rng = np.random.default_rng(0)
+    policy = GuardPolicy()
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    out = []
+    for n in sizes:
+        now = np.full(n, 100_000, dtype=np.int64)
+        columns = {
+            "now_ms": now,
+            "last_event_ts_ms": now - rng.integers(0, 6000, n),
+            "ops_deny_actions": rng.random(n) < 0.01,
+            "ops_cooldown_until_ms": np.where(rng.random(n) < 0.01, now + 10, UNSET),
+            "errors_in_window": rng.integers(0, 12, n),
+            "steps_in_window": rng.integers(0, 100, n),
+            "rate_limit_events": rng.integers(0, 12, n),
+            "recent_failures": rng.integers(0, 6, n),
+            "cooldown_until_ms": np.where(rng.random(n) < 0.02, now + 10, UNSET),
+        }
+        proposals = [proposal] * n
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            result = modulate_batch(proposals, policy, columns)
+            best = min(best, time.perf_counter() - t0)
+        out.append(
+            {
+                "bench": "batch",
+                "case": "modulate_batch",
+                "items": n,
+                "seconds": round(best, 6),
+                "items_per_s": round(n / best),
+                "ns_per_item": round(best / n * 1e9, 2),
+                "pass_rate": round(float(result.allowed.mean()), 4),
+            }
+        )
+        del columns, proposals, result
+    return out
+
+
+def run(sizes: tuple[int, ...], number: int, repeat: int) -> dict:
+    logging.getLogger("dmc_core").setLevel(logging.ERROR)  # exception case logs per call
+    try:
+        import numpy as np
+
+        numpy_version = np.__version__
+    except ImportError:
+        numpy_version = None
+    results = bench_latency(number, repeat) + bench_memory(number) + bench_batch(sizes, repeat)
+    return {
+        "meta": {
+            "dmc_core": dmc_core.__version__,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "numpy": numpy_version,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+
+
+def _key(record: dict) -> tuple:
+    return (record["bench"], record.get("case"), record.get("variant"), record.get("items"))
+
+
+def _metric(record: dict) -> float | None:
+    for name in ("ns_per_call", "bytes_per_decision", "ns_per_item"):
+        if name in record:
+            return record[name]
+    return None
+
+
+def compare(current: dict, previous: dict) -> list[str]:
+    """Lines 'case: old -> new (ratio)' for records present in both runs (lower is better)."""
+    old = {_key(r): r for r in previous.get("results", [])}
+    lines = []
+    for record in current["results"]:
+        base = old.get(_key(record))
+        new_v, old_v = _metric(record), _metric(base) if base else None
+        if new_v is None or not old_v:
+            continue
+        label = "/".join(str(k) for k in _key(record) if k is not None)
+        lines.append(f"{label:50s} {old_v:>12} -> {new_v:>12}  x{new_v / old_v:5.2f}")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="previous JSON run to diff against")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="comma-separated batch sizes (10M needs ~1.5 GB RAM)",
+    )
+    parser.add_argument("-n", "--number", type=int, default=50_000, help="calls per repeat")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    sizes = tuple(int(s) for s in args.sizes.split(",") if s)
+    report = run(sizes, args.number, args.repeat)
+    for record in report["results"]:
+        print(json.dumps(record, sort_keys=True))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        print("\n".join(compare(report, previous)))
+
+
+if __name__ == "__main__":
+    main()
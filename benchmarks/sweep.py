@@ -0,0 +1,52 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Policy sweep throughput: P policies x N recorded contexts, 1 worker vs all cores."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.replay import _records
+from dmc_core.offline import ContextRecorder, random_policies, sweep
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--records", type=int, default=2_000_000)
+    parser.add_argument("-p", "--policies", type=int, default=200)
+    parser.add_argument("--chunk", type=int, default=1 << 20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    policies = random_policies(
+        args.policies,
+        staleness_ms=(500, 9000),
+        max_error_rate=(0.01, 0.3),
+        rate_limit_events_max=(2, 14),
+        circuit_breaker_failures=(1, 6),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "contexts.bin"
+        with ContextRecorder(path) as recorder:
+            for start in range(0, args.records, 1 << 20):
+                recorder.append_records(_records(min(1 << 20, args.records - start), rng))
+        for workers in sorted({1, os.cpu_count() or 1}):
+            t0 = time.perf_counter()
+            result = sweep(path, policies, chunk_size=args.chunk, workers=workers)
+            seconds = time.perf_counter() - t0
+            cells = result.records * len(policies)
+            print(
+                f"workers={workers:3d}  {len(policies)} x {result.records} in {seconds:6.2f} s "
+                f"({cells / seconds / 1e6:7.1f} M policy-contexts/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
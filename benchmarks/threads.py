@@ -0,0 +1,112 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""ThreadPoolModulator scaling: 1..N threads vs a sequential loop (keyed and stateless)."""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import random
+import time
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import GuardEvent, GuardState
+from dmc_core.dmc.threaded import ThreadPoolModulator, gil_enabled
+
+
+def _items(n: int, keys: int) -> list:
+    rng = random.Random(0)
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    return [
+        (
+            rng.randrange(keys),
+            proposal,
+            GuardEvent(now_ms=t, events=rng.randint(0, 2), steps=1, errors=rng.randint(0, 1)),
+        )
+        for t in range(n)
+    ]
+
+
+def _contexts(n: int) -> list[dict]:
+    rng = random.Random(1)
+    return [
+        {
+            "now_ms": 100_000,
+            "last_event_ts_ms": 100_000 - rng.randint(0, 8000),
+            "errors_in_window": rng.randint(0, 12),
+            "steps_in_window": rng.randint(1, 100),
+            "rate_limit_events": rng.randint(0, 14),
+        }
+        for _ in range(n)
+    ]
+
+
+def sequential_keyed(items: list, policy: GuardPolicy) -> list:
+    states: dict = {}
+    out = []
+    for key, proposal, event in items:
+        state = states.get(key)
+        if state is None:
+            state = states[key] = GuardState(policy)
+        state.apply(event)
+        out.append(state.modulate(proposal, event.now_ms))
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--items", type=int, default=200_000)
+    parser.add_argument("-k", "--keys", type=int, default=1000)
+    parser.add_argument("-t", "--max-threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    policy = GuardPolicy()
+    items = _items(args.items, args.keys)
+    contexts = _contexts(args.items)
+    proposals = [Proposal(action=Action.ACT, confidence=0.8)] * args.items
+    print(f"GIL enabled: {gil_enabled()}  cpus: {os.cpu_count()}")
+
+    def best(run) -> tuple[float, list]:
+        times = []
+        for _ in range(args.repeat):
+            gc.collect()
+            gc.disable()
+            t0 = time.perf_counter()
+            out = run()
+            times.append(time.perf_counter() - t0)
+            gc.enable()
+        return min(times), out
+
+    base_keyed, expected_keyed = best(lambda: sequential_keyed(items, policy))
+    base_many, expected_many = best(
+        lambda: [modulate(p, policy, c) for p, c in zip(proposals, contexts)]
+    )
+    print(
+        f"sequential  keyed {args.items / base_keyed:12,.0f}/s        "
+        f"stateless {args.items / base_many:12,.0f}/s"
+    )
+    for threads in range(1, args.max_threads + 1):
+        with ThreadPoolModulator(policy, threads) as pool:
+            many, got_many = best(lambda: pool.modulate_many(proposals, contexts))
+
+        def keyed_run(threads: int = threads) -> list:
+            # fresh keyed state per repeat: the batch starts again at t=0
+            with ThreadPoolModulator(policy, threads) as pool:
+                return pool.process(items)
+
+        keyed, got_keyed = best(keyed_run)
+        assert got_keyed == expected_keyed and got_many == expected_many
+        print(
+            f"{threads:3d} threads keyed {args.items / keyed:12,.0f}/s x{base_keyed / keyed:4.2f}  "
+            f"stateless {args.items / many:12,.0f}/s x{base_many / many:4.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Finding keys whose cooldown ended: scanning every key per tick vs TimerWheel.advance."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.timer_wheel import TimerWheel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-k", "--keys", type=int, default=200_000)
+    parser.add_argument("--tick-ms", type=int, default=10)
+    parser.add_argument("--scan-ticks", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    policy = GuardPolicy()
+    armed_at = {key: rng.randint(0, policy.cooldown_ms) for key in range(args.keys)}
+    horizon = 2 * policy.cooldown_ms
+    ticks = range(args.tick_ms, horizon + args.tick_ms, args.tick_ms)
+
+    wheel = TimerWheel(0)
+    t0 = time.perf_counter()
+    for key, now in armed_at.items():
+        wheel.arm_cooldown(key, now, policy)
+    arm = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fired = sum(len(wheel.advance(now)) for now in ticks)
+    wheel_s = time.perf_counter() - t0
+    assert fired == args.keys
+
+    until = {key: now + policy.cooldown_ms for key, now in armed_at.items()}
+    t0 = time.perf_counter()
+    for now in ticks[: args.scan_ticks]:
+        expired = [key for key, deadline in until.items() if deadline <= now]
+        for key in expired:
+            del until[key]
+    scan_tick = (time.perf_counter() - t0) / args.scan_ticks
+
+    print(f"{args.keys} keys, {len(ticks)} ticks of {args.tick_ms} ms")
+    print(f"arm_cooldown        {arm / args.keys * 1e9:8.0f} ns/key")
+    print(f"TimerWheel.advance  {wheel_s / len(ticks) * 1e6:8.1f} us/tick (all keys fired)")
+    speedup = scan_tick * len(ticks) / wheel_s
+    print(f"scan all keys       {scan_tick * 1e6:8.1f} us/tick  x{speedup:.0f}")
+
+
+if __name__ == "__main__":
+    main()
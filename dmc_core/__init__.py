@@ -5,4 +5,19 @@
 
 from dmc_core.version import __version__ as __version__
 
+# Subpackages are imported on first attribute access (PEP 562), e.g. dmc_core.dmc.
+_SUBPACKAGES = frozenset({"compat", "dmc", "journal", "metrics", "offline", "schema"})
+
 __all__ = ["__version__"]
+
+
+def __getattr__(name: str):
+    if name not in _SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return importlib.import_module(f"{__name__}.{name}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBPACKAGES)
@@ -3,9 +3,26 @@
 # SPDX-License-Identifier: MIT
 """Domain-free compatibility aliases. Use decision_schema.types for SSOT."""
 
-from decision_schema.types import FinalDecision, Proposal
-
-ProposalLike = Proposal
-DecisionLike = FinalDecision
+# Aliases resolve on first access (PEP 562); importing this module does not import
+# decision_schema.
+_ALIASES: dict[str, str] = {
+    "ProposalLike": "Proposal",
+    "DecisionLike": "FinalDecision",
+}
 
 __all__ = ["ProposalLike", "DecisionLike"]
+
+
+def __getattr__(name: str):
+    target = _ALIASES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from decision_schema import types
+
+    value = getattr(types, target)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_ALIASES))
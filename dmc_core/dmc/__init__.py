@@ -1,12 +1,76 @@
 # Decision Ecosystem — decision-modulation-core
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""DMC: Risk modulation (generic guards + modulator)."""
+"""
+DMC: Risk modulation (generic guards + modulator).
 
-from dmc_core.dmc.policy import GuardPolicy
+Only the hot path (policy, context, guards, modulator) is imported eagerly; the other
+names are loaded on first attribute access (PEP 562), so
+`from dmc_core.dmc import modulate` does not pay for asyncio, numpy or executors.
+"""
+
+from dmc_core.dmc.context import GuardContext
 from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
 
+# name -> defining module, imported on first access
+_LAZY: dict[str, str] = {
+    "AsyncModulator": "dmc_core.dmc.async_modulator",
+    "DecisionCache": "dmc_core.dmc.cache",
+    "GuardContextBatch": "dmc_core.dmc.batch",
+    "GuardEvent": "dmc_core.dmc.state",
+    "GuardRegistry": "dmc_core.dmc.registry",
+    "GuardSpec": "dmc_core.dmc.registry",
+    "GuardState": "dmc_core.dmc.state",
+    "KeyedModulator": "dmc_core.dmc.keyed",
+    "PolicyStore": "dmc_core.dmc.policy_store",
+    "ThreadPoolModulator": "dmc_core.dmc.threaded",
+    "TimerWheel": "dmc_core.dmc.timer_wheel",
+    "build_plan": "dmc_core.dmc.registry",
+    "compile_policy": "dmc_core.dmc.compiled",
+    "guard_cooccurrence": "dmc_core.dmc.batch",
+    "load_policy": "dmc_core.dmc.policy_store",
+    "modulate_all_guards": "dmc_core.dmc.diagnostic",
+    "modulate_batch": "dmc_core.dmc.batch",
+    "modulate_stream": "dmc_core.dmc.stream",
+    "next_change_ms": "dmc_core.dmc.horizon",
+}
+
+# The numpy-only names (GuardContextBatch, guard_cooccurrence, modulate_batch) resolve
+# on access but are left out, so `from dmc_core.dmc import *` works without numpy.
 __all__ = [
+    "AsyncModulator",
+    "DecisionCache",
+    "GuardContext",
+    "GuardEvent",
     "GuardPolicy",
+    "GuardRegistry",
+    "GuardSpec",
+    "GuardState",
+    "KeyedModulator",
+    "PolicyStore",
+    "ThreadPoolModulator",
+    "TimerWheel",
+    "build_plan",
+    "compile_policy",
+    "load_policy",
     "modulate",
+    "modulate_all_guards",
+    "modulate_stream",
+    "next_change_ms",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,96 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC async modulator: asyncio front-end that coalesces concurrent calls into micro-batches.
+
+Calls are queued until max_batch items are pending or max_wait_us has passed, then the
+whole batch is evaluated in one loop callback through the compiled pipeline and the
+futures are resolved in submission order.
+
+INVARIANT 4: A call that is not resolved within timeout_s returns fail-closed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from decision_schema.types import FinalDecision, MismatchInfo, Proposal
+
+from dmc_core.dmc.compiled import compile_policy
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.modulator import _fail_closed
+from dmc_core.dmc.policy import GuardPolicy
+
+
+class AsyncModulator:
+    """
+    await modulate(proposal, context) with micro-batching.
+
+    max_pending bounds queued + in-flight calls; further callers wait (backpressure).
+    timeout_s=None waits for the batch without limit. Use from one event loop.
+    """
+
+    def __init__(
+        self,
+        policy: GuardPolicy,
+        *,
+        max_batch: int = 256,
+        max_wait_us: int = 200,
+        max_pending: int = 10_000,
+        timeout_s: float | None = None,
+    ) -> None:
+        if max_batch <= 0 or max_pending <= 0 or max_wait_us < 0:
+            raise ValueError("max_batch and max_pending must be positive, max_wait_us >= 0")
+        self.policy = policy
+        self.max_batch = max_batch
+        self.max_wait_us = max_wait_us
+        self.timeout_s = timeout_s
+        self.batches = 0
+        self.items = 0
+        self._fn = compile_policy(policy)
+        self._slots = asyncio.Semaphore(max_pending)
+        self._pending: list[tuple[Proposal, dict | GuardContext, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def modulate(
+        self, proposal: Proposal, context: dict | GuardContext
+    ) -> tuple[FinalDecision, MismatchInfo]:
+        """Same result as modulate(proposal, policy, context), or fail-closed on timeout."""
+        await self._slots.acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending.append((proposal, context, future))
+            if len(self._pending) >= self.max_batch:
+                self.flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.max_wait_us / 1e6, self.flush)
+            if self.timeout_s is None:
+                return await future
+            try:
+                return await asyncio.wait_for(future, self.timeout_s)
+            except TimeoutError:
+                return _fail_closed(self.policy), MismatchInfo(
+                    flags=["modulate_timeout"],
+                    reason_codes=["TimeoutError"],
+                )
+        finally:
+            self._slots.release()
+
+    def flush(self) -> None:
+        """Evaluate all pending calls now (called automatically)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        fn = self._fn
+        count = 0
+        for proposal, context, future in pending:
+            if future.done():  # timed out / cancelled
+                continue
+            future.set_result(fn(proposal, context))
+            count += 1
+        if count:
+            self.batches += 1
+            self.items += count
@@ -0,0 +1,419 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC batch: apply generic guards over columnar contexts (NumPy). Domain-agnostic.
+
+Row i of the result equals modulate(proposals[i], policy, context_i) where context_i
+is row i of the columns. Requires numpy (optional extra: dmc-core[numpy]).
+
+INVARIANT 3: First failing guard is resolved in GUARD_ORDER (same as modulate).
+INVARIANT 4: On exception → every row fail-closed (allowed=False, modulate_exception).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, Mapping, Sequence
+
+import numpy as np
+from decision_schema.types import FinalDecision, MismatchInfo, Proposal
+
+from dmc_core.dmc.context import CONTEXT_KEYS, GuardContext
+from dmc_core.dmc.guards_generic import GUARD_ORDER, REASON_CODES, REASON_GUARD
+from dmc_core.dmc.modulator import _fail_closed, _override_decision
+from dmc_core.dmc.policy import GuardPolicy
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for None in optional timestamp columns (ops_cooldown_until_ms, cooldown_until_ms).
+# now_ms < UNSET is never true, so the guard passes exactly as with None.
+UNSET: int = int(np.iinfo(np.int64).min)
+
+# Values of BatchResult.guard besides an index into GUARD_ORDER.
+GUARD_PASS: int = -1
+GUARD_EXCEPTION: int = -2
+
+# Guard index (into GUARD_ORDER) for each reason id.
+_REASON_GUARD = np.array(REASON_GUARD, dtype=np.int8)
+
+# BatchResult.failed_bits of rows that failed closed on an exception (every guard set).
+ALL_GUARDS_FAILED: int = (1 << len(GUARD_ORDER)) - 1
+
+CONTEXT_COLUMNS: tuple[str, ...] = CONTEXT_KEYS
+
+_OPTIONAL_TS = ("ops_cooldown_until_ms", "cooldown_until_ms")
+
+
+class GuardContextBatch(Mapping[str, np.ndarray]):
+    """
+    Columnar (struct-of-arrays) storage for many GuardContexts.
+
+    A mapping of context key -> array, usable directly as modulate_batch columns.
+    Storage: int64/float64 numbers, bool ops_deny_actions, object ops_state, UNSET for
+    None timestamps; a missing last_event_ts_ms (GuardContext None) is stored as now_ms.
+    """
+
+    __slots__ = ("_columns", "size")
+
+    def __init__(self, columns: Mapping[str, np.ndarray]) -> None:
+        unknown = sorted(set(columns) - set(CONTEXT_KEYS))
+        if unknown:
+            raise KeyError(f"unknown context columns: {unknown}")
+        sizes = {len(v) for v in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"columns differ in length: {sorted(sizes)}")
+        self._columns = dict(columns)
+        self.size = sizes.pop() if sizes else 0
+
+    @classmethod
+    def from_contexts(cls, contexts: Sequence[GuardContext | Mapping]) -> GuardContextBatch:
+        """Pack GuardContexts (or context dicts, via GuardContext.from_dict) into columns."""
+        rows = [c if type(c) is GuardContext else GuardContext.from_dict(c) for c in contexts]
+        columns = {
+            "now_ms": np.array([r.now_ms for r in rows]),
+            "last_event_ts_ms": np.array(
+                [r.now_ms if r.last_event_ts_ms is None else r.last_event_ts_ms for r in rows]
+            ),
+            "ops_deny_actions": np.array([r.ops_deny_actions is True for r in rows], dtype=bool),
+            "ops_state": np.array([r.ops_state for r in rows], dtype=object),
+        }
+        for key in _OPTIONAL_TS:
+            columns[key] = np.array(
+                [UNSET if getattr(r, key) is None else getattr(r, key) for r in rows]
+            )
+        for key in ("errors_in_window", "steps_in_window", "rate_limit_events", "recent_failures"):
+            columns[key] = np.array([getattr(r, key) for r in rows])
+        return cls(columns)
+
+    def row(self, i: int) -> GuardContext:
+        """Row i as a GuardContext."""
+        values = {key: col[i].item() if key != "ops_state" else col[i] for key, col in self.items()}
+        for key in _OPTIONAL_TS:
+            if values.get(key) == UNSET:
+                values[key] = None
+        if "ops_deny_actions" in values and not values["ops_deny_actions"]:
+            values["ops_deny_actions"] = None
+        return GuardContext(**values)
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self._columns[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers (object column: pointers only)."""
+        return sum(col.nbytes for col in self._columns.values())
+
+
+class BatchResult:
+    """
+    Columnar outcome of modulate_batch.
+
+    allowed: bool array. guard: int8 index into GUARD_ORDER of the first failing guard
+    (GUARD_PASS / GUARD_EXCEPTION otherwise). reason: int8 index into REASON_CODES.
+    failed_bits (all_guards=True only, else None): uint8, bit g set when guard
+    GUARD_ORDER[g] fails for the row.
+    FinalDecision/MismatchInfo are only built by decision()/decisions().
+    """
+
+    __slots__ = ("_policy", "_proposals", "allowed", "exception", "failed_bits", "guard", "reason")
+
+    def __init__(
+        self,
+        allowed: np.ndarray,
+        guard: np.ndarray,
+        reason: np.ndarray,
+        proposals: Sequence[Proposal],
+        policy: GuardPolicy,
+        exception: str | None = None,
+        failed_bits: np.ndarray | None = None,
+    ) -> None:
+        self.allowed = allowed
+        self.guard = guard
+        self.reason = reason
+        self.exception = exception
+        self.failed_bits = failed_bits
+        self._proposals = proposals
+        self._policy = policy
+
+    def __len__(self) -> int:
+        return len(self.allowed)
+
+    def decision(self, i: int) -> tuple[FinalDecision, MismatchInfo]:
+        """Materialize row i exactly as modulate would return it."""
+        if self.exception is not None:
+            return _fail_closed(self._policy), MismatchInfo(
+                flags=["modulate_exception"],
+                reason_codes=[self.exception],
+            )
+        proposal = self._proposals[i]
+        g = int(self.guard[i])
+        if g == GUARD_PASS:
+            return (
+                FinalDecision(
+                    action=proposal.action,
+                    allowed=True,
+                    reasons=proposal.reasons or [],
+                ),
+                MismatchInfo(),
+            )
+        return _override_decision(
+            proposal,
+            self._policy,
+            [GUARD_ORDER[g]],
+            [REASON_CODES[int(self.reason[i])]],
+        )
+
+    def decisions(self) -> Iterator[tuple[FinalDecision, MismatchInfo]]:
+        """Materialize every row lazily, in order."""
+        for i in range(len(self)):
+            yield self.decision(i)
+
+
+def modulate_batch(
+    proposals: Sequence[Proposal],
+    policy: GuardPolicy,
+    columns: Mapping[str, object],
+    *,
+    adaptive: bool = False,
+    all_guards: bool = False,
+) -> BatchResult:
+    """
+    Apply guards to len(proposals) rows in one vectorized pass.
+
+    columns maps generic context keys (CONTEXT_COLUMNS) to arrays of length n or scalars
+    (broadcast). Missing columns take modulate's defaults; a numeric column given as None
+    fails the batch closed, as None for that key fails modulate closed. Optional
+    timestamps use UNSET (or None in an object array) for "not set"; ops_state compares
+    elementwise to "RED".
+
+    adaptive=True evaluates each guard only on rows no earlier guard has denied, and
+    compacts the working set whenever a guard denies at least ADAPTIVE_MIN_RESOLVED of
+    it. Same results; faster when early guards deny many rows or columns are costly
+    (object arrays), slower for pass-heavy batches of cheap numeric columns.
+
+    all_guards=True also sets BatchResult.failed_bits to every failing guard per row
+    (diagnostics, see guard_cooccurrence); decisions are unchanged. It cannot be
+    combined with adaptive, which skips guards on rows already denied.
+    """
+    if adaptive and all_guards:
+        raise ValueError("all_guards evaluates every guard on every row; drop adaptive")
+    n = len(proposals)
+    failed_bits = None
+    try:
+        if adaptive:
+            reason = _reason_ids_adaptive(policy, columns, n)
+        elif all_guards:
+            conditions = _conditions(policy, columns, n)
+            reason = _select_reason(conditions)
+            failed_bits = _failed_bits(conditions, n)
+        else:
+            reason = _reason_ids(policy, columns, n)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("DMC modulate_batch exception, fail-closed: %s", type(e).__name__)
+        return BatchResult(
+            allowed=np.zeros(n, dtype=bool),
+            guard=np.full(n, GUARD_EXCEPTION, dtype=np.int8),
+            reason=np.zeros(n, dtype=np.int8),
+            proposals=proposals,
+            policy=policy,
+            exception=type(e).__name__,
+            failed_bits=np.full(n, ALL_GUARDS_FAILED, dtype=np.uint8) if all_guards else None,
+        )
+    return BatchResult(
+        allowed=reason == 0,
+        guard=_REASON_GUARD[reason],
+        reason=reason,
+        proposals=proposals,
+        policy=policy,
+        failed_bits=failed_bits,
+    )
+
+
+def guard_cooccurrence(failed_bits: np.ndarray) -> np.ndarray:
+    """
+    (G, G) int64 counts, G = len(GUARD_ORDER): [i, j] = rows where guards i and j both
+    failed; the diagonal is the per-guard failure count. One bincount over the bits.
+    """
+    g = len(GUARD_ORDER)
+    per_value = np.bincount(np.asarray(failed_bits, dtype=np.int64), minlength=1 << g)
+    bits = (np.arange(1 << g)[:, None] >> np.arange(g)) & 1
+    weighted = bits * per_value[:, None]
+    return weighted.T @ bits
+
+
+def _reason_ids(policy: GuardPolicy, columns: Mapping[str, object], n: int) -> np.ndarray:
+    """Reason id (REASON_CODES index) of the first failing guard per row; 0 if all pass."""
+    return _select_reason(_conditions(policy, columns, n))
+
+
+def _select_reason(conditions: list[np.ndarray]) -> np.ndarray:
+    choices = list(range(1, len(conditions) + 1))
+    return np.select(conditions, choices, 0).astype(np.int8, copy=False)
+
+
+def _failed_bits(conditions: list[np.ndarray], n: int) -> np.ndarray:
+    """OR of each reason condition into the bit of its guard."""
+    out = np.zeros(n, dtype=np.uint8)
+    for rid, condition in enumerate(conditions, start=1):
+        out |= np.asarray(condition, dtype=np.uint8) << np.uint8(REASON_GUARD[rid])
+    return out
+
+
+def _conditions(policy: GuardPolicy, columns: Mapping[str, object], n: int) -> list[np.ndarray]:
+    """Boolean condition per reason id 1..8 (REASON_CODES order = GUARD_ORDER)."""
+    now = _num_column(columns, "now_ms", n, 0)
+    if "last_event_ts_ms" not in columns:
+        last = now
+    else:  # None is not a default here: it fails closed, as in modulate
+        last = _numeric(columns["last_event_ts_ms"], n, "last_event_ts_ms")
+
+    return [
+        # 1. ops_health
+        _true_column(columns.get("ops_deny_actions"), n),
+        _red_column(columns.get("ops_state"), n),
+        now < _optional_ts_column(columns.get("ops_cooldown_until_ms"), n),
+        # 2. staleness
+        (now - last) > policy.staleness_ms,
+        # 3. error_rate
+        _error_rate_high(columns, n, policy.max_error_rate),
+        # 4. rate_limit
+        _num_column(columns, "rate_limit_events", n, 0) > policy.rate_limit_events_max,
+        # 5. circuit_breaker
+        _num_column(columns, "recent_failures", n, 0) >= policy.circuit_breaker_failures,
+        # 6. cooldown
+        now < _optional_ts_column(columns.get("cooldown_until_ms"), n),
+    ]
+
+
+# Fraction of the working set a guard must deny before the remaining rows are compacted.
+ADAPTIVE_MIN_RESOLVED: float = 0.1
+
+
+class _ActiveRows:
+    """Context columns restricted to the rows still undecided (gathered lazily)."""
+
+    __slots__ = ("_cache", "columns", "index", "size")
+
+    def __init__(self, columns: Mapping[str, object], n: int) -> None:
+        self.columns = columns
+        self.index: np.ndarray | None = None  # None = all rows
+        self.size = n
+        self._cache: dict[str, object] = {}
+
+    def raw(self, key: str) -> object:
+        if key not in self._cache:
+            value = self.columns.get(key)
+            if self.index is not None and value is not None and np.ndim(value) > 0:
+                value = np.asarray(value)[self.index]
+            self._cache[key] = value
+        return self._cache[key]
+
+    def num(self, key: str, default: int) -> np.ndarray:
+        value = self.raw(key) if key in self.columns else default
+        return _numeric(value, self.size, key)
+
+    def keep(self, rows: np.ndarray) -> None:
+        """Restrict to rows (positions within the current set)."""
+        self.index = rows if self.index is None else self.index[rows]
+        self.size = len(self.index)
+        self._cache.clear()
+
+
+def _reason_ids_adaptive(policy: GuardPolicy, columns: Mapping[str, object], n: int) -> np.ndarray:
+    """Same as _reason_ids, evaluating each condition only on still-undecided rows."""
+
+    def now(v: _ActiveRows) -> np.ndarray:
+        return v.num("now_ms", 0)
+
+    def last(v: _ActiveRows) -> np.ndarray:
+        if "last_event_ts_ms" not in v.columns:
+            return now(v)
+        return _numeric(v.raw("last_event_ts_ms"), v.size, "last_event_ts_ms")
+
+    def error_rate_high(v: _ActiveRows) -> np.ndarray:
+        errors, steps = v.num("errors_in_window", 0), v.num("steps_in_window", 1)
+        has_steps = steps > 0
+        return has_steps & (errors / np.where(has_steps, steps, 1) > policy.max_error_rate)
+
+    conditions = (  # reason ids 1..8, in GUARD_ORDER
+        lambda v: _true_column(v.raw("ops_deny_actions"), v.size),
+        lambda v: _red_column(v.raw("ops_state"), v.size),
+        lambda v: now(v) < _optional_ts_column(v.raw("ops_cooldown_until_ms"), v.size),
+        lambda v: (now(v) - last(v)) > policy.staleness_ms,
+        error_rate_high,
+        lambda v: v.num("rate_limit_events", 0) > policy.rate_limit_events_max,
+        lambda v: v.num("recent_failures", 0) >= policy.circuit_breaker_failures,
+        lambda v: now(v) < _optional_ts_column(v.raw("cooldown_until_ms"), v.size),
+    )
+    reason = np.zeros(n, dtype=np.int8)
+    view = _ActiveRows(columns, n)
+    undecided: np.ndarray | None = None  # within the current set; None = all
+    for rid, condition in enumerate(conditions, start=1):
+        hit = np.asarray(condition(view), dtype=bool)
+        if undecided is not None:
+            hit = hit & undecided
+        rows = np.flatnonzero(hit)
+        if rows.size == 0:
+            continue
+        reason[rows if view.index is None else view.index[rows]] = rid
+        undecided = ~hit if undecided is None else undecided & ~hit
+        if rows.size >= ADAPTIVE_MIN_RESOLVED * view.size:
+            view.keep(np.flatnonzero(undecided))
+            undecided = None
+            if view.size == 0:
+                break
+    return reason
+
+
+def _error_rate_high(columns: Mapping[str, object], n: int, error_rate_max: float) -> np.ndarray:
+    errors = _num_column(columns, "errors_in_window", n, 0)
+    steps = _num_column(columns, "steps_in_window", n, 1)
+    has_steps = steps > 0
+    rate = errors / np.where(has_steps, steps, 1)
+    return has_steps & (rate > error_rate_max)
+
+
+def _num_column(columns: Mapping[str, object], key: str, n: int, default: int) -> np.ndarray:
+    # only a missing key takes the default: None raises in _numeric (fail-closed)
+    value = columns.get(key, default)
+    return _numeric(value, n, key)
+
+
+def _optional_ts_column(value: object, n: int) -> np.ndarray:
+    if value is None:
+        return np.full(n, UNSET, dtype=np.int64)
+    arr = np.asarray(value)
+    if arr.dtype == object:
+        arr = np.array([UNSET if v is None else v for v in arr.ravel()])
+    return _numeric(arr, n, "timestamp")
+
+
+def _numeric(value: object, n: int, key: str) -> np.ndarray:
+    arr = np.asarray(value)
+    if arr.dtype.kind not in "iuf":
+        raise TypeError(f"column {key!r} must be numeric, got dtype {arr.dtype}")
+    return np.broadcast_to(arr, (n,))
+
+
+def _true_column(value: object, n: int) -> np.ndarray:
+    """Elementwise `v is True` (modulate treats only True as deny)."""
+    if value is None:
+        return np.zeros(n, dtype=bool)
+    arr = np.asarray(value)
+    if arr.dtype != bool:
+        arr = np.fromiter((v is True for v in arr.ravel()), dtype=bool, count=arr.size)
+    return np.broadcast_to(arr, (n,))
+
+
+def _red_column(value: object, n: int) -> np.ndarray:
+    if value is None:
+        return np.zeros(n, dtype=bool)
+    arr = np.asarray(value)
+    return np.broadcast_to(arr == "RED", (n,))
@@ -0,0 +1,183 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC decision cache: memoize modulate for contexts that differ only in now_ms.
+
+Only three guard outcomes depend on now_ms: the ops cooldown (fails while
+now_ms < ops_cooldown_until_ms), staleness (fails once now_ms - last_event_ts_ms >
+staleness_ms) and the cooldown (fails while now_ms < cooldown_until_ms). A result
+computed at t0 therefore stays valid for t0 <= now_ms < expires_ms, where expires_ms is
+horizon.next_change_ms for that context and result. Entries are keyed by the
+proposal's action and reasons plus every other context field (value and type), and
+evicted least-recently-used.
+
+INVARIANT 3/4: Results are exactly modulate's; exceptions are never cached.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from decision_schema.types import FinalDecision, MismatchInfo, Proposal
+
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.horizon import _next_change, first_failed_index
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+DEFAULT_MAXSIZE = 1 << 16
+
+# Context fields that identify a cache entry (everything except now_ms).
+_KEY_FIELDS: tuple[str, ...] = (
+    "last_event_ts_ms",
+    "ops_deny_actions",
+    "ops_state",
+    "ops_cooldown_until_ms",
+    "errors_in_window",
+    "steps_in_window",
+    "rate_limit_events",
+    "recent_failures",
+    "cooldown_until_ms",
+)
+_MISSING = object()  # key absent from a dict context
+_UNCACHEABLE = object()
+_typed_values = operator.attrgetter(*_KEY_FIELDS)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters since construction (or clear()). expired lookups are counted as misses."""
+
+    hits: int
+    misses: int
+    expired: int
+    evictions: int
+    uncacheable: int
+    size: int
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class DecisionCache:
+    """
+    modulate(proposal, context) with results memoized until their validity horizon.
+
+    Results equal modulate(proposal, policy, context) and are shared between hits:
+    treat them as read-only (as with low_alloc). The policy is read on misses only;
+    call clear() after mutating it. Not thread-safe: use one cache per thread (or per
+    KeyedModulator shard). Hits bypass modulate, so the instrumentation recorder only
+    sees misses. Horizons are in integer milliseconds: contexts whose now_ms is not an
+    int (or that are unhashable) are passed straight to modulate.
+    """
+
+    def __init__(self, policy: GuardPolicy, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.policy = policy
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+        self._uncacheable = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self._reset_counters()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            expired=self._expired,
+            evictions=self._evictions,
+            uncacheable=self._uncacheable,
+            size=len(self._entries),
+        )
+
+    def modulate(
+        self, proposal: Proposal, context: dict | GuardContext
+    ) -> tuple[FinalDecision, MismatchInfo]:
+        """Cached modulate(proposal, self.policy, context)."""
+        try:
+            if type(context) is GuardContext:
+                now_ms = context.now_ms
+                values = _typed_values(context)
+            else:
+                get = context.get
+                now_ms = get("now_ms", 0)
+                values = (  # _KEY_FIELDS, unrolled
+                    get("last_event_ts_ms", _MISSING),
+                    get("ops_deny_actions", _MISSING),
+                    get("ops_state", _MISSING),
+                    get("ops_cooldown_until_ms", _MISSING),
+                    get("errors_in_window", _MISSING),
+                    get("steps_in_window", _MISSING),
+                    get("rate_limit_events", _MISSING),
+                    get("recent_failures", _MISSING),
+                    get("cooldown_until_ms", _MISSING),
+                )
+            reasons = proposal.reasons
+            # types are part of the key: True == 1 == 1.0, but modulate tells them apart
+            types = tuple(map(type, values))
+            key = (proposal.action, tuple(reasons) if reasons else (), values, types)
+            entry = self._entries.get(key) if type(now_ms) is int else _UNCACHEABLE
+        except Exception:  # noqa: BLE001
+            # unhashable values, odd contexts: modulate decides (fail-closed)
+            entry = _UNCACHEABLE
+        if entry is _UNCACHEABLE:
+            self._uncacheable += 1
+            return modulate(proposal, self.policy, context)
+
+        if entry is not None:
+            valid_from, expires_ms, result = entry
+            try:
+                if valid_from <= now_ms < expires_ms:
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    return result
+            except TypeError:
+                self._uncacheable += 1
+                return modulate(proposal, self.policy, context)
+            self._expired += 1
+
+        self._misses += 1
+        result = modulate(proposal, self.policy, context)
+        mismatch = result[1]
+        if mismatch.flags and mismatch.flags[0] == "modulate_exception":
+            return result
+        try:
+            expires_ms = _expires_ms(self.policy, now_ms, values, mismatch)
+        except Exception:  # noqa: BLE001
+            return result
+        entries = self._entries
+        entries[key] = (now_ms, expires_ms, result)
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self._evictions += 1
+        return result
+
+
+def _expires_ms(policy: GuardPolicy, now_ms: int, values: tuple, mismatch: MismatchInfo):
+    last, _, _, ops_until, _, _, _, _, until = (None if v is _MISSING else v for v in values)
+    return _next_change(
+        policy.staleness_ms, now_ms, last, ops_until, until, first_failed_index(mismatch)
+    )
@@ -0,0 +1,144 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC compiled pipeline: specialize the generic guards once per GuardPolicy.
+
+compile_policy(policy) returns fn(proposal, context) with the same results as
+modulate(proposal, policy, context), for dict and GuardContext contexts. Thresholds
+are bound at compile time, guards that can never fail (infinite threshold) are
+elided, and the guards run as one fused check function built by registry.build_plan
+(the six generic guards, plus any registered in a GuardRegistry).
+
+INVARIANT 3: Checks are emitted in GUARD_ORDER (registered guards by position).
+INVARIANT 4: On exception → fail-closed (same as modulate).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+
+from decision_schema.types import Action, FinalDecision, MismatchInfo, Proposal
+
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.guards_generic import REASON_CODES
+from dmc_core.dmc.modulator import (
+    _EMPTY_MISMATCH,
+    _EMPTY_REASONS,
+    _SHARED_MISMATCH,
+    _SharedMismatchInfo,
+)
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.registry import GuardRegistry, build_plan
+
+logger = logging.getLogger(__name__)
+
+ModulatorFn = Callable[[Proposal, dict | GuardContext], tuple[FinalDecision, MismatchInfo]]
+
+
+def compile_policy(
+    policy: GuardPolicy,
+    *,
+    low_alloc: bool = False,
+    registry: GuardRegistry | None = None,
+) -> ModulatorFn:
+    """
+    Build fn(proposal, context) -> (FinalDecision, MismatchInfo) for this policy.
+
+    Policy values are copied at compile time; recompile after mutating the policy.
+    A guard whose threshold is infinite (e.g. staleness_ms=math.inf) is elided: for int
+    context values it cannot fail, so only their types are checked; other values (None,
+    str, float inf, ...) run the full guard and fail or fail closed as in modulate.
+    low_alloc has the same meaning as in modulate (shared read-only MismatchInfo).
+    registry adds guards beyond the generic six (see registry.py); their thresholds are
+    read from `policy` attributes.
+    """
+    plan = build_plan(policy, registry)
+    check = plan.check
+    action = _fail_closed_action(policy)
+    flags = plan.flags
+    codes = plan.codes
+    _warn = logger.warning
+    if low_alloc:
+        # generic ids reuse modulate's shared instances; registered guards get their own
+        shared = tuple(
+            _SHARED_MISMATCH[i]
+            if i < len(REASON_CODES)
+            else _SharedMismatchInfo(flags=[flag], reason_codes=[code])
+            for i, (flag, code) in enumerate(zip(flags, codes))
+        )
+        return _low_alloc_fn(check, action, shared)
+
+    def modulate_compiled(
+        proposal: Proposal, context: dict | GuardContext
+    ) -> tuple[FinalDecision, MismatchInfo]:
+        try:
+            reason = check(context)
+            if not reason:
+                return (
+                    FinalDecision(
+                        action=proposal.action,
+                        allowed=True,
+                        reasons=proposal.reasons or [],
+                    ),
+                    MismatchInfo(),
+                )
+            reason_codes = [codes[reason]]
+            mi = MismatchInfo(flags=[flags[reason]], reason_codes=reason_codes)
+            return (
+                FinalDecision(action=action, allowed=False, reasons=reason_codes, mismatch=mi),
+                mi,
+            )
+        except Exception as e:  # noqa: BLE001
+            _warn("DMC modulate exception, fail-closed: %s", type(e).__name__)
+            return FinalDecision(allowed=False, action=action, reasons=["fail_closed"]), (
+                MismatchInfo(flags=["modulate_exception"], reason_codes=[type(e).__name__])
+            )
+
+    return modulate_compiled
+
+
+def _low_alloc_fn(
+    check: Callable[[dict | GuardContext], int],
+    action: Action,
+    shared: tuple[MismatchInfo | None, ...],
+) -> ModulatorFn:
+    _warn = logger.warning
+    empty_mismatch = _EMPTY_MISMATCH
+    empty_reasons = _EMPTY_REASONS
+
+    def modulate_compiled(
+        proposal: Proposal, context: dict | GuardContext
+    ) -> tuple[FinalDecision, MismatchInfo]:
+        try:
+            reason = check(context)
+            if not reason:
+                return (
+                    FinalDecision(
+                        action=proposal.action,
+                        allowed=True,
+                        reasons=proposal.reasons or empty_reasons,
+                    ),
+                    empty_mismatch,
+                )
+            mi = shared[reason]
+            return (
+                FinalDecision(action=action, allowed=False, reasons=mi.reason_codes, mismatch=mi),
+                mi,
+            )
+        except Exception as e:  # noqa: BLE001
+            _warn("DMC modulate exception, fail-closed: %s", type(e).__name__)
+            return FinalDecision(allowed=False, action=action, reasons=["fail_closed"]), (
+                MismatchInfo(flags=["modulate_exception"], reason_codes=[type(e).__name__])
+            )
+
+    return modulate_compiled
+
+
+def _fail_closed_action(policy: GuardPolicy) -> Action:
+    """INVARIANT 4: action in {HOLD, STOP}."""
+    action = policy.fail_closed_action
+    if action not in (Action.HOLD, Action.STOP):
+        action = Action.HOLD
+    return action
@@ -0,0 +1,90 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC typed context: slotted alternative to the generic context dict.
+
+modulate accepts either a dict or a GuardContext. Defaults are the same as the dict
+defaults in modulate; unknown keys are rejected by from_dict instead of being ignored.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+
+# Generic context keys (SSOT for dict, GuardContext and columnar contexts).
+CONTEXT_KEYS: tuple[str, ...] = (
+    "now_ms",
+    "last_event_ts_ms",
+    "ops_deny_actions",
+    "ops_state",
+    "ops_cooldown_until_ms",
+    "errors_in_window",
+    "steps_in_window",
+    "rate_limit_events",
+    "recent_failures",
+    "cooldown_until_ms",
+)
+
+# Keys that may be None (guard passes / default applies). last_event_ts_ms is not one:
+# modulate fails closed on None, only a missing key means "same as now_ms".
+OPTIONAL_KEYS: frozenset[str] = frozenset(
+    {
+        "ops_deny_actions",
+        "ops_state",
+        "ops_cooldown_until_ms",
+        "cooldown_until_ms",
+    }
+)
+
+
+@dataclass(slots=True)
+class GuardContext:
+    """
+    Generic guard context. last_event_ts_ms=None means the key is missing: "same as
+    now_ms" (never stale). from_dict does not map an explicit None to it.
+    """
+
+    now_ms: int = 0
+    last_event_ts_ms: int | None = None
+    ops_deny_actions: bool | None = None
+    ops_state: str | None = None
+    ops_cooldown_until_ms: int | None = None
+    errors_in_window: int = 0
+    steps_in_window: int = 1
+    rate_limit_events: int = 0
+    recent_failures: int = 0
+    cooldown_until_ms: int | None = None
+
+    @classmethod
+    def from_dict(cls, context: Mapping, strict: bool = True) -> GuardContext:
+        """
+        Build from a generic context dict.
+
+        strict=True raises KeyError on unknown keys (e.g. a misspelled
+        cooldown_until_ms). None for a non-optional key raises ValueError, because
+        modulate would fail closed on it rather than apply the default.
+        """
+        if strict:
+            unknown = sorted(k for k in context if k not in _FIELD_SET)
+            if unknown:
+                raise KeyError(f"unknown context keys: {unknown}")
+        values = {}
+        for key in CONTEXT_KEYS:
+            if key in context:
+                value = context[key]
+                if value is None and key not in OPTIONAL_KEYS:
+                    raise ValueError(f"context key {key!r} must not be None")
+                values[key] = value
+        return cls(**values)
+
+    def to_dict(self) -> dict:
+        """Generic context dict equivalent to this context."""
+        out = {f.name: getattr(self, f.name) for f in fields(self)}
+        if out["last_event_ts_ms"] is None:
+            del out["last_event_ts_ms"]
+        return out
+
+
+_FIELD_SET = frozenset(CONTEXT_KEYS)
@@ -0,0 +1,123 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC diagnostic mode: evaluate every guard, not just up to the first failure.
+
+modulate_all_guards returns modulate's (FinalDecision, MismatchInfo) unchanged plus
+failed_bits, an int with bit g set when guard GUARD_ORDER[g] fails. The decision is
+still decided by the first failing guard; later guards only contribute bits. A guard
+that raises counts as failed (and, if no earlier guard failed, the decision fails
+closed exactly as in modulate). The columnar variant is
+modulate_batch(..., all_guards=True) in batch.py.
+
+INVARIANT 3: Bit order and first-failure resolution follow GUARD_ORDER.
+INVARIANT 4: On exception → fail-closed (same as modulate).
+"""
+
+from __future__ import annotations
+
+import logging
+
+from decision_schema.types import FinalDecision, MismatchInfo, Proposal
+
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.guards_generic import (
+    GUARD_ORDER,
+    REASON_CODES,
+    circuit_breaker_guard,
+    cooldown_guard,
+    error_rate_guard,
+    ops_health_guard,
+    rate_limit_guard,
+    staleness_guard,
+)
+from dmc_core.dmc.modulator import _fail_closed, _override_decision
+from dmc_core.dmc.policy import GuardPolicy
+
+logger = logging.getLogger(__name__)
+
+# failed_bits with every guard set (context could not be read at all).
+ALL_GUARDS_FAILED: int = (1 << len(GUARD_ORDER)) - 1
+
+
+def failed_guard_names(failed_bits: int) -> tuple[str, ...]:
+    """Names of the guards set in failed_bits, in GUARD_ORDER."""
+    return tuple(name for g, name in enumerate(GUARD_ORDER) if failed_bits >> g & 1)
+
+
+def modulate_all_guards(
+    proposal: Proposal,
+    policy: GuardPolicy,
+    context: dict | GuardContext,
+) -> tuple[FinalDecision, MismatchInfo, int]:
+    """
+    Like modulate, but evaluate all guards; returns (FinalDecision, MismatchInfo,
+    failed_bits). FinalDecision and MismatchInfo equal modulate(proposal, policy, context).
+    """
+    try:
+        calls = _guard_calls(policy, context)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("DMC modulate exception, fail-closed: %s", type(e).__name__)
+        return (
+            _fail_closed(policy),
+            MismatchInfo(flags=["modulate_exception"], reason_codes=[type(e).__name__]),
+            ALL_GUARDS_FAILED,
+        )
+    failed_bits = 0
+    result = None
+    for g, (fn, args) in enumerate(calls):
+        try:
+            ok, code = fn(*args)
+        except Exception as e:  # noqa: BLE001
+            failed_bits |= 1 << g
+            if result is None:
+                logger.warning("DMC modulate exception, fail-closed: %s", type(e).__name__)
+                result = (
+                    _fail_closed(policy),
+                    MismatchInfo(
+                        flags=["modulate_exception"],
+                        reason_codes=[type(e).__name__],
+                    ),
+                )
+            continue
+        if not ok:
+            failed_bits |= 1 << g
+            if result is None:
+                result = _override_decision(
+                    proposal, policy, [GUARD_ORDER[g]], [REASON_CODES[code]]
+                )
+    if result is None:
+        result = (
+            FinalDecision(action=proposal.action, allowed=True, reasons=proposal.reasons or []),
+            MismatchInfo(),
+        )
+    return result[0], result[1], failed_bits
+
+
+def _guard_calls(policy: GuardPolicy, context: dict | GuardContext) -> tuple:
+    """(guard fn, args) per guard in GUARD_ORDER, read with modulate's defaults."""
+    if type(context) is GuardContext:
+        c = context
+        now_ms = c.now_ms
+        last = now_ms if c.last_event_ts_ms is None else c.last_event_ts_ms
+        ops = (c.ops_deny_actions, c.ops_state, c.ops_cooldown_until_ms)
+        errors, steps = c.errors_in_window, c.steps_in_window
+        rate_events, failures = c.rate_limit_events, c.recent_failures
+        cooldown_until = c.cooldown_until_ms
+    else:
+        get = context.get
+        now_ms = get("now_ms", 0)
+        last = get("last_event_ts_ms", now_ms)
+        ops = (get("ops_deny_actions"), get("ops_state"), get("ops_cooldown_until_ms"))
+        errors, steps = get("errors_in_window", 0), get("steps_in_window", 1)
+        rate_events, failures = get("rate_limit_events", 0), get("recent_failures", 0)
+        cooldown_until = get("cooldown_until_ms")
+    return (
+        (ops_health_guard, (*ops, now_ms)),
+        (staleness_guard, (last, now_ms, policy.staleness_ms)),
+        (error_rate_guard, (errors, steps, policy.max_error_rate)),
+        (rate_limit_guard, (rate_events, policy.rate_limit_events_max)),
+        (circuit_breaker_guard, (failures, policy.circuit_breaker_failures)),
+        (cooldown_guard, (cooldown_until, now_ms)),
+    )
@@ -1,16 +1,32 @@
 # Decision Ecosystem — decision-modulation-core
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""Generic DMC guards: pass/fail + reason code. Domain-agnostic."""
+"""Generic DMC guards: pass/fail + ReasonCode (see codes.py). Domain-agnostic."""
 
-from dmc_core.dmc.guards_generic.ops_health import ops_health_guard
-from dmc_core.dmc.guards_generic.staleness import staleness_guard
-from dmc_core.dmc.guards_generic.error_rate import error_rate_guard
-from dmc_core.dmc.guards_generic.rate_limit import rate_limit_guard
 from dmc_core.dmc.guards_generic.circuit_breaker import circuit_breaker_guard
+from dmc_core.dmc.guards_generic.codes import (
+    GUARD_ID,
+    GUARD_ORDER,
+    REASON_CODES,
+    REASON_GUARD,
+    REASON_ID,
+    GuardId,
+    ReasonCode,
+)
 from dmc_core.dmc.guards_generic.cooldown import cooldown_guard
+from dmc_core.dmc.guards_generic.error_rate import error_rate_guard
+from dmc_core.dmc.guards_generic.ops_health import ops_health_guard
+from dmc_core.dmc.guards_generic.rate_limit import rate_limit_guard
+from dmc_core.dmc.guards_generic.staleness import staleness_guard
 
 __all__ = [
+    "GUARD_ID",
+    "GUARD_ORDER",
+    "REASON_CODES",
+    "REASON_GUARD",
+    "REASON_ID",
+    "GuardId",
+    "ReasonCode",
     "ops_health_guard",
     "staleness_guard",
     "error_rate_guard",
@@ -18,13 +34,3 @@ __all__ = [
     "circuit_breaker_guard",
     "cooldown_guard",
 ]
-
-# Fixed order for INVARIANT 3 (determinism). Do not reorder.
-GUARD_ORDER: tuple[str, ...] = (
-    "ops_health",
-    "staleness",
-    "error_rate",
-    "rate_limit",
-    "circuit_breaker",
-    "cooldown",
-)
@@ -3,12 +3,17 @@
 # SPDX-License-Identifier: MIT
 """Circuit-breaker guard: fail when recent failures >= threshold."""
 
+from dmc_core.dmc.guards_generic.codes import ReasonCode
+
+_PASS = (True, ReasonCode.NONE)
+_CIRCUIT_BREAKER = (False, ReasonCode.CIRCUIT_BREAKER)
+
 
 def circuit_breaker_guard(
     recent_failures: int,
     circuit_breaker_failures: int,
-) -> tuple[bool, str]:
+) -> tuple[bool, ReasonCode]:
     """Pass if recent_failures < circuit_breaker_failures."""
     if recent_failures >= circuit_breaker_failures:
-        return False, "circuit_breaker"
-    return True, ""
+        return _CIRCUIT_BREAKER
+    return _PASS
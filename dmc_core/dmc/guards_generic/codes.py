@@ -0,0 +1,87 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+Integer guard and reason ids. Guards return ReasonCode members; the strings of the
+decision_schema contract (MismatchInfo.flags / reason_codes, FinalDecision.reasons)
+are looked up from GUARD_ORDER / REASON_CODES only when a decision is built.
+
+Each guard returns module-level (ok, ReasonCode) tuples, so evaluating a guard allocates
+nothing and does no enum attribute lookup.
+"""
+
+from enum import IntEnum
+
+# Fixed order for INVARIANT 3 (determinism). Do not reorder.
+GUARD_ORDER: tuple[str, ...] = (
+    "ops_health",
+    "staleness",
+    "error_rate",
+    "rate_limit",
+    "circuit_breaker",
+    "cooldown",
+)
+
+# Reason codes emitted by the guards, grouped in GUARD_ORDER (index 0 = no failure).
+# Batch/compiled paths carry the index; REASON_GUARD maps it to a GUARD_ORDER index.
+REASON_CODES: tuple[str, ...] = (
+    "",
+    "ops_deny_actions",
+    "ops_health_red",
+    "ops_cooldown_active",
+    "staleness_exceeded",
+    "error_rate_high",
+    "rate_limit_exceeded",
+    "circuit_breaker",
+    "cooldown_active",
+)
+REASON_GUARD: tuple[int, ...] = (-1, 0, 0, 0, 1, 2, 3, 4, 5)
+
+
+class GuardId(IntEnum):
+    """Index into GUARD_ORDER."""
+
+    OPS_HEALTH = 0
+    STALENESS = 1
+    ERROR_RATE = 2
+    RATE_LIMIT = 3
+    CIRCUIT_BREAKER = 4
+    COOLDOWN = 5
+
+    @property
+    def flag(self) -> str:
+        """GUARD_ORDER name (MismatchInfo.flags)."""
+        return GUARD_ORDER[self]
+
+
+class ReasonCode(IntEnum):
+    """Index into REASON_CODES; NONE (0, falsy) = guard passed."""
+
+    NONE = 0
+    OPS_DENY_ACTIONS = 1
+    OPS_HEALTH_RED = 2
+    OPS_COOLDOWN_ACTIVE = 3
+    STALENESS_EXCEEDED = 4
+    ERROR_RATE_HIGH = 5
+    RATE_LIMIT_EXCEEDED = 6
+    CIRCUIT_BREAKER = 7
+    COOLDOWN_ACTIVE = 8
+
+    @property
+    def code(self) -> str:
+        """REASON_CODES string (MismatchInfo.reason_codes)."""
+        return REASON_CODES[self]
+
+    @property
+    def guard(self) -> GuardId | None:
+        """Guard that emits this code (None for NONE)."""
+        g = REASON_GUARD[self]
+        return GuardId(g) if g >= 0 else None
+
+
+# Inbound translation of schema strings (e.g. a recorded MismatchInfo) to ids.
+GUARD_ID: dict[str, GuardId] = {g.flag: g for g in GuardId}
+REASON_ID: dict[str, ReasonCode] = {r.code: r for r in ReasonCode if r}
+
+assert tuple(g.name.lower() for g in GuardId) == GUARD_ORDER
+assert tuple(r.name.lower() for r in ReasonCode)[1:] == REASON_CODES[1:]
@@ -3,12 +3,17 @@
 # SPDX-License-Identifier: MIT
 """Cooldown guard: fail when now_ms < cooldown_until_ms."""
 
+from dmc_core.dmc.guards_generic.codes import ReasonCode
+
+_PASS = (True, ReasonCode.NONE)
+_COOLDOWN_ACTIVE = (False, ReasonCode.COOLDOWN_ACTIVE)
+
 
 def cooldown_guard(
     cooldown_until_ms: int | None,
     now_ms: int,
-) -> tuple[bool, str]:
+) -> tuple[bool, ReasonCode]:
     """Pass if cooldown_until_ms is None or now_ms >= cooldown_until_ms."""
     if cooldown_until_ms is not None and now_ms < cooldown_until_ms:
-        return False, "cooldown_active"
-    return True, ""
+        return _COOLDOWN_ACTIVE
+    return _PASS
@@ -3,16 +3,21 @@
 # SPDX-License-Identifier: MIT
 """Error-rate guard: fail when errors/steps exceeds threshold."""
 
+from dmc_core.dmc.guards_generic.codes import ReasonCode
+
+_PASS = (True, ReasonCode.NONE)
+_ERROR_RATE_HIGH = (False, ReasonCode.ERROR_RATE_HIGH)
+
 
 def error_rate_guard(
     errors_in_window: int,
     steps_in_window: int,
     error_rate_max: float,
-) -> tuple[bool, str]:
+) -> tuple[bool, ReasonCode]:
     """Pass if steps_in_window <= 0 or errors_in_window/steps_in_window <= error_rate_max."""
     if steps_in_window <= 0:
-        return True, ""
+        return _PASS
     rate = errors_in_window / steps_in_window
     if rate > error_rate_max:
-        return False, "error_rate_high"
-    return True, ""
+        return _ERROR_RATE_HIGH
+    return _PASS
@@ -3,21 +3,28 @@
 # SPDX-License-Identifier: MIT
 """Ops-health guard: deny when ops layer denies or is in cooldown."""
 
+from dmc_core.dmc.guards_generic.codes import ReasonCode
+
+_PASS = (True, ReasonCode.NONE)
+_OPS_DENY_ACTIONS = (False, ReasonCode.OPS_DENY_ACTIONS)
+_OPS_HEALTH_RED = (False, ReasonCode.OPS_HEALTH_RED)
+_OPS_COOLDOWN_ACTIVE = (False, ReasonCode.OPS_COOLDOWN_ACTIVE)
+
 
 def ops_health_guard(
     ops_deny_actions: bool | None,
     ops_state: str | None,
     ops_cooldown_until_ms: int | None,
     now_ms: int,
-) -> tuple[bool, str]:
+) -> tuple[bool, ReasonCode]:
     """
     Pass if ops-health allows actions.
     Context keys: ops_deny_actions, ops_state, ops_cooldown_until_ms, now_ms.
     """
     if ops_deny_actions is True:
-        return False, "ops_deny_actions"
+        return _OPS_DENY_ACTIONS
     if ops_state == "RED":
-        return False, "ops_health_red"
+        return _OPS_HEALTH_RED
     if ops_cooldown_until_ms is not None and now_ms < ops_cooldown_until_ms:
-        return False, "ops_cooldown_active"
-    return True, ""
+        return _OPS_COOLDOWN_ACTIVE
+    return _PASS
@@ -3,12 +3,17 @@
 # SPDX-License-Identifier: MIT
 """Rate-limit guard: fail when events in window exceed limit."""
 
+from dmc_core.dmc.guards_generic.codes import ReasonCode
+
+_PASS = (True, ReasonCode.NONE)
+_RATE_LIMIT_EXCEEDED = (False, ReasonCode.RATE_LIMIT_EXCEEDED)
+
 
 def rate_limit_guard(
     events_in_window: int,
     events_max: int,
-) -> tuple[bool, str]:
+) -> tuple[bool, ReasonCode]:
     """Pass if events_in_window <= events_max."""
     if events_in_window > events_max:
-        return False, "rate_limit_exceeded"
-    return True, ""
+        return _RATE_LIMIT_EXCEEDED
+    return _PASS
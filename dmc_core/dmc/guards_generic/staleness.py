@@ -3,13 +3,18 @@
 # SPDX-License-Identifier: MIT
 """Staleness guard: fail when last event is too old."""
 
+from dmc_core.dmc.guards_generic.codes import ReasonCode
+
+_PASS = (True, ReasonCode.NONE)
+_STALENESS_EXCEEDED = (False, ReasonCode.STALENESS_EXCEEDED)
+
 
 def staleness_guard(
     last_event_ts_ms: int,
     now_ms: int,
     staleness_ms: int,
-) -> tuple[bool, str]:
+) -> tuple[bool, ReasonCode]:
     """Pass if (now_ms - last_event_ts_ms) <= staleness_ms."""
     if now_ms - last_event_ts_ms > staleness_ms:
-        return False, "staleness_exceeded"
-    return True, ""
+        return _STALENESS_EXCEEDED
+    return _PASS
@@ -0,0 +1,97 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC decision horizon: the earliest now_ms at which modulate's result can change.
+
+With every other context field fixed, only three guards depend on now_ms:
+  ops_health  fails while now_ms < ops_cooldown_until_ms   -> changes at the deadline
+  staleness   fails once now_ms - last_event_ts_ms > staleness_ms
+  cooldown    fails while now_ms < cooldown_until_ms       -> changes at the deadline
+next_change_ms returns the first such boundary after the context's now_ms, so a
+scheduler can sleep until then instead of polling. Timestamps are integer
+milliseconds; GuardState.next_change_ms adds the expiry of its window counts.
+
+INVARIANT 3: With a MismatchInfo, guards after the first failing one (GUARD_ORDER)
+are ignored: they cannot change the decision while it stands.
+"""
+
+from __future__ import annotations
+
+import math
+
+from decision_schema.types import MismatchInfo
+
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.guards_generic import GUARD_ORDER
+from dmc_core.dmc.policy import GuardPolicy
+
+NEVER: float = math.inf
+
+# GUARD_ORDER index per guard name; len(GUARD_ORDER) = all guards passed.
+GUARD_INDEX: dict[str, int] = {name: g for g, name in enumerate(GUARD_ORDER)}
+_STALENESS = GUARD_INDEX["staleness"]
+_COOLDOWN = GUARD_INDEX["cooldown"]
+_ALL = len(GUARD_ORDER)
+
+
+def first_failed_index(mismatch: MismatchInfo | None) -> int:
+    """GUARD_ORDER index of the guard that decided `mismatch` (len(GUARD_ORDER) if passed).
+
+    None or a fail-closed exception count as "unknown": every guard is relevant.
+    """
+    if mismatch is None:
+        return _ALL
+    flags = mismatch.flags
+    if not flags:
+        return _ALL
+    return GUARD_INDEX.get(flags[0], _ALL)
+
+
+def next_change_ms(
+    policy: GuardPolicy,
+    context: dict | GuardContext,
+    mismatch: MismatchInfo | None = None,
+) -> int | float:
+    """
+    Earliest now_ms > context now_ms at which modulate(proposal, policy, context) with
+    only now_ms advanced can return a different result; NEVER (math.inf) if none.
+
+    Pass the MismatchInfo modulate returned for this context to ignore guards after the
+    first failing one. Raises TypeError for non-numeric timestamps (modulate would fail
+    closed on them).
+    """
+    if type(context) is GuardContext:
+        now_ms = context.now_ms
+        last = context.last_event_ts_ms
+        ops_until = context.ops_cooldown_until_ms
+        until = context.cooldown_until_ms
+    else:
+        get = context.get
+        now_ms = get("now_ms", 0)
+        last = get("last_event_ts_ms")
+        ops_until = get("ops_cooldown_until_ms")
+        until = get("cooldown_until_ms")
+    return _next_change(
+        policy.staleness_ms, now_ms, last, ops_until, until, first_failed_index(mismatch)
+    )
+
+
+def _next_change(
+    staleness_ms: float,
+    now_ms: int,
+    last_event_ts_ms: int | None,
+    ops_cooldown_until_ms: int | None,
+    cooldown_until_ms: int | None,
+    first: int,
+) -> int | float:
+    horizon: int | float = NEVER
+    if ops_cooldown_until_ms is not None and now_ms < ops_cooldown_until_ms:
+        horizon = ops_cooldown_until_ms
+    if first >= _STALENESS and last_event_ts_ms is not None and staleness_ms != math.inf:
+        boundary = last_event_ts_ms + staleness_ms
+        if now_ms <= boundary:  # still fresh; stale from the first ms after boundary
+            horizon = min(horizon, math.floor(boundary) + 1)
+    if first >= _COOLDOWN and cooldown_until_ms is not None and now_ms < cooldown_until_ms:
+        horizon = min(horizon, cooldown_until_ms)
+    return horizon
@@ -0,0 +1,155 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC keyed modulator: per-key GuardState, keys partitioned into shards by a stable hash.
+
+A batch of (key, proposal, event) items is split by shard; each shard runs on one
+worker (thread or process) and processes its items in input order, so every key
+sees its events and decisions in submission order (INVARIANT 3).
+
+INVARIANT 4: An item whose event cannot be applied or decided fails closed; the
+other items are unaffected (GuardState.apply rejects a bad event before recording
+any of it). Workers get copies of the shard states (process workers: pickled ones),
+merged back only once every shard of the batch has finished, so a failed worker
+leaves all key states unchanged, whatever the executor.
+"""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from collections.abc import Hashable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from decision_schema.types import FinalDecision, MismatchInfo, Proposal
+
+from dmc_core.dmc.modulator import _fail_closed
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import DEFAULT_BUCKETS, GuardEvent, GuardState
+
+logger = logging.getLogger(__name__)
+
+KeyedItem = tuple[Hashable, Proposal, GuardEvent]
+
+
+def shard_of(key: Hashable, shards: int) -> int:
+    """Stable shard index (same in every process; unlike hash() for str)."""
+    return zlib.crc32(repr(key).encode("utf-8")) % shards
+
+
+class KeyedModulator:
+    """
+    Guard state for many independent keys.
+
+    Keys must have a stable repr (str, int, tuples of those). process() is not
+    reentrant: call it from one thread at a time; parallelism is inside it.
+    """
+
+    def __init__(
+        self,
+        policy: GuardPolicy,
+        shards: int = 16,
+        buckets: int = DEFAULT_BUCKETS,
+    ) -> None:
+        if shards <= 0:
+            raise ValueError("shards must be positive")
+        self.policy = policy
+        self.buckets = buckets
+        self._shards: list[dict[Hashable, GuardState]] = [{} for _ in range(shards)]
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._shards)
+
+    def state(self, key: Hashable) -> GuardState:
+        """GuardState for key (created on first use)."""
+        shard = self._shards[shard_of(key, len(self._shards))]
+        state = shard.get(key)
+        if state is None:
+            state = shard[key] = GuardState(self.policy, self.buckets)
+        return state
+
+    def modulate(
+        self, key: Hashable, proposal: Proposal, event: GuardEvent
+    ) -> tuple[FinalDecision, MismatchInfo]:
+        """Apply event to key's state, then modulate proposal at event.now_ms."""
+        return _decide(self.state(key), proposal, event)
+
+    def process(
+        self,
+        items: Iterable[KeyedItem],
+        executor: Executor | None = None,
+    ) -> list[tuple[FinalDecision, MismatchInfo]]:
+        """
+        Process items; results are returned in input order.
+
+        executor=None runs inline. With a ThreadPoolExecutor or ProcessPoolExecutor
+        each non-empty shard is one submission; for processes only the states of keys
+        in the batch are shipped to the worker and the updated states are merged back.
+        """
+        n_shards = len(self._shards)
+        by_shard: list[list[tuple[int, Hashable, Proposal, GuardEvent]]] = [
+            [] for _ in range(n_shards)
+        ]
+        count = 0
+        for i, (key, proposal, event) in enumerate(items):
+            by_shard[shard_of(key, n_shards)].append((i, key, proposal, event))
+            count = i + 1
+
+        results: list = [None] * count
+        jobs = []
+        for shard_index, shard_items in enumerate(by_shard):
+            if not shard_items:
+                continue
+            shard = self._shards[shard_index]
+            states = {key: shard[key] for _, key, _, _ in shard_items if key in shard}
+            if not isinstance(executor, ProcessPoolExecutor):  # pickling copies already
+                states = {key: state.copy() for key, state in states.items()}
+            if executor is None:
+                out = _run_shard(self.policy, self.buckets, states, shard_items)
+                jobs.append((shard_index, out))
+            else:
+                future = executor.submit(_run_shard, self.policy, self.buckets, states, shard_items)
+                jobs.append((shard_index, future))
+
+        # workers updated copies; collect every shard before merging them, so a failed
+        # worker leaves all states unchanged
+        done = [(i, job if executor is None else job.result()) for i, job in jobs]
+        for shard_index, (states, shard_results) in done:
+            shard = self._shards[shard_index]
+            for key, state in states.items():
+                state.policy = self.policy
+                shard[key] = state
+            for i, decision in shard_results:
+                results[i] = decision
+        return results
+
+
+def _run_shard(
+    policy: GuardPolicy,
+    buckets: int,
+    states: dict[Hashable, GuardState],
+    items: list[tuple[int, Hashable, Proposal, GuardEvent]],
+) -> tuple[dict[Hashable, GuardState], list[tuple[int, tuple[FinalDecision, MismatchInfo]]]]:
+    """Worker: process one shard's items in order. Module-level so it pickles."""
+    out = []
+    for i, key, proposal, event in items:
+        state = states.get(key)
+        if state is None:
+            state = states[key] = GuardState(policy, buckets)
+        out.append((i, _decide(state, proposal, event)))
+    return states, out
+
+
+def _decide(
+    state: GuardState, proposal: Proposal, event: GuardEvent
+) -> tuple[FinalDecision, MismatchInfo]:
+    """Apply event, then modulate; an exception fails this item closed (INVARIANT 4)."""
+    try:
+        state.apply(event)
+        return state.modulate(proposal, event.now_ms)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("DMC keyed modulate exception, fail-closed: %s", type(e).__name__)
+        return _fail_closed(state.policy), MismatchInfo(
+            flags=["modulate_exception"], reason_codes=[type(e).__name__]
+        )
@@ -10,27 +10,106 @@ INVARIANT 4: On exception → fail-closed (allowed=False, action=policy.fail_clo
 
 from __future__ import annotations
 
+import dataclasses
 import logging
+import time
 
 from decision_schema.types import Action, FinalDecision, MismatchInfo, Proposal
 
-from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.context import GuardContext
 from dmc_core.dmc.guards_generic import (
-    ops_health_guard,
-    staleness_guard,
-    error_rate_guard,
-    rate_limit_guard,
+    GUARD_ORDER,
+    REASON_CODES,
+    REASON_GUARD,
+    ReasonCode,
     circuit_breaker_guard,
     cooldown_guard,
+    error_rate_guard,
+    ops_health_guard,
+    rate_limit_guard,
+    staleness_guard,
 )
+from dmc_core.dmc.policy import GuardPolicy
 
 logger = logging.getLogger(__name__)
 
 
+class _ReadOnlyList(list):
+    """list shared between low_alloc results: equal to a list, mutation raises TypeError."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("shared low_alloc result is read-only; copy it with list()")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __reduce__(self):
+        return (_ReadOnlyList, (list(self),))
+
+
+class _SharedMismatchInfo(MismatchInfo):
+    """
+    MismatchInfo shared between low_alloc results: read-only lists, attributes cannot
+    be set, and it compares equal to a MismatchInfo with the same fields.
+    """
+
+    def __init__(self, flags=(), reason_codes=(), **kwargs) -> None:
+        super().__init__(
+            flags=_ReadOnlyList(flags), reason_codes=_ReadOnlyList(reason_codes), **kwargs
+        )
+        object.__setattr__(self, "_sealed", True)
+
+    def __setattr__(self, name, value) -> None:
+        if getattr(self, "_sealed", False):
+            raise AttributeError("shared low_alloc MismatchInfo is read-only")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError("shared low_alloc MismatchInfo is read-only")
+
+    def __eq__(self, other):
+        if not isinstance(other, MismatchInfo):
+            return NotImplemented
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in _MISMATCH_FIELDS)
+
+    __hash__ = None
+
+
+_MISMATCH_FIELDS = dataclasses.fields(MismatchInfo)
+
+# Shared read-only results for low_alloc mode: one empty MismatchInfo for the pass path
+# and one MismatchInfo per reason id for overrides (index 0 unused).
+_EMPTY_REASONS: list[str] = _ReadOnlyList()
+_EMPTY_MISMATCH = _SharedMismatchInfo()
+_SHARED_MISMATCH: tuple[MismatchInfo | None, ...] = tuple(
+    _SharedMismatchInfo(flags=[GUARD_ORDER[g]], reason_codes=[code]) if g >= 0 else None
+    for code, g in zip(REASON_CODES, REASON_GUARD)
+)
+# GUARD_ORDER flag per reason id ("" for 0).
+_FLAGS: tuple[str, ...] = tuple(GUARD_ORDER[g] if g >= 0 else "" for g in REASON_GUARD)
+
+# Instrumentation recorder (dmc_core.metrics.instrumentation); None = disabled.
+# modulate pays one global load + `is not None` check when disabled.
+_recorder = None
+
+
+def set_recorder(recorder) -> None:
+    """
+    Install (or remove with None) an object with record(reason_id, exception, ns):
+    reason_id is the ReasonCode (0 = allowed), exception the exception type name or None.
+    """
+    global _recorder
+    _recorder = recorder
+
+
 def modulate(
     proposal: Proposal,
     policy: GuardPolicy,
-    context: dict,
+    context: dict | GuardContext,
+    *,
+    low_alloc: bool = False,
 ) -> tuple[FinalDecision, MismatchInfo]:
     """
     Apply guards in fixed order. First failure → override to fail_closed_action
@@ -38,10 +117,33 @@ def modulate(
 
     Context keys (generic): now_ms, last_event_ts_ms, ops_deny_actions, ops_state,
     ops_cooldown_until_ms, errors_in_window, steps_in_window, rate_limit_events,
-    recent_failures, cooldown_until_ms.
+    recent_failures, cooldown_until_ms. A GuardContext is accepted as well.
+
+    low_alloc=True: only the FinalDecision is allocated per call. The MismatchInfo
+    (and its lists, reused as FinalDecision.reasons) is a shared read-only instance:
+    mutating it raises instead of changing later decisions. A pass keeps
+    proposal.reasons by reference.
     """
+    if _recorder is not None:
+        return _modulate_recorded(proposal, policy, context, low_alloc)
     try:
-        return _modulate_impl(proposal, policy, context)
+        # _decision inlined: the pass path makes a single call
+        reason = _first_failure(policy, context)
+        if reason:
+            return _override(proposal, policy, reason, low_alloc)
+        if low_alloc:
+            return (
+                FinalDecision(
+                    action=proposal.action,
+                    allowed=True,
+                    reasons=proposal.reasons or _EMPTY_REASONS,
+                ),
+                _EMPTY_MISMATCH,
+            )
+        return (
+            FinalDecision(action=proposal.action, allowed=True, reasons=proposal.reasons or []),
+            MismatchInfo(),
+        )
     except Exception as e:
         logger.warning("DMC modulate exception, fail-closed: %s", type(e).__name__)
         return _fail_closed(policy), MismatchInfo(
@@ -50,6 +152,39 @@ def modulate(
         )
 
 
+def _modulate_recorded(
+    proposal: Proposal,
+    policy: GuardPolicy,
+    context: dict | GuardContext,
+    low_alloc: bool,
+) -> tuple[FinalDecision, MismatchInfo]:
+    """modulate with timing and outcome reported to _recorder (never raises from it)."""
+    recorder = _recorder
+    exception = None
+    reason = 0
+    t0 = time.perf_counter_ns()
+    try:
+        reason = _first_failure(policy, context)
+        result = _decision(proposal, policy, reason, low_alloc)
+    except Exception as e:  # noqa: BLE001
+        exception = type(e).__name__
+        logger.warning("DMC modulate exception, fail-closed: %s", exception)
+        result = (
+            _fail_closed(policy),
+            MismatchInfo(
+                flags=["modulate_exception"],
+                reason_codes=[exception],
+            ),
+        )
+    elapsed = time.perf_counter_ns() - t0
+    if recorder is not None:
+        try:
+            recorder.record(reason, exception, elapsed)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("DMC instrumentation error ignored: %s", type(e).__name__)
+    return result
+
+
 def _fail_closed(policy: GuardPolicy) -> FinalDecision:
     """INVARIANT 4: allowed=False, action in {HOLD, STOP}."""
     action = policy.fail_closed_action
@@ -61,71 +196,103 @@ def _fail_closed(policy: GuardPolicy) -> FinalDecision:
 def _modulate_impl(
     proposal: Proposal,
     policy: GuardPolicy,
-    context: dict,
+    context: dict | GuardContext,
+    low_alloc: bool = False,
 ) -> tuple[FinalDecision, MismatchInfo]:
-    now_ms = context.get("now_ms", 0)
-    last_event_ts_ms = context.get("last_event_ts_ms", now_ms)
-    mismatch_flags: list[str] = []
-    reason_codes: list[str] = []
+    return _decision(proposal, policy, _first_failure(policy, context), low_alloc)
+
+
+def _first_failure(policy: GuardPolicy, context: dict | GuardContext) -> ReasonCode:
+    """ReasonCode of the first failing guard in GUARD_ORDER; ReasonCode.NONE if all pass."""
+    if type(context) is GuardContext:
+        now_ms = context.now_ms
+        last_event_ts_ms = context.last_event_ts_ms
+        if last_event_ts_ms is None:
+            last_event_ts_ms = now_ms
+        ops_deny_actions = context.ops_deny_actions
+        ops_state = context.ops_state
+        ops_cooldown_until_ms = context.ops_cooldown_until_ms
+        errors_in_window = context.errors_in_window
+        steps_in_window = context.steps_in_window
+        rate_limit_events = context.rate_limit_events
+        recent_failures = context.recent_failures
+        cooldown_until_ms = context.cooldown_until_ms
+    else:
+        get = context.get
+        now_ms = get("now_ms", 0)
+        last_event_ts_ms = get("last_event_ts_ms", now_ms)
+        ops_deny_actions = get("ops_deny_actions")
+        ops_state = get("ops_state")
+        ops_cooldown_until_ms = get("ops_cooldown_until_ms")
+        errors_in_window = get("errors_in_window", 0)
+        steps_in_window = get("steps_in_window", 1)
+        rate_limit_events = get("rate_limit_events", 0)
+        recent_failures = get("recent_failures", 0)
+        cooldown_until_ms = get("cooldown_until_ms")
 
     # 1. ops_health
     ok, code = ops_health_guard(
-        context.get("ops_deny_actions"),
-        context.get("ops_state"),
-        context.get("ops_cooldown_until_ms"),
+        ops_deny_actions,
+        ops_state,
+        ops_cooldown_until_ms,
         now_ms,
     )
     if not ok:
-        mismatch_flags.append("ops_health")
-        reason_codes.append(code)
-        return _override_decision(proposal, policy, mismatch_flags, reason_codes)
+        return code
 
     # 2. staleness
     ok, code = staleness_guard(last_event_ts_ms, now_ms, policy.staleness_ms)
     if not ok:
-        mismatch_flags.append("staleness")
-        reason_codes.append(code)
-        return _override_decision(proposal, policy, mismatch_flags, reason_codes)
+        return code
 
     # 3. error_rate
     ok, code = error_rate_guard(
-        context.get("errors_in_window", 0),
-        context.get("steps_in_window", 1),
+        errors_in_window,
+        steps_in_window,
         policy.max_error_rate,
     )
     if not ok:
-        mismatch_flags.append("error_rate")
-        reason_codes.append(code)
-        return _override_decision(proposal, policy, mismatch_flags, reason_codes)
+        return code
 
     # 4. rate_limit
     ok, code = rate_limit_guard(
-        context.get("rate_limit_events", 0),
+        rate_limit_events,
         policy.rate_limit_events_max,
     )
     if not ok:
-        mismatch_flags.append("rate_limit")
-        reason_codes.append(code)
-        return _override_decision(proposal, policy, mismatch_flags, reason_codes)
+        return code
 
     # 5. circuit_breaker
     ok, code = circuit_breaker_guard(
-        context.get("recent_failures", 0),
+        recent_failures,
         policy.circuit_breaker_failures,
     )
     if not ok:
-        mismatch_flags.append("circuit_breaker")
-        reason_codes.append(code)
-        return _override_decision(proposal, policy, mismatch_flags, reason_codes)
+        return code
 
     # 6. cooldown
-    ok, code = cooldown_guard(context.get("cooldown_until_ms"), now_ms)
-    if not ok:
-        mismatch_flags.append("cooldown")
-        reason_codes.append(code)
-        return _override_decision(proposal, policy, mismatch_flags, reason_codes)
+    ok, code = cooldown_guard(cooldown_until_ms, now_ms)
+    return code  # ReasonCode.NONE if it passed
+
 
-    # All passed
+def _decision(
+    proposal: Proposal,
+    policy: GuardPolicy,
+    reason: int,
+    low_alloc: bool,
+) -> tuple[FinalDecision, MismatchInfo]:
+    """Build the schema result for a reason id (0 = pass): the only string lookup."""
+    if reason:
+        return _override(proposal, policy, reason, low_alloc)
+    if low_alloc:
+        return (
+            FinalDecision(
+                action=proposal.action,
+                allowed=True,
+                reasons=proposal.reasons or _EMPTY_REASONS,
+            ),
+            _EMPTY_MISMATCH,
+        )
     return (
         FinalDecision(
             action=proposal.action,
@@ -136,6 +303,24 @@ def _modulate_impl(
     )
 
 
+def _override(
+    proposal: Proposal,
+    policy: GuardPolicy,
+    reason: int,
+    low_alloc: bool,
+) -> tuple[FinalDecision, MismatchInfo]:
+    if not low_alloc:
+        return _override_decision(proposal, policy, [_FLAGS[reason]], [REASON_CODES[reason]])
+    mi = _SHARED_MISMATCH[reason]
+    action = policy.fail_closed_action
+    if action not in (Action.HOLD, Action.STOP):
+        action = Action.HOLD
+    return (
+        FinalDecision(action=action, allowed=False, reasons=mi.reason_codes, mismatch=mi),
+        mi,
+    )
+
+
 def _override_decision(
     proposal: Proposal,
     policy: GuardPolicy,
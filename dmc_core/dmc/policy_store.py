@@ -0,0 +1,231 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC policy store: hot-reloaded GuardPolicy, compiled once per version.
+
+The active version is one ActivePolicy tuple (version, policy, compiled fn) held in a
+single attribute. A reload builds and validates the new tuple completely, then swaps it
+in with one assignment (read-copy-update): readers take a single reference and never
+lock, and a decision always uses one consistent version. Only writers (reload, set,
+the watcher thread) take a lock, to keep versions monotonic.
+
+Policies are JSON objects of GuardPolicy fields. An invalid or unreadable file, or any
+error while building the new version, never replaces the active version: reload logs
+it and the last good version stays active (INVARIANT 4: no unvalidated thresholds reach
+modulate).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import math
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple, Self
+
+from decision_schema.types import Action, FinalDecision, MismatchInfo, Proposal
+
+from dmc_core.dmc.compiled import ModulatorFn, compile_policy
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.registry import GuardRegistry
+
+logger = logging.getLogger(__name__)
+
+VersionedDecision = tuple[int, FinalDecision, MismatchInfo]
+
+
+# (st_mtime_ns, st_size, st_ino) of a policy file; NO_FILE for set() versions.
+FileStamp = tuple[int, int, int]
+NO_FILE: FileStamp = (0, 0, 0)
+
+
+class ActivePolicy(NamedTuple):
+    """One immutable policy version. stamp identifies the file it came from."""
+
+    version: int
+    policy: GuardPolicy
+    fn: ModulatorFn
+    stamp: FileStamp
+
+
+def _stamp(path: Path) -> FileStamp:
+    # mtime alone misses a rename of a file carrying the same mtime (coarse clocks,
+    # copies keeping mtime); size and inode catch those
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def validate_policy(policy: GuardPolicy) -> None:
+    """
+    Raise ValueError unless every numeric field is a non-negative number (inf allowed),
+    max_error_rate is in [0, 1] and fail_closed_action is HOLD or STOP (TypeError for a
+    field that is not a number).
+    """
+    if policy.fail_closed_action not in (Action.HOLD, Action.STOP):
+        raise ValueError("fail_closed_action must be HOLD or STOP")
+    for f in dataclasses.fields(policy):
+        value = getattr(policy, f.name)
+        if f.name == "fail_closed_action":
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"{f.name} must be a number")
+        if math.isnan(value) or value < 0:
+            raise ValueError(f"{f.name} must be >= 0")
+    if policy.max_error_rate > 1:
+        raise ValueError("max_error_rate must be <= 1")
+
+
+def policy_from_dict(data: dict, cls: type[GuardPolicy] = GuardPolicy) -> GuardPolicy:
+    """Validated cls instance from a JSON object; missing fields keep their defaults."""
+    if not isinstance(data, dict):
+        raise TypeError("policy must be a JSON object")
+    names = {f.name for f in dataclasses.fields(cls)}
+    unknown = sorted(set(data) - names)
+    if unknown:
+        raise ValueError(f"unknown policy fields: {', '.join(unknown)}")
+    values = dict(data)
+    if "fail_closed_action" in values:
+        values["fail_closed_action"] = Action(values["fail_closed_action"])
+    policy = cls(**values)
+    validate_policy(policy)
+    return policy
+
+
+def load_policy(path: str | os.PathLike, cls: type[GuardPolicy] = GuardPolicy) -> GuardPolicy:
+    """Read and validate a policy JSON file (see policy_from_dict; Infinity is allowed)."""
+    with open(path, encoding="utf-8") as f:
+        return policy_from_dict(json.load(f), cls)
+
+
+class PolicyStore:
+    """
+    Versioned, atomically swapped compiled policies.
+
+    PolicyStore(path) loads the file as version 1 (raising if it is invalid);
+    PolicyStore(policy=...) starts from a policy without a file. policy_type is the
+    GuardPolicy subclass files are read into (for thresholds of registered guards).
+    modulate() and active are safe from any number of threads. Do not mutate
+    store.policy: publish a changed copy with set(). Replace the file by renaming a
+    complete new file over it, so the watcher never reads a partial write.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        *,
+        policy: GuardPolicy | None = None,
+        low_alloc: bool = False,
+        registry: GuardRegistry | None = None,
+        policy_type: type[GuardPolicy] = GuardPolicy,
+    ) -> None:
+        if (path is None) == (policy is None):
+            raise ValueError("pass exactly one of path and policy")
+        self.path = None if path is None else Path(path)
+        self.low_alloc = low_alloc
+        self.registry = registry
+        self.policy_type = policy_type
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: threading.Thread | None = None
+        self._active: ActivePolicy | None = None
+        if policy is not None:
+            self.set(policy)
+        else:
+            stamp = _stamp(self.path)
+            self._publish(load_policy(self.path, policy_type), stamp)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def active(self) -> ActivePolicy:
+        """The current version; read it once and use its fields together."""
+        return self._active
+
+    @property
+    def version(self) -> int:
+        return self._active.version
+
+    @property
+    def policy(self) -> GuardPolicy:
+        return self._active.policy
+
+    def modulate(self, proposal: Proposal, context: dict | GuardContext) -> VersionedDecision:
+        """(version, FinalDecision, MismatchInfo) under the active version."""
+        active = self._active
+        return (active.version, *active.fn(proposal, context))
+
+    def set(self, policy: GuardPolicy) -> ActivePolicy:
+        """Publish a copy of policy as the next version (validated like a file)."""
+        policy = dataclasses.replace(policy)
+        validate_policy(policy)
+        with self._lock:
+            return self._publish(policy, NO_FILE)
+
+    def reload(self, *, force: bool = False) -> bool:
+        """
+        Publish the file as a new version if its mtime, size or inode changed (or force).
+
+        Returns True when a new version was published. A missing, unreadable or invalid
+        file, or an error building the version (policy_type, compile_policy, a guard's
+        elide_when), is logged and the active version is kept.
+        """
+        if self.path is None:
+            raise ValueError("store has no policy file")
+        with self._lock:
+            try:
+                stamp = _stamp(self.path)
+                if not force and stamp == self._active.stamp:
+                    return False
+                self._publish(load_policy(self.path, self.policy_type), stamp)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(
+                    "DMC policy reload failed, keeping version %d: %s: %s",
+                    self._active.version,
+                    type(e).__name__,
+                    e,
+                )
+                return False
+        logger.info("DMC policy version %d loaded from %s", self._active.version, self.path)
+        return True
+
+    def watch(self, interval_s: float = 1.0) -> None:
+        """Poll the file's stamp every interval_s on a daemon thread and reload on change."""
+        if self.path is None:
+            raise ValueError("store has no policy file")
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive")
+        if self._watcher is not None:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval_s,), name="dmc-policy-watch", daemon=True
+        )
+        self._watcher.start()
+
+    def close(self) -> None:
+        """Stop the watcher thread (if any); the active version stays usable."""
+        if self._watcher is not None:
+            self._stop.set()
+            self._watcher.join()
+            self._watcher = None
+
+    def _watch(self, interval_s: float) -> None:
+        while not self._stop.wait(interval_s):
+            self.reload()
+
+    def _publish(self, policy: GuardPolicy, stamp: FileStamp) -> ActivePolicy:
+        """Compile, then swap in with one assignment. Caller holds the lock (or is __init__)."""
+        fn = compile_policy(policy, low_alloc=self.low_alloc, registry=self.registry)
+        version = 1 if self._active is None else self._active.version + 1
+        active = ActivePolicy(version, policy, fn, stamp)
+        self._active = active
+        return active
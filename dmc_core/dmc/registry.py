@@ -0,0 +1,315 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC guard registry: guards declare their context keys, policy fields and order position;
+build_plan resolves one policy + registry into a fused check function.
+
+The six generic guards are registered at positions 100..600 in GUARD_ORDER and cannot
+be replaced or moved; additional guards take any other free position (e.g. 250 runs
+between staleness and error_rate). build_plan sorts once, elides guards disabled by the
+policy, binds thresholds and guard functions as constants and generates straight-line
+code, so evaluation does no registry lookups.
+
+INVARIANT 3: Plan order is by position; the generic guards keep GUARD_ORDER.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import textwrap
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+from dmc_core.dmc.context import CONTEXT_KEYS, GuardContext
+from dmc_core.dmc.guards_generic import (
+    GUARD_ORDER,
+    REASON_CODES,
+    REASON_GUARD,
+    circuit_breaker_guard,
+    cooldown_guard,
+    error_rate_guard,
+    ops_health_guard,
+    rate_limit_guard,
+    staleness_guard,
+)
+
+
+@dataclass(frozen=True)
+class GuardSpec:
+    """
+    One guard. fn(*context values, *policy values) -> (ok, reason_code).
+
+    context_keys are read from the context (missing -> context_defaults, else None) and
+    must be identifiers; a key that is not a GuardContext field makes typed contexts
+    fail closed (they cannot carry it). policy_fields are read from the policy when the
+    plan is built. Every code fn can
+    return must be listed in reason_codes; an undeclared code fails closed.
+    elide_when(policy) -> True drops the guard from the plan (it cannot fail), so its
+    context values are not read or checked at all.
+    """
+
+    name: str
+    position: int
+    fn: Callable[..., tuple[bool, str]]
+    reason_codes: tuple[str, ...]
+    context_keys: tuple[str, ...] = ()
+    policy_fields: tuple[str, ...] = ()
+    context_defaults: Mapping[str, Any] = field(default_factory=dict)
+    elide_when: Callable[[Any], bool] | None = None
+    source: str | None = None  # generic guards only: inline code returning a REASON_CODES id
+    # generic guards only: when elided, source still runs unless this holds (the values
+    # for which an infinite threshold can neither fail nor raise, as in modulate)
+    elided_unless: str | None = None
+
+
+def _infinite(field_name: str) -> Callable[[Any], bool]:
+    return lambda policy: getattr(policy, field_name) == math.inf
+
+
+# Inline sources of the generic guards (same semantics as guards_generic).
+BUILTIN_GUARDS: tuple[GuardSpec, ...] = (
+    GuardSpec(
+        name="ops_health",
+        position=100,
+        fn=ops_health_guard,
+        reason_codes=("ops_deny_actions", "ops_health_red", "ops_cooldown_active"),
+        context_keys=("ops_deny_actions", "ops_state", "ops_cooldown_until_ms", "now_ms"),
+        source="""\
+    if get("ops_deny_actions") is True:
+        return 1
+    if get("ops_state") == "RED":
+        return 2
+    until = get("ops_cooldown_until_ms")
+    if until is not None and now_ms < until:
+        return 3
+""",
+    ),
+    GuardSpec(
+        name="staleness",
+        position=200,
+        fn=staleness_guard,
+        reason_codes=("staleness_exceeded",),
+        context_keys=("last_event_ts_ms", "now_ms"),
+        policy_fields=("staleness_ms",),
+        elide_when=_infinite("staleness_ms"),
+        elided_unless="type(now_ms) is int and type(last_event_ts_ms) is int",
+        source="""\
+    if now_ms - last_event_ts_ms > staleness_ms:
+        return 4
+""",
+    ),
+    GuardSpec(
+        name="error_rate",
+        position=300,
+        fn=error_rate_guard,
+        reason_codes=("error_rate_high",),
+        context_keys=("errors_in_window", "steps_in_window"),
+        policy_fields=("max_error_rate",),
+        context_defaults={"errors_in_window": 0, "steps_in_window": 1},
+        elide_when=_infinite("max_error_rate"),
+        elided_unless=(
+            'type(get("errors_in_window", 0)) is int and type(get("steps_in_window", 1)) is int'
+            ' and -_INT_SAFE < get("errors_in_window", 0) < _INT_SAFE'
+        ),
+        source="""\
+    errors = get("errors_in_window", 0)
+    steps = get("steps_in_window", 1)
+    if not steps <= 0 and errors / steps > max_error_rate:
+        return 5
+""",
+    ),
+    GuardSpec(
+        name="rate_limit",
+        position=400,
+        fn=rate_limit_guard,
+        reason_codes=("rate_limit_exceeded",),
+        context_keys=("rate_limit_events",),
+        policy_fields=("rate_limit_events_max",),
+        context_defaults={"rate_limit_events": 0},
+        elide_when=_infinite("rate_limit_events_max"),
+        elided_unless='type(get("rate_limit_events", 0)) is int',
+        source="""\
+    if get("rate_limit_events", 0) > rate_limit_events_max:
+        return 6
+""",
+    ),
+    GuardSpec(
+        name="circuit_breaker",
+        position=500,
+        fn=circuit_breaker_guard,
+        reason_codes=("circuit_breaker",),
+        context_keys=("recent_failures",),
+        policy_fields=("circuit_breaker_failures",),
+        context_defaults={"recent_failures": 0},
+        elide_when=_infinite("circuit_breaker_failures"),
+        elided_unless='type(get("recent_failures", 0)) is int',
+        source="""\
+    if get("recent_failures", 0) >= circuit_breaker_failures:
+        return 7
+""",
+    ),
+    GuardSpec(
+        name="cooldown",
+        position=600,
+        fn=cooldown_guard,
+        reason_codes=("cooldown_active",),
+        context_keys=("cooldown_until_ms", "now_ms"),
+        source="""\
+    until = get("cooldown_until_ms")
+    if until is not None and now_ms < until:
+        return 8
+""",
+    ),
+)
+assert tuple(g.name for g in BUILTIN_GUARDS) == GUARD_ORDER
+
+_BUILTIN_NAMES = frozenset(GUARD_ORDER)
+
+
+class GuardRegistry:
+    """Ordered set of guards; starts with the six generic guards."""
+
+    def __init__(self, guards: Iterable[GuardSpec] = ()) -> None:
+        self._guards: dict[str, GuardSpec] = {g.name: g for g in BUILTIN_GUARDS}
+        for spec in guards:
+            self.register(spec)
+
+    def register(self, spec: GuardSpec) -> GuardSpec:
+        if spec.name in self._guards:
+            raise ValueError(f"guard {spec.name!r} is already registered")
+        if any(g.position == spec.position for g in self._guards.values()):
+            raise ValueError(f"guard position {spec.position} is already taken")
+        if spec.source is not None:
+            raise ValueError("source is reserved for the generic guards; pass fn")
+        if not spec.reason_codes:
+            raise ValueError(f"guard {spec.name!r} must declare its reason codes")
+        # keys are spliced into the generated plan source
+        bad = [key for key in spec.context_keys if not (type(key) is str and key.isidentifier())]
+        if bad:
+            raise ValueError(f"guard {spec.name!r} context keys must be identifiers: {bad}")
+        self._guards[spec.name] = spec
+        return spec
+
+    def unregister(self, name: str) -> None:
+        if name in _BUILTIN_NAMES:
+            raise ValueError(f"generic guard {name!r} cannot be removed (INVARIANT 3)")
+        del self._guards[name]
+
+    def guards(self) -> tuple[GuardSpec, ...]:
+        """Registered guards in evaluation order."""
+        return tuple(sorted(self._guards.values(), key=lambda g: g.position))
+
+    @property
+    def order(self) -> tuple[str, ...]:
+        return tuple(g.name for g in self.guards())
+
+
+class GuardPlan(NamedTuple):
+    """
+    check(context) -> outcome id; 0 = all passed, else flags[id] / codes[id] name the
+    first failing guard and its reason. Ids 1..8 are the REASON_CODES ids.
+    """
+
+    guards: tuple[str, ...]  # evaluated guards, in order (elided ones omitted)
+    flags: tuple[str, ...]
+    codes: tuple[str, ...]
+    check: Callable[[dict | GuardContext], int]
+    source: str
+
+
+_PRELUDE = """\
+def check(context):
+    if type(context) is GuardContext:
+        return check_typed(context)
+    get = context.get
+    now_ms = get("now_ms", 0)
+    last_event_ts_ms = get("last_event_ts_ms", now_ms)
+"""
+_PRELUDE_TYPED = """\
+def check_typed(context):
+    now_ms = context.now_ms
+    last_event_ts_ms = context.last_event_ts_ms
+    if last_event_ts_ms is None:
+        last_event_ts_ms = now_ms
+"""
+_POSTLUDE = """\
+    return 0
+"""
+# GuardContext variant of the generic sources: get("key"[, default]) -> context.key.
+_GET_CALL = re.compile(r'get\("(\w+)"(?:, [^)]+)?\)')
+_LOCAL_KEYS = ("now_ms", "last_event_ts_ms")
+# |int| below this divided by an int >= 1 always fits a float (no OverflowError)
+_INT_SAFE = 1 << 1023
+
+
+def build_plan(policy: Any, registry: GuardRegistry | None = None) -> GuardPlan:
+    """Resolve order, elide disabled guards and generate the fused check for `policy`."""
+    registry = registry or _DEFAULT_REGISTRY
+    flags = [GUARD_ORDER[g] if g >= 0 else "" for g in REASON_GUARD]
+    codes = list(REASON_CODES)
+    namespace: dict[str, Any] = {"GuardContext": GuardContext, "_INT_SAFE": _INT_SAFE}
+    body: list[str] = []
+    body_typed: list[str] = []
+    names: list[str] = []
+    for k, spec in enumerate(registry.guards()):
+        source = spec.source
+        if spec.elide_when is not None and spec.elide_when(policy):
+            if spec.elided_unless is None:
+                continue
+            # ints compare below an infinite threshold; anything else is evaluated
+            # in full so it fails (or raises) exactly as in modulate
+            source = f"    if not ({spec.elided_unless}):\n" + textwrap.indent(source, "    ")
+        else:
+            names.append(spec.name)
+        if source is not None:
+            for name in spec.policy_fields:
+                namespace[name] = getattr(policy, name)
+            body.append(source)
+            body_typed.append(_GET_CALL.sub(r"context.\1", source))
+            continue
+        outcomes = {}
+        for code in spec.reason_codes:
+            outcomes[code] = len(codes)
+            flags.append(spec.name)
+            codes.append(code)
+        namespace[f"_g{k}"] = spec.fn
+        namespace[f"_o{k}"] = outcomes
+        params = [f"_p{k}_{i}" for i in range(len(spec.policy_fields))]
+        for param, name in zip(params, spec.policy_fields):
+            namespace[param] = getattr(policy, name)
+        args, args_typed = [], []
+        for i, key in enumerate(spec.context_keys):
+            if key in _LOCAL_KEYS:
+                args.append(key)
+                args_typed.append(key)
+                continue
+            default = f"_d{k}_{i}"
+            namespace[default] = spec.context_defaults.get(key)
+            args.append(f'get("{key}", {default})')
+            args_typed.append(f"context.{key}")
+        check = f"    if not ok:\n        return _o{k}[code]\n"
+        body.append(f"    ok, code = _g{k}({', '.join(args + params)})\n" + check)
+        foreign = [key for key in spec.context_keys if key not in CONTEXT_KEYS]
+        if foreign:  # a GuardContext cannot carry these keys: fail closed
+            namespace[f"_m{k}"] = (
+                f"guard {spec.name!r} reads context keys {foreign} that are not "
+                "GuardContext fields; pass a dict context"
+            )
+            body_typed.append(f"    raise TypeError(_m{k})\n")
+        else:
+            body_typed.append(f"    ok, code = _g{k}({', '.join(args_typed + params)})\n" + check)
+    source = _PRELUDE + "".join(body) + _POSTLUDE + _PRELUDE_TYPED + "".join(body_typed) + _POSTLUDE
+    exec(compile(source, "<dmc guard plan>", "exec"), namespace)  # noqa: S102
+    return GuardPlan(
+        guards=tuple(names),
+        flags=tuple(flags),
+        codes=tuple(codes),
+        check=namespace["check"],
+        source=source,
+    )
+
+
+_DEFAULT_REGISTRY = GuardRegistry()
@@ -0,0 +1,281 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC guard state: sliding-window counters that produce the generic context keys.
+
+GuardState records events, steps, errors and failures, expires them against
+GuardPolicy.rate_limit_window_ms and arms GuardPolicy.cooldown_ms when the circuit
+breaker trips. Memory per state is O(buckets), independent of traffic.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+from dataclasses import dataclass
+
+from decision_schema.types import FinalDecision, MismatchInfo, Proposal
+
+from dmc_core.dmc.horizon import GUARD_INDEX, _next_change, first_failed_index
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+DEFAULT_BUCKETS = 60
+
+
+class WindowCounter:
+    """
+    Sliding-window count over ring-buffer buckets of bucket_ms each.
+
+    add/total are O(1) amortized. The ring spans window_ms // bucket_ms buckets (the
+    largest multiple of bucket_ms not above window_ms), so resolution is one bucket plus
+    the remainder: a count expires more than span - bucket_ms and at most span <=
+    window_ms after it was added, never later than the window. Counts older than the
+    span (out-of-order timestamps) are dropped.
+    """
+
+    __slots__ = ("_counts", "_head", "_total", "bucket_ms", "window_ms")
+
+    def __init__(self, window_ms: int, buckets: int = DEFAULT_BUCKETS) -> None:
+        if window_ms <= 0 or buckets <= 0:
+            raise ValueError("window_ms and buckets must be positive")
+        self.window_ms = window_ms
+        self.bucket_ms = -(-window_ms // buckets)
+        self._counts = [0] * (window_ms // self.bucket_ms)  # span never exceeds window_ms
+        self._head: int | None = None  # newest bucket epoch seen
+        self._total = 0
+
+    def copy(self) -> WindowCounter:
+        """Independent counter with the same counts."""
+        other = WindowCounter.__new__(WindowCounter)
+        other.window_ms = self.window_ms
+        other.bucket_ms = self.bucket_ms
+        other._counts = self._counts.copy()
+        other._head = self._head
+        other._total = self._total
+        return other
+
+    def _advance(self, epoch: int) -> None:
+        head = self._head
+        if head is not None and epoch <= head:
+            return
+        counts = self._counts
+        n = len(counts)
+        if head is None or epoch - head >= n:
+            for i in range(n):
+                counts[i] = 0
+            self._total = 0
+        else:
+            for e in range(head + 1, epoch + 1):
+                i = e % n
+                self._total -= counts[i]
+                counts[i] = 0
+        self._head = epoch
+
+    def add(self, now_ms: int, count: int = 1) -> None:
+        """Add count at now_ms."""
+        epoch = now_ms // self.bucket_ms
+        self._advance(epoch)
+        if epoch <= self._head - len(self._counts):
+            return
+        self._counts[epoch % len(self._counts)] += count
+        self._total += count
+
+    def total(self, now_ms: int) -> int:
+        """Count within the window ending at now_ms."""
+        self._advance(now_ms // self.bucket_ms)
+        return self._total
+
+    def next_expiry_ms(self, now_ms: int) -> int | float:
+        """Earliest now_ms at which total() decreases (math.inf if the window is empty)."""
+        self._advance(now_ms // self.bucket_ms)
+        if not self._total:
+            return math.inf
+        counts = self._counts
+        n = len(counts)
+        for epoch in range(self._head - n + 1, self._head + 1):
+            if counts[epoch % n]:
+                return (epoch + n) * self.bucket_ms
+        return math.inf
+
+
+@dataclass(frozen=True, slots=True)
+class GuardEvent:
+    """
+    Observations at now_ms for one key, applied by GuardState.apply.
+
+    Counts are added to the windows; ops_* fields left as None keep the current value.
+    """
+
+    now_ms: int
+    events: int = 0
+    steps: int = 0
+    errors: int = 0
+    failures: int = 0
+    ops_deny_actions: bool | None = None
+    ops_state: str | None = None
+    ops_cooldown_until_ms: int | None = None
+
+
+class GuardState:
+    """
+    Per-key guard state feeding modulate.
+
+    Windows: events (rate_limit_events), steps/errors (steps_in_window,
+    errors_in_window) and failures (recent_failures) all use
+    policy.rate_limit_window_ms. When recent_failures reaches
+    policy.circuit_breaker_failures, cooldown_until_ms is armed to now_ms + policy.cooldown_ms.
+    """
+
+    __slots__ = (
+        "cooldown_until_ms",
+        "errors",
+        "events",
+        "failures",
+        "last_event_ts_ms",
+        "ops_cooldown_until_ms",
+        "ops_deny_actions",
+        "ops_state",
+        "policy",
+        "steps",
+    )
+
+    def __init__(self, policy: GuardPolicy, buckets: int = DEFAULT_BUCKETS) -> None:
+        window_ms = policy.rate_limit_window_ms
+        self.policy = policy
+        self.events = WindowCounter(window_ms, buckets)
+        self.steps = WindowCounter(window_ms, buckets)
+        self.errors = WindowCounter(window_ms, buckets)
+        self.failures = WindowCounter(window_ms, buckets)
+        self.last_event_ts_ms: int | None = None
+        self.cooldown_until_ms: int | None = None
+        self.ops_deny_actions: bool | None = None
+        self.ops_state: str | None = None
+        self.ops_cooldown_until_ms: int | None = None
+
+    def copy(self) -> GuardState:
+        """Independent state with the same windows and fields; the policy is shared."""
+        other = GuardState.__new__(GuardState)
+        other.policy = self.policy
+        other.events = self.events.copy()
+        other.steps = self.steps.copy()
+        other.errors = self.errors.copy()
+        other.failures = self.failures.copy()
+        other.last_event_ts_ms = self.last_event_ts_ms
+        other.cooldown_until_ms = self.cooldown_until_ms
+        other.ops_deny_actions = self.ops_deny_actions
+        other.ops_state = self.ops_state
+        other.ops_cooldown_until_ms = self.ops_cooldown_until_ms
+        return other
+
+    def record_event(self, now_ms: int, count: int = 1) -> None:
+        """Count events (rate limit) and mark last_event_ts_ms."""
+        self.events.add(now_ms, count)
+        if self.last_event_ts_ms is None or now_ms > self.last_event_ts_ms:
+            self.last_event_ts_ms = now_ms
+
+    def record_step(self, now_ms: int, error: bool = False) -> None:
+        """Count one step; error=True also counts it as an error."""
+        self.steps.add(now_ms)
+        if error:
+            self.errors.add(now_ms)
+
+    def record_failure(self, now_ms: int, count: int = 1) -> None:
+        """Count failures; arm cooldown when the circuit breaker threshold is reached."""
+        self.failures.add(now_ms, count)
+        if self.failures.total(now_ms) >= self.policy.circuit_breaker_failures:
+            self.arm_cooldown(now_ms)
+
+    def arm_cooldown(self, now_ms: int) -> None:
+        """Set cooldown_until_ms = now_ms + policy.cooldown_ms (never shortens it)."""
+        until = now_ms + self.policy.cooldown_ms
+        if self.cooldown_until_ms is None or until > self.cooldown_until_ms:
+            self.cooldown_until_ms = until
+
+    def set_ops(
+        self,
+        ops_deny_actions: bool | None = None,
+        ops_state: str | None = None,
+        ops_cooldown_until_ms: int | None = None,
+    ) -> None:
+        """Replace the ops-health signal (see ops_health_guard)."""
+        self.ops_deny_actions = ops_deny_actions
+        self.ops_state = ops_state
+        self.ops_cooldown_until_ms = ops_cooldown_until_ms
+
+    def apply(self, event: GuardEvent) -> None:
+        """
+        Record everything observed in event. A time or count that is not an integer
+        raises TypeError before anything is recorded, so a bad event changes nothing.
+        """
+        now_ms = event.now_ms
+        for value in (now_ms, event.events, event.steps, event.errors, event.failures):
+            operator.index(value)
+        if event.events:
+            self.record_event(now_ms, event.events)
+        if event.steps:
+            self.steps.add(now_ms, event.steps)
+        if event.errors:
+            self.errors.add(now_ms, event.errors)
+        if event.failures:
+            self.record_failure(now_ms, event.failures)
+        if event.ops_deny_actions is not None:
+            self.ops_deny_actions = event.ops_deny_actions
+        if event.ops_state is not None:
+            self.ops_state = event.ops_state
+        if event.ops_cooldown_until_ms is not None:
+            self.ops_cooldown_until_ms = event.ops_cooldown_until_ms
+
+    def context(self, now_ms: int) -> dict:
+        """Generic context dict for modulate at now_ms."""
+        context = {
+            "now_ms": now_ms,
+            "errors_in_window": self.errors.total(now_ms),
+            "steps_in_window": self.steps.total(now_ms),
+            "rate_limit_events": self.events.total(now_ms),
+            "recent_failures": self.failures.total(now_ms),
+            "cooldown_until_ms": self.cooldown_until_ms,
+            "ops_deny_actions": self.ops_deny_actions,
+            "ops_state": self.ops_state,
+            "ops_cooldown_until_ms": self.ops_cooldown_until_ms,
+        }
+        if self.last_event_ts_ms is not None:
+            context["last_event_ts_ms"] = self.last_event_ts_ms
+        return context
+
+    def modulate(self, proposal: Proposal, now_ms: int) -> tuple[FinalDecision, MismatchInfo]:
+        """modulate(proposal, self.policy, self.context(now_ms))."""
+        return modulate(proposal, self.policy, self.context(now_ms))
+
+    def next_change_ms(self, now_ms: int, mismatch: MismatchInfo | None = None) -> int | float:
+        """
+        Earliest time after now_ms at which modulate can change without new events:
+        horizon.next_change_ms of the context, or a window count expiring. Window
+        expiries only lower counts, so they matter for a failing rate_limit or
+        circuit_breaker, and for error_rate (a ratio) while errors are in the window.
+        Pass the MismatchInfo of the decision at now_ms to skip later guards.
+        """
+        first = first_failed_index(mismatch)
+        horizon = _next_change(
+            self.policy.staleness_ms,
+            now_ms,
+            self.last_event_ts_ms,
+            self.ops_cooldown_until_ms,
+            self.cooldown_until_ms,
+            first,
+        )
+        if first >= _ERROR_RATE and self.errors.total(now_ms):
+            horizon = min(
+                horizon, self.errors.next_expiry_ms(now_ms), self.steps.next_expiry_ms(now_ms)
+            )
+        if first == _RATE_LIMIT:
+            horizon = min(horizon, self.events.next_expiry_ms(now_ms))
+        elif first == _CIRCUIT_BREAKER:
+            horizon = min(horizon, self.failures.next_expiry_ms(now_ms))
+        return horizon
+
+
+_ERROR_RATE = GUARD_INDEX["error_rate"]
+_RATE_LIMIT = GUARD_INDEX["rate_limit"]
+_CIRCUIT_BREAKER = GUARD_INDEX["circuit_breaker"]
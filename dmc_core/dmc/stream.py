@@ -0,0 +1,116 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC stream: modulate an unbounded iterable of raw events lazily, in chunks.
+
+Each raw event is a mapping with now_ms plus any GuardEvent field (events, steps,
+errors, failures, ops_deny_actions, ops_state, ops_cooldown_until_ms) and an optional
+"proposal". A success outcome is {"steps": 1}, an error {"steps": 1, "errors": 1}.
+Events update the GuardState of their key (key_fn(event)); events with a proposal are
+then decided at their now_ms. Nothing is materialized ahead of the consumer: memory is
+one chunk of decisions plus O(buckets) per key seen, or per key kept with max_keys (the
+least recently used key is evicted and starts over with an empty GuardState).
+
+INVARIANT 3: Events of a key are applied and decided in stream order.
+INVARIANT 4: An event that cannot be read or applied → its proposal fails closed.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+
+from decision_schema.types import FinalDecision, MismatchInfo
+
+from dmc_core.dmc.modulator import _fail_closed
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import DEFAULT_BUCKETS, GuardEvent, GuardState
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK = 1024
+
+# (position of the event in the stream, key, FinalDecision, MismatchInfo)
+StreamDecision = tuple[int, Hashable, FinalDecision, MismatchInfo]
+
+
+def modulate_stream(
+    events: Iterable[Mapping],
+    policy: GuardPolicy,
+    key_fn: Callable[[Mapping], Hashable] | None = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK,
+    buckets: int = DEFAULT_BUCKETS,
+    states: dict[Hashable, GuardState] | None = None,
+    max_keys: int | None = None,
+) -> Iterator[list[StreamDecision]]:
+    """
+    Yield lists of up to chunk_size decisions, one per event carrying a proposal.
+
+    key_fn=None puts every event under the key None. Pass states (key -> GuardState)
+    to continue from, and keep, the guard state of an earlier stream. chunk_size=1
+    yields each decision as soon as its event is read (for live queues).
+
+    max_keys bounds states for streams with unbounded key sets: a new key beyond it
+    evicts the least recently seen one. An evicted key loses its windows, cooldowns and
+    ops fields, so size max_keys above the number of keys active within the policy's
+    windows. None keeps every key.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if max_keys is not None and max_keys <= 0:
+        raise ValueError("max_keys must be positive")
+    if states is None:
+        states = {}
+    chunk: list[StreamDecision] = []
+    for position, raw in enumerate(events):
+        key = None
+        try:
+            if key_fn is not None:
+                key = key_fn(raw)
+            state = states.get(key)
+            if state is None:
+                if max_keys is not None and len(states) >= max_keys:
+                    del states[next(iter(states))]  # least recently seen
+                state = states[key] = GuardState(policy, buckets)
+            elif max_keys is not None:
+                states[key] = states.pop(key)  # dict order = recency
+            now_ms = _apply(state, raw)
+            proposal = raw.get("proposal")
+            if proposal is None:
+                continue
+            decision = state.modulate(proposal, now_ms)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("DMC modulate_stream exception, fail-closed: %s", type(e).__name__)
+            if not isinstance(raw, Mapping) or raw.get("proposal") is None:
+                continue
+            decision = (
+                _fail_closed(policy),
+                MismatchInfo(flags=["modulate_exception"], reason_codes=[type(e).__name__]),
+            )
+        chunk.append((position, key, decision[0], decision[1]))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _apply(state: GuardState, raw: Mapping) -> int:
+    """Apply raw's GuardEvent fields to state; returns its now_ms."""
+    get = raw.get
+    now_ms = raw["now_ms"]
+    state.apply(
+        GuardEvent(
+            now_ms=now_ms,
+            events=get("events", 0),
+            steps=get("steps", 0),
+            errors=get("errors", 0),
+            failures=get("failures", 0),
+            ops_deny_actions=get("ops_deny_actions"),
+            ops_state=get("ops_state"),
+            ops_cooldown_until_ms=get("ops_cooldown_until_ms"),
+        )
+    )
+    return now_ms
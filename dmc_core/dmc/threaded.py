@@ -0,0 +1,246 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC thread pool modulator: modulate across threads of one process without locks.
+
+Work is split into one job per shard and each shard's job runs on one pool thread at a
+time. A shard owns its keys' GuardStates (keys are assigned by keyed.shard_of) and its
+own decision counters, so threads never write shared objects. stats() merges the
+shard counters after the fact. modulate itself keeps no mutable state (the low_alloc
+shared results are read-only), so it needs no locking.
+
+Threads only add throughput on a free-threaded (no-GIL) CPython. With the GIL enabled
+threads=None means 1 and everything runs inline on the calling thread.
+
+INVARIANT 3: Every key's events and decisions keep input order; results are returned
+in input order, independent of thread count and scheduling.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Hashable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Self
+
+from decision_schema.types import FinalDecision, MismatchInfo, Proposal
+
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.guards_generic import REASON_CODES, REASON_ID
+from dmc_core.dmc.keyed import KeyedItem, _decide, shard_of
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import DEFAULT_BUCKETS, GuardState
+
+# Smallest range of a stateless batch worth a job of its own.
+DEFAULT_MIN_RANGE = 256
+
+Decision = tuple[FinalDecision, MismatchInfo]
+
+
+def gil_enabled() -> bool:
+    """False only on a free-threaded interpreter running without the GIL."""
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_enabled is None else is_enabled()
+
+
+def default_threads() -> int:
+    """os.cpu_count() on a free-threaded interpreter, else 1 (threads cannot help)."""
+    return 1 if gil_enabled() else os.cpu_count() or 1
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Decisions counted by all shards. reasons[i] = rows with ReasonCode i (0 = allowed)."""
+
+    decisions: int
+    exceptions: int
+    reasons: tuple[int, ...]
+
+    @property
+    def allowed(self) -> int:
+        return self.reasons[0]
+
+    def reason_counts(self) -> dict[str, int]:
+        """Non-zero counts by reason code string."""
+        return {REASON_CODES[i]: c for i, c in enumerate(self.reasons) if i and c}
+
+
+class _Shard:
+    """State touched by one job at a time: keyed GuardStates and decision counters."""
+
+    __slots__ = ("exceptions", "reasons", "states")
+
+    def __init__(self) -> None:
+        self.states: dict[Hashable, GuardState] = {}
+        self.reasons = [0] * len(REASON_CODES)
+        self.exceptions = 0
+
+    def count(self, decision: Decision) -> None:
+        final, mismatch = decision
+        if final.allowed:
+            self.reasons[0] += 1
+            return
+        codes = mismatch.reason_codes
+        reason = REASON_ID.get(codes[0]) if codes else None
+        if reason is None:  # fail-closed exception
+            self.exceptions += 1
+        else:
+            self.reasons[reason] += 1
+
+
+class ThreadPoolModulator:
+    """
+    modulate for stateless batches (modulate_many) and per-key GuardState items
+    (process, same semantics as KeyedModulator.process) on a pool of threads.
+
+    Calls are not reentrant: use one ThreadPoolModulator from one thread at a time;
+    the parallelism is inside each call. Close it (or use it as a context manager) to
+    stop the pool threads.
+    """
+
+    def __init__(
+        self,
+        policy: GuardPolicy,
+        threads: int | None = None,
+        *,
+        buckets: int = DEFAULT_BUCKETS,
+        min_range: int = DEFAULT_MIN_RANGE,
+    ) -> None:
+        threads = default_threads() if threads is None else threads
+        if threads <= 0 or min_range <= 0:
+            raise ValueError("threads and min_range must be positive")
+        self.policy = policy
+        self.threads = threads
+        self.buckets = buckets
+        self.min_range = min_range
+        self._shards = [_Shard() for _ in range(threads)]
+        self._pool: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut the pool threads down; a later call starts a new pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __len__(self) -> int:
+        return sum(len(s.states) for s in self._shards)
+
+    def state(self, key: Hashable) -> GuardState:
+        """GuardState for key (created on first use). Not while a call is running."""
+        states = self._shards[shard_of(key, self.threads)].states
+        state = states.get(key)
+        if state is None:
+            state = states[key] = GuardState(self.policy, self.buckets)
+        return state
+
+    def modulate_many(
+        self,
+        proposals: Sequence[Proposal],
+        contexts: Sequence[dict | GuardContext],
+    ) -> list[Decision]:
+        """[modulate(p, policy, c) for p, c in zip(proposals, contexts)], in contiguous ranges."""
+        n = len(proposals)
+        if len(contexts) != n:
+            raise ValueError("proposals and contexts differ in length")
+        parts = max(1, min(self.threads, n // self.min_range))
+        bounds = [n * j // parts for j in range(parts + 1)]
+        jobs = [
+            (_run_range, (shard, self.policy, proposals, contexts, lo, hi))
+            for shard, lo, hi in zip(self._shards, bounds, bounds[1:])
+        ]
+        results: list[Decision] = []
+        for out in self._run(jobs):
+            results.extend(out)
+        return results
+
+    def process(self, items: Iterable[KeyedItem]) -> list[Decision]:
+        """Apply each item's event to its key's state, then modulate; input order kept."""
+        if self.threads == 1:
+            return _run_keyed(self._shards[0], self.policy, self.buckets, items)
+        parts: list[list[KeyedItem]] = [[] for _ in range(self.threads)]
+        positions: list[list[int]] = [[] for _ in range(self.threads)]
+        count = 0
+        for item in items:
+            s = shard_of(item[0], self.threads)
+            parts[s].append(item)
+            positions[s].append(count)
+            count += 1
+        used = [s for s in range(self.threads) if parts[s]]
+        jobs = [(_run_keyed, (self._shards[s], self.policy, self.buckets, parts[s])) for s in used]
+        results: list = [None] * count
+        for s, out in zip(used, self._run(jobs)):
+            for i, decision in zip(positions[s], out):
+                results[i] = decision
+        return results
+
+    def stats(self) -> PoolStats:
+        """Merge the shard counters (since construction or reset_stats). Not during a call."""
+        reasons = [0] * len(REASON_CODES)
+        exceptions = 0
+        for shard in self._shards:
+            for i, c in enumerate(shard.reasons):
+                reasons[i] += c
+            exceptions += shard.exceptions
+        return PoolStats(
+            decisions=sum(reasons) + exceptions, exceptions=exceptions, reasons=tuple(reasons)
+        )
+
+    def reset_stats(self) -> None:
+        for shard in self._shards:
+            shard.reasons = [0] * len(REASON_CODES)
+            shard.exceptions = 0
+
+    def _run(self, jobs: list) -> list:
+        """Run (fn, args) jobs; outputs in job order. One job (or one thread) runs inline."""
+        if len(jobs) <= 1 or self.threads == 1:
+            return [fn(*args) for fn, args in jobs]
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.threads, thread_name_prefix="dmc-modulate")
+        futures = [self._pool.submit(fn, *args) for fn, args in jobs]
+        return [f.result() for f in futures]
+
+
+def _run_range(
+    shard: _Shard,
+    policy: GuardPolicy,
+    proposals: Sequence[Proposal],
+    contexts: Sequence[dict | GuardContext],
+    lo: int,
+    hi: int,
+) -> list[Decision]:
+    count = shard.count
+    out = []
+    for i in range(lo, hi):
+        decision = modulate(proposals[i], policy, contexts[i])
+        count(decision)
+        out.append(decision)
+    return out
+
+
+def _run_keyed(
+    shard: _Shard,
+    policy: GuardPolicy,
+    buckets: int,
+    items: Iterable[KeyedItem],
+) -> list[Decision]:
+    states = shard.states
+    count = shard.count
+    out = []
+    for key, proposal, event in items:
+        state = states.get(key)
+        if state is None:
+            state = states[key] = GuardState(policy, buckets)
+        decision = _decide(state, proposal, event)
+        count(decision)
+        out.append(decision)
+    return out
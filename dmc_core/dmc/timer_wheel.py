@@ -0,0 +1,183 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC timer wheel: per-key deadlines (cooldown ends, decision horizons) that fire in
+O(expired) time instead of scanning every key per tick.
+
+Hierarchical wheel: `levels` wheels of 2**bits slots; a slot at level l spans
+2**(bits*l) ticks of tick_ms. A deadline is stored at the lowest level whose block
+also contains the current tick and cascades one level down each time the wheel
+reaches its slot; deadlines beyond the top level wait in an overflow list. Each key
+has at most one deadline: rescheduling or discard() leaves the old entry behind,
+and it is dropped when reached (lazy deletion). advance() jumps straight to the next
+non-empty slot, so idle gaps cost O(levels x slots), not O(ticks).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+
+from dmc_core.dmc.policy import GuardPolicy
+
+Entry = tuple[int, Hashable]  # (deadline_ms, key)
+
+
+class TimerWheel:
+    """
+    Deadlines in ms per key; advance(now_ms) returns the keys whose deadline <= now_ms.
+
+    A cooldown guard fails while now_ms < cooldown_until_ms, so a key scheduled at its
+    cooldown_until_ms (or ops_cooldown_until_ms, or horizon.next_change_ms) fires on
+    the first advance at which its guard passes. Keys fire in tick order. on_expire,
+    if given, is called as on_expire(key, deadline_ms) for each fired key. Not
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        now_ms: int = 0,
+        *,
+        tick_ms: int = 1,
+        bits: int = 8,
+        levels: int = 4,
+        on_expire: Callable[[Hashable, int], object] | None = None,
+    ) -> None:
+        if tick_ms <= 0 or bits <= 0 or levels <= 0:
+            raise ValueError("tick_ms, bits and levels must be positive")
+        self.tick_ms = tick_ms
+        self.on_expire = on_expire
+        self._bits = bits
+        self._last_slot = (1 << bits) - 1
+        self._levels = levels
+        self._wheels: list[list[list[Entry]]] = [
+            [[] for _ in range(1 << bits)] for _ in range(levels)
+        ]
+        self._level_counts = [0] * (levels + 1)  # last = overflow; includes stale entries
+        self._overflow: list[Entry] = []
+        self._deadlines: dict[Hashable, int] = {}
+        self._tick = now_ms // tick_ms
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def deadline(self, key: Hashable) -> int | None:
+        """Scheduled deadline of key, or None."""
+        return self._deadlines.get(key)
+
+    def schedule(self, key: Hashable, deadline_ms: int) -> None:
+        """Set key's deadline (replacing any previous one); past deadlines fire next advance."""
+        self._deadlines[key] = deadline_ms
+        self._insert((deadline_ms, key))
+
+    def discard(self, key: Hashable) -> bool:
+        """Remove key's deadline; False if it had none."""
+        return self._deadlines.pop(key, None) is not None
+
+    def arm_cooldown(self, key: Hashable, now_ms: int, policy: GuardPolicy) -> int:
+        """
+        Schedule key at now_ms + policy.cooldown_ms, never shortening a later deadline
+        (same rule as GuardState.arm_cooldown). Returns the key's deadline.
+        """
+        until = now_ms + policy.cooldown_ms
+        current = self._deadlines.get(key)
+        if current is not None and current >= until:
+            return current
+        self.schedule(key, until)
+        return until
+
+    def advance(self, now_ms: int) -> list[Hashable]:
+        """Move time to now_ms; remove and return the keys whose deadline <= now_ms."""
+        fired: list[Hashable] = []
+        target = now_ms // self.tick_ms
+        self._fire_slot(now_ms, fired)
+        last_slot = self._last_slot
+        while self._tick < target:
+            tick = self._next_tick()
+            if tick is None or tick > target:
+                self._tick = target
+                break
+            self._tick = tick
+            if not tick & last_slot:
+                self._cascade()
+            self._fire_slot(now_ms, fired)
+        return fired
+
+    # -- internals ---------------------------------------------------------------
+
+    def _next_tick(self) -> int | None:
+        """Next tick with work: a non-empty slot of the lowest non-empty level."""
+        tick = self._tick
+        bits = self._bits
+        last_slot = self._last_slot
+        for level, count in enumerate(self._level_counts):
+            if not count:
+                continue
+            if level == self._levels:
+                span = bits * level
+                first = min(deadline // self.tick_ms for deadline, _ in self._overflow)
+                return max(first >> span, (tick >> span) + 1) << span
+            slots = self._wheels[level]
+            for j in range(((tick >> (bits * level)) & last_slot) + 1, last_slot + 1):
+                if slots[j]:
+                    return ((tick >> (bits * (level + 1))) << (bits * (level + 1))) | (
+                        j << (bits * level)
+                    )
+        return None
+
+    def _insert(self, entry: Entry) -> None:
+        tick = self._tick
+        due = max(entry[0] // self.tick_ms, tick)
+        bits = self._bits
+        for level in range(self._levels):
+            if due >> (bits * (level + 1)) == tick >> (bits * (level + 1)):
+                slot = (due >> (bits * level)) & self._last_slot
+                self._wheels[level][slot].append(entry)
+                self._level_counts[level] += 1
+                return
+        self._overflow.append(entry)
+        self._level_counts[self._levels] += 1
+
+    def _cascade(self) -> None:
+        """At a level-0 wrap: move the now-current slot of each higher level down."""
+        tick = self._tick
+        bits = self._bits
+        for level in range(1, self._levels + 1):
+            if level == self._levels:
+                entries, self._overflow = self._overflow, []
+            else:
+                slot = (tick >> (bits * level)) & self._last_slot
+                entries = self._wheels[level][slot]
+                self._wheels[level][slot] = []
+            self._level_counts[level] -= len(entries)
+            deadlines = self._deadlines
+            for entry in entries:
+                if deadlines.get(entry[1]) == entry[0]:
+                    self._insert(entry)
+            if (tick >> (bits * level)) & self._last_slot:
+                break
+
+    def _fire_slot(self, now_ms: int, fired: list[Hashable]) -> None:
+        slot_index = self._tick & self._last_slot
+        entries = self._wheels[0][slot_index]
+        if not entries:
+            return
+        keep: list[Entry] = []
+        deadlines = self._deadlines
+        on_expire = self.on_expire
+        for entry in entries:
+            deadline, key = entry
+            if deadlines.get(key) != deadline:
+                continue  # rescheduled or discarded
+            if deadline > now_ms:
+                keep.append(entry)
+                continue
+            del deadlines[key]
+            fired.append(key)
+            if on_expire is not None:
+                on_expire(key, deadline)
+        self._level_counts[0] -= len(entries) - len(keep)
+        self._wheels[0][slot_index] = keep
@@ -0,0 +1,46 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC journal: fixed-width binary audit log of modulate results.
+
+The reader (NumPy structured arrays) is loaded on first access and needs numpy.
+"""
+
+from dmc_core.journal.format import GUARD_EXCEPTION, GUARD_PASS, REASON_OTHER, key_hash
+from dmc_core.journal.writer import DecisionJournal, encode
+
+_LAZY: dict[str, str] = {
+    "JournalSegment": "dmc_core.journal.reader",
+    "RECORD_DTYPE": "dmc_core.journal.reader",
+    "iter_segments": "dmc_core.journal.reader",
+    "read_journal": "dmc_core.journal.reader",
+}
+
+__all__ = [
+    "GUARD_EXCEPTION",
+    "GUARD_PASS",
+    "REASON_OTHER",
+    "RECORD_DTYPE",
+    "DecisionJournal",
+    "JournalSegment",
+    "encode",
+    "iter_segments",
+    "key_hash",
+    "read_journal",
+]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
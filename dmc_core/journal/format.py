@@ -0,0 +1,78 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC journal format: fixed-width little-endian records in segment files.
+
+Segment layout: 256-byte header, then `capacity` records of RECORD_SIZE bytes.
+Only the first `count` records (header field, updated on commit) are valid.
+
+Record (24 bytes): ts_ms int64, key_hash uint64, action uint8 (index into the header's
+action table), allowed uint8, guard int8 (GUARD_ORDER index, GUARD_PASS or
+GUARD_EXCEPTION), reason int8 (REASON_CODES index, REASON_OTHER if not a guard code),
+4 reserved bytes.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import struct
+from collections.abc import Hashable
+
+MAGIC = b"DMCJRNL1"
+VERSION = 1
+
+RECORD = struct.Struct("<qQBBbb4x")
+RECORD_SIZE = RECORD.size
+
+# magic, version, record_size, reserved, capacity, count; action table follows
+HEADER = struct.Struct("<8sHHIQQ")
+HEADER_SIZE = 256
+COUNT_OFFSET = 24
+ACTIONS_OFFSET = HEADER.size
+ACTIONS_SIZE = HEADER_SIZE - HEADER.size
+
+GUARD_PASS = -1
+GUARD_EXCEPTION = -2  # modulate_exception / any non-guard flag (fail-closed)
+REASON_OTHER = -1
+
+SEGMENT_GLOB = "journal-*.dmcj"
+
+
+def segment_name(seq: int) -> str:
+    return f"journal-{seq:08d}.dmcj"
+
+
+def key_hash(key: Hashable | None) -> int:
+    """Stable 64-bit hash of repr(key) (same in every process); None -> 0."""
+    if key is None:
+        return 0
+    return _repr_hash(repr(key))
+
+
+# Cached on the repr itself: keys that compare equal (1, True, 1.0) hash differently.
+@functools.lru_cache(maxsize=1 << 16)
+def _repr_hash(text: str) -> int:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def pack_header(capacity: int, count: int, actions: tuple[str, ...]) -> bytes:
+    table = ",".join(actions).encode("utf-8")
+    if len(table) > ACTIONS_SIZE:
+        raise ValueError("action table does not fit in the segment header")
+    return HEADER.pack(MAGIC, VERSION, RECORD_SIZE, 0, capacity, count) + table.ljust(
+        ACTIONS_SIZE, b"\0"
+    )
+
+
+def unpack_header(data: bytes) -> tuple[int, int, tuple[str, ...]]:
+    """(capacity, count, actions) from the first HEADER_SIZE bytes of a segment."""
+    if len(data) < HEADER_SIZE:
+        raise ValueError("truncated journal header")
+    magic, version, record_size, _, capacity, count = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+        raise ValueError(f"not a DMC journal segment (magic={magic!r}, version={version})")
+    table = bytes(data[ACTIONS_OFFSET:HEADER_SIZE]).rstrip(b"\0").decode("utf-8")
+    return capacity, min(count, capacity), tuple(table.split(",")) if table else ()
@@ -0,0 +1,80 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC journal reader: segments as NumPy structured arrays (zero-copy, requires numpy).
+
+Each segment is memory-mapped read-only; `records` is a view of its committed records,
+so scanning a journal never copies or parses it in Python.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from dmc_core.dmc.guards_generic import REASON_CODES
+from dmc_core.journal.format import HEADER_SIZE, RECORD_SIZE, SEGMENT_GLOB, unpack_header
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("ts_ms", "<i8"),
+        ("key_hash", "<u8"),
+        ("action", "u1"),
+        ("allowed", "u1"),
+        ("guard", "i1"),
+        ("reason", "i1"),
+        ("reserved", "V4"),
+    ]
+)
+assert RECORD_DTYPE.itemsize == RECORD_SIZE
+
+
+class JournalSegment:
+    """One segment file: `records` (structured array) and its action table."""
+
+    __slots__ = ("actions", "path", "records")
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            _, count, self.actions = unpack_header(f.read(HEADER_SIZE))
+        if count == 0:
+            self.records = np.empty(0, dtype=RECORD_DTYPE)
+        else:
+            self.records = np.memmap(
+                self.path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,)
+            )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def action_names(self) -> np.ndarray:
+        """Action value per record (object array; allocates)."""
+        return np.asarray(self.actions, dtype=object)[self.records["action"]]
+
+    def reason_names(self) -> np.ndarray:
+        """Reason code per record ("" = allowed, "other" = exception / unknown)."""
+        table = np.asarray(list(REASON_CODES) + ["other"], dtype=object)
+        return table[self.records["reason"]]  # REASON_OTHER (-1) indexes the last entry
+
+
+def segment_paths(directory: str | os.PathLike) -> list[Path]:
+    return sorted(Path(directory).glob(SEGMENT_GLOB))
+
+
+def iter_segments(directory: str | os.PathLike) -> Iterator[JournalSegment]:
+    """Segments of a journal directory in write order."""
+    for path in segment_paths(directory):
+        yield JournalSegment(path)
+
+
+def read_journal(directory: str | os.PathLike) -> np.ndarray:
+    """All committed records concatenated (copies; use iter_segments for large journals)."""
+    parts = [s.records for s in iter_segments(directory)]
+    if not parts:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.concatenate(parts)
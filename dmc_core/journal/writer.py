@@ -0,0 +1,159 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC journal writer: append-only, memory-mapped, segment-rotated decision log.
+
+Records are packed straight into the mapped segment; the header count (what readers
+see) is published every `group_commit` records, on commit() and on close(). With
+sync=True each commit also flushes the mapping to disk (msync), so durability is paid
+once per group, not per decision.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Self
+
+from decision_schema.types import Action, FinalDecision, MismatchInfo
+
+from dmc_core.dmc.guards_generic import GUARD_ID, REASON_ID
+from dmc_core.journal.format import (
+    COUNT_OFFSET,
+    GUARD_EXCEPTION,
+    GUARD_PASS,
+    HEADER_SIZE,
+    REASON_OTHER,
+    RECORD,
+    RECORD_SIZE,
+    SEGMENT_GLOB,
+    key_hash,
+    pack_header,
+    segment_name,
+)
+
+ACTIONS: tuple[str, ...] = tuple(a.value for a in Action)
+_ACTION_ID = {a: i for i, a in enumerate(Action)}
+
+
+def encode(final: FinalDecision, mismatch: MismatchInfo) -> tuple[int, int, int, int]:
+    """(action, allowed, guard, reason) record fields for one modulate result."""
+    if final.allowed:
+        guard, reason = GUARD_PASS, 0
+    else:
+        flags = mismatch.flags
+        guard = GUARD_ID.get(flags[0], GUARD_EXCEPTION) if flags else GUARD_EXCEPTION
+        codes = mismatch.reason_codes
+        reason = REASON_ID.get(codes[0], REASON_OTHER) if codes else REASON_OTHER
+    return _ACTION_ID[final.action], 1 if final.allowed else 0, guard, reason
+
+
+class DecisionJournal:
+    """
+    Append modulate results to `directory` as journal-NNNNNNNN.dmcj segments.
+
+    A new journal always starts a new segment after the highest existing one. Not
+    thread-safe: use one journal per writer thread (or per KeyedModulator shard).
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        *,
+        segment_records: int = 1 << 20,
+        group_commit: int = 4096,
+        sync: bool = False,
+    ) -> None:
+        if segment_records <= 0 or group_commit <= 0:
+            raise ValueError("segment_records and group_commit must be positive")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_records = segment_records
+        self.group_commit = group_commit
+        self.sync = sync
+        existing = sorted(self.directory.glob(SEGMENT_GLOB))
+        self._seq = int(existing[-1].stem.split("-")[1]) + 1 if existing else 0
+        self._file = None
+        self._map: mmap.mmap | None = None
+        self._count = 0
+        self._committed = 0
+        self.records = 0
+        self._open_segment()
+
+    @property
+    def segment_path(self) -> Path:
+        return self.directory / segment_name(self._seq)
+
+    def _open_segment(self) -> None:
+        size = HEADER_SIZE + self.segment_records * RECORD_SIZE
+        f = open(self.segment_path, "w+b")  # noqa: SIM115
+        f.truncate(size)
+        self._file = f
+        self._map = mmap.mmap(f.fileno(), size)
+        self._map[:HEADER_SIZE] = pack_header(self.segment_records, 0, ACTIONS)
+        self._count = 0
+        self._committed = 0
+
+    def _close_segment(self) -> None:
+        self.commit()
+        self._map.close()
+        self._file.close()
+        self._map = None
+        self._file = None
+
+    def append(
+        self,
+        now_ms: int,
+        final: FinalDecision,
+        mismatch: MismatchInfo,
+        key: Hashable | None = None,
+    ) -> None:
+        """Record one modulate result (key is hashed with key_hash)."""
+        self.append_encoded(now_ms, key_hash(key), *encode(final, mismatch))
+
+    def append_encoded(
+        self, now_ms: int, key_hash_: int, action: int, allowed: int, guard: int, reason: int
+    ) -> None:
+        """Record pre-encoded fields (see encode); the cheapest append."""
+        if self._map is None:
+            raise ValueError("journal is closed")
+        if self._count == self.segment_records:
+            self._close_segment()
+            self._seq += 1
+            self._open_segment()
+        RECORD.pack_into(
+            self._map,
+            HEADER_SIZE + self._count * RECORD_SIZE,
+            now_ms,
+            key_hash_,
+            action,
+            allowed,
+            guard,
+            reason,
+        )
+        self._count += 1
+        self.records += 1
+        if self._count - self._committed >= self.group_commit:
+            self.commit()
+
+    def commit(self) -> None:
+        """Publish appended records to readers (and flush to disk if sync=True)."""
+        if self._map is None or self._count == self._committed:
+            return
+        self._map[COUNT_OFFSET : COUNT_OFFSET + 8] = self._count.to_bytes(8, "little")
+        if self.sync:
+            self._map.flush()
+        self._committed = self._count
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._close_segment()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
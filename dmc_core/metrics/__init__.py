@@ -5,4 +5,18 @@
 
 # Core does not export domain metrics. See docs/examples/example_domain_legacy_v0/metrics.py for reference.
 
-__all__: list[str] = []
+from dmc_core.metrics.instrumentation import (
+    Instrumentation,
+    LatencyHistogram,
+    MetricsSnapshot,
+    disable,
+    enable,
+)
+
+__all__: list[str] = [
+    "Instrumentation",
+    "LatencyHistogram",
+    "MetricsSnapshot",
+    "disable",
+    "enable",
+]
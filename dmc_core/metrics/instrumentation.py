@@ -0,0 +1,234 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+Hot-path instrumentation for modulate: per-guard / per-reason counters and latency.
+
+Each thread records into its own shard (no locks on the hot path); snapshot() merges
+shards into a MetricsSnapshot, which can itself be merged across processes. When not
+enabled, modulate pays a single `is not None` check.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+
+from dmc_core.dmc.guards_generic import GUARD_ORDER, REASON_CODES, REASON_GUARD
+
+# Log-linear buckets (HDR-style): 16 sub-buckets per power of two, values in ns.
+# Relative bucket width <= 1/16 (6.25%); the top bucket starts at 31 * 2**36 ns (~2**41,
+# ~36 min) and also counts every larger value.
+_SUB_BITS = 4
+_SUB = 1 << _SUB_BITS
+_MAX_SHIFT = 36
+HISTOGRAM_BUCKETS = (_MAX_SHIFT + 2) * _SUB
+
+
+def bucket_index(value: int) -> int:
+    """Histogram bucket for a non-negative value."""
+    if value < 2 * _SUB:
+        return max(value, 0)
+    shift = value.bit_length() - _SUB_BITS - 1
+    if shift > _MAX_SHIFT:
+        return HISTOGRAM_BUCKETS - 1
+    return (shift + 1) * _SUB + (value >> shift) - _SUB
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """Inclusive (low, high) values of a bucket."""
+    if index < 2 * _SUB:
+        return index, index
+    shift = index // _SUB - 1
+    sub = index % _SUB + _SUB
+    return sub << shift, ((sub + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram; record is O(1), memory is HISTOGRAM_BUCKETS counters."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self, counts: list[int] | None = None) -> None:
+        self.counts = counts if counts is not None else [0] * HISTOGRAM_BUCKETS
+
+    def record(self, value_ns: int) -> None:
+        self.counts[bucket_index(value_ns)] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def merge(self, other: LatencyHistogram) -> LatencyHistogram:
+        return LatencyHistogram([a + b for a, b in zip(self.counts, other.counts)])
+
+    def quantile(self, q: float) -> int:
+        """Upper bound of the bucket holding quantile q (0..1); 0 if empty."""
+        total = self.total
+        if total == 0:
+            return 0
+        rank = max(1, int(q * total + 0.5))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return bucket_bounds(i)[1]
+        return bucket_bounds(HISTOGRAM_BUCKETS - 1)[1]
+
+
+@dataclass
+class MetricsSnapshot:
+    """Merged counters: decisions, allowed, exceptions, per-guard and per-reason counts."""
+
+    decisions: int = 0
+    allowed: int = 0
+    exceptions: int = 0
+    guard_triggers: dict[str, int] = field(default_factory=dict)
+    reason_codes: dict[str, int] = field(default_factory=dict)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def merge(self, other: MetricsSnapshot) -> MetricsSnapshot:
+        return MetricsSnapshot(
+            decisions=self.decisions + other.decisions,
+            allowed=self.allowed + other.allowed,
+            exceptions=self.exceptions + other.exceptions,
+            guard_triggers=_add_counts(self.guard_triggers, other.guard_triggers),
+            reason_codes=_add_counts(self.reason_codes, other.reason_codes),
+            latency=self.latency.merge(other.latency),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "decisions": self.decisions,
+            "allowed": self.allowed,
+            "exceptions": self.exceptions,
+            "guard_triggers": dict(self.guard_triggers),
+            "reason_codes": dict(self.reason_codes),
+            "latency_ns": {
+                "p50": self.latency.quantile(0.5),
+                "p90": self.latency.quantile(0.9),
+                "p99": self.latency.quantile(0.99),
+                "p999": self.latency.quantile(0.999),
+            },
+        }
+
+
+def _add_counts(a: dict[str, int], b: dict[str, int]) -> dict[str, int]:
+    out = dict(a)
+    for k, v in b.items():
+        out[k] = out.get(k, 0) + v
+    return out
+
+
+class _Shard:
+    """Counters owned by one thread (None: retired shards). Index 0 of reasons = allowed."""
+
+    __slots__ = ("exceptions", "histogram", "reasons", "thread")
+
+    def __init__(self, thread: threading.Thread | None = None) -> None:
+        self.reasons = [0] * len(REASON_CODES)
+        self.exceptions: dict[str, int] = {}
+        self.histogram = LatencyHistogram()
+        self.thread = thread
+
+    def absorb(self, other: _Shard) -> None:
+        """Add the counts of another shard whose thread no longer records."""
+        for i, c in enumerate(other.reasons):
+            self.reasons[i] += c
+        self.exceptions = _add_counts(self.exceptions, other.exceptions)
+        self.histogram = self.histogram.merge(other.histogram)
+
+
+class Instrumentation:
+    """
+    Recorder installed into modulate via enable().
+
+    record() runs on the caller's thread and touches only that thread's shard.
+    snapshot() reads all shards; counts recorded concurrently may land in the next one.
+    Shards of threads that have exited are folded into one retired shard on snapshot, so
+    short-lived threads do not grow the shard list.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._retired = _Shard()
+        self._lock = threading.Lock()  # shard registration and retirement only
+
+    def _shard(self) -> _Shard:
+        shard = _Shard(threading.current_thread())
+        self._local.shard = shard
+        with self._lock:
+            self._shards.append(shard)
+        return shard
+
+    def record(self, reason_id: int, exception: str | None, elapsed_ns: int) -> None:
+        """reason_id = ReasonCode (0 = allowed); exception = exception type name (fail-closed)."""
+        shard = getattr(self._local, "shard", None) or self._shard()
+        if exception is not None:
+            shard.exceptions[exception] = shard.exceptions.get(exception, 0) + 1
+        else:
+            shard.reasons[reason_id] += 1
+        shard.histogram.record(elapsed_ns)
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            live = [shard for shard in self._shards if shard.thread.is_alive()]
+            if len(live) < len(self._shards):
+                # exited threads record no more: fold them into a new retired shard
+                # (a concurrent snapshot may still be reading the current one)
+                retired = _Shard()
+                for shard in (self._retired, *(s for s in self._shards if s not in live)):
+                    retired.absorb(shard)
+                self._retired = retired
+                self._shards = live
+            shards = [self._retired, *live]
+        reasons = [0] * len(REASON_CODES)
+        exceptions: dict[str, int] = {}
+        latency = LatencyHistogram()
+        for shard in shards:
+            for i, c in enumerate(shard.reasons):
+                reasons[i] += c
+            exceptions = _add_counts(exceptions, shard.exceptions)
+            latency = latency.merge(shard.histogram)
+        guard_triggers: dict[str, int] = {}
+        reason_codes: dict[str, int] = {}
+        for i in range(1, len(REASON_CODES)):
+            if reasons[i]:
+                guard = GUARD_ORDER[REASON_GUARD[i]]
+                guard_triggers[guard] = guard_triggers.get(guard, 0) + reasons[i]
+                reason_codes[REASON_CODES[i]] = reasons[i]
+        n_exceptions = sum(exceptions.values())
+        if n_exceptions:
+            guard_triggers["modulate_exception"] = n_exceptions
+            reason_codes = _add_counts(reason_codes, exceptions)
+        return MetricsSnapshot(
+            decisions=sum(reasons) + n_exceptions,
+            allowed=reasons[0],
+            exceptions=n_exceptions,
+            guard_triggers=guard_triggers,
+            reason_codes=reason_codes,
+            latency=latency,
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shards = []
+            self._retired = _Shard()
+        self._local = threading.local()
+
+
+def enable(instrumentation: Instrumentation | None = None) -> Instrumentation:
+    """Install instrumentation into modulate (replaces any previous one)."""
+    from dmc_core.dmc import modulator
+
+    instrumentation = instrumentation or Instrumentation()
+    modulator.set_recorder(instrumentation)
+    return instrumentation
+
+
+def disable() -> None:
+    """Remove instrumentation; modulate returns to the single None check."""
+    from dmc_core.dmc import modulator
+
+    modulator.set_recorder(None)
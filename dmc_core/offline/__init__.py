@@ -0,0 +1,37 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC offline analysis: context recordings, policy replay and sweeps, parallel batches,
+columnar (structured array / Arrow) decisions (requires numpy; Arrow input: pyarrow).
+"""
+
+from dmc_core.offline.columnar import modulate_columnar
+from dmc_core.offline.parallel import modulate_parallel
+from dmc_core.offline.recording import (
+    CONTEXT_DTYPE,
+    ContextRecorder,
+    iter_chunks,
+    open_recording,
+    write_contexts,
+)
+from dmc_core.offline.replay import PolicyDiff, PolicyOutcome, ReplayReport, replay
+from dmc_core.offline.sweep import SweepResult, grid, random_policies, sweep
+
+__all__ = [
+    "CONTEXT_DTYPE",
+    "ContextRecorder",
+    "PolicyDiff",
+    "PolicyOutcome",
+    "ReplayReport",
+    "SweepResult",
+    "grid",
+    "iter_chunks",
+    "modulate_columnar",
+    "modulate_parallel",
+    "open_recording",
+    "random_policies",
+    "replay",
+    "sweep",
+    "write_contexts",
+]
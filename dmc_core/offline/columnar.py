@@ -0,0 +1,186 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC columnar adapter: decide NumPy structured arrays or Arrow record batches whose field
+names are the generic context keys, and return the decisions as columns.
+
+Context fields are read as arrays (Arrow columns through pyarrow.compute and zero-copy
+to_numpy where possible) and evaluated with the modulate_batch kernel; no per-row
+Python object is built. Output columns:
+  allowed  bool
+  action   proposal action where allowed, else policy.fail_closed_action (strings)
+  guard    int8 index into GUARD_ORDER of the first failing guard (GUARD_PASS /
+           GUARD_EXCEPTION otherwise)
+  reason   int8 index into REASON_CODES
+Missing fields take modulate's defaults and other fields are ignored. Arrow nulls follow
+GuardContextBatch: null optional timestamps are unset, null ops fields do not deny; nulls
+elsewhere (last_event_ts_ms included, as None in a dict) fail the batch closed. Arrow input needs
+pyarrow (optional extra: dmc-core[arrow]).
+
+INVARIANT 4: Any exception → every row of the batch (each record batch of an Arrow
+Table) fail-closed: allowed=False, guard=GUARD_EXCEPTION.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+from decision_schema.types import Action
+
+from dmc_core.dmc.batch import _REASON_GUARD, GUARD_EXCEPTION, UNSET, _reason_ids
+from dmc_core.dmc.context import CONTEXT_KEYS
+from dmc_core.dmc.modulator import _fail_closed
+from dmc_core.dmc.policy import GuardPolicy
+
+logger = logging.getLogger(__name__)
+
+RESULT_FIELDS: tuple[str, ...] = ("allowed", "action", "guard", "reason")
+
+_OPTIONAL_TS = ("ops_cooldown_until_ms", "cooldown_until_ms")
+
+
+def modulate_columnar(data, policy: GuardPolicy, action: object = None):
+    """
+    Decide every row of data: a NumPy structured array (result: structured array with
+    RESULT_FIELDS) or a pyarrow RecordBatch / Table (result: the same Arrow type).
+
+    action is the proposal action per row: an Action or str for all rows, an array, or
+    None to read data's "action" field.
+    """
+    if isinstance(data, np.ndarray):
+        return _modulate_records(data, policy, action)
+    import pyarrow as pa
+
+    if isinstance(data, pa.Table):
+        return pa.Table.from_batches(
+            [_modulate_arrow(batch, policy, action) for batch in data.to_batches()],
+            schema=_result_schema(),
+        )
+    return _modulate_arrow(data, policy, action)
+
+
+def _modulate_records(records: np.ndarray, policy: GuardPolicy, action: object) -> np.ndarray:
+    names = records.dtype.names or ()
+    if action is None:
+        action = _required_action(names, lambda: records["action"])
+    actions = _action_array(action)
+    n = len(records)
+    allowed, guard, reason = _decide(
+        policy, lambda: {key: records[key] for key in CONTEXT_KEYS if key in names}, n
+    )
+    fail_action = _fail_closed(policy).action.value
+    width = max(actions.dtype.itemsize // 4, len(fail_action), 1)
+    out = np.empty(
+        n, dtype=[("allowed", "?"), ("action", f"<U{width}"), ("guard", "i1"), ("reason", "i1")]
+    )
+    out["allowed"] = allowed
+    out["action"] = np.where(allowed, actions, fail_action)
+    out["guard"] = guard
+    out["reason"] = reason
+    return out
+
+
+def _modulate_arrow(batch, policy: GuardPolicy, action: object):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    names = batch.schema.names
+    if action is None:
+        action = _required_action(names, lambda: batch.column("action"))
+    allowed, guard, reason = _decide(policy, lambda: _arrow_columns(batch, names), batch.num_rows)
+    allowed_arrow = pa.array(allowed)
+    if isinstance(action, (pa.Array, pa.ChunkedArray)):
+        if pa.types.is_dictionary(action.type):
+            action = action.cast(action.type.value_type)
+    elif isinstance(action, (str, Action)):
+        action = pa.scalar(getattr(action, "value", action), pa.string())
+    else:
+        action = pa.array(_action_array(action))
+    action_out = pc.if_else(
+        allowed_arrow, action, pa.scalar(_fail_closed(policy).action.value, pa.string())
+    )
+    if isinstance(action_out, pa.ChunkedArray):
+        action_out = action_out.combine_chunks()
+    return pa.RecordBatch.from_arrays(
+        [allowed_arrow, action_out.cast(pa.string()), pa.array(guard), pa.array(reason)],
+        schema=_result_schema(),
+    )
+
+
+def _arrow_columns(batch, names) -> dict[str, np.ndarray]:
+    """Arrow columns -> modulate_batch columns, with nulls resolved as documented."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns: dict[str, np.ndarray] = {}
+    for key in CONTEXT_KEYS:
+        if key not in names:
+            continue
+        col = batch.column(key)
+        if pa.types.is_timestamp(col.type) and col.type.unit == "ms":
+            col = col.cast(pa.int64())
+        if key == "ops_deny_actions":
+            if not pa.types.is_boolean(col.type):
+                raise TypeError(f"column {key!r} must be boolean, got {col.type}")
+            columns[key] = pc.coalesce(col, False).to_numpy(zero_copy_only=False)
+        elif key == "ops_state":
+            if pa.types.is_dictionary(col.type):
+                col = col.cast(col.type.value_type)
+            red = pc.coalesce(pc.equal(col, "RED"), False).to_numpy(zero_copy_only=False)
+            columns[key] = np.where(red, "RED", "")
+        elif col.null_count == 0:
+            columns[key] = col.to_numpy(zero_copy_only=False)
+        elif key in _OPTIONAL_TS:
+            columns[key] = pc.coalesce(col.cast(pa.int64()), UNSET).to_numpy()
+        else:
+            raise ValueError(f"column {key!r} has {col.null_count} nulls")
+    return columns
+
+
+def _decide(policy: GuardPolicy, read_columns, n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(allowed, guard, reason) arrays; every row fail-closed if reading or the kernel raises."""
+    try:
+        reason = _reason_ids(policy, read_columns(), n)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("DMC modulate_columnar exception, fail-closed: %s", type(e).__name__)
+        return (
+            np.zeros(n, dtype=bool),
+            np.full(n, GUARD_EXCEPTION, dtype=np.int8),
+            np.zeros(n, dtype=np.int8),
+        )
+    return reason == 0, _REASON_GUARD[reason], reason
+
+
+def _required_action(names, read):
+    if "action" not in names:
+        raise ValueError("no proposal action: pass action= or provide an 'action' field")
+    return read()
+
+
+def _action_array(action: object) -> np.ndarray:
+    """Proposal actions as a str (kind U) array or 0-d array."""
+    if isinstance(action, (str, Action)):
+        return np.asarray(getattr(action, "value", action))
+    arr = np.asarray(action)
+    if arr.dtype.kind == "S":
+        return arr.astype("U")
+    if arr.dtype.kind == "O":  # Action members or str objects
+        return np.array([getattr(a, "value", a) for a in arr.ravel()], dtype="U")
+    if arr.dtype.kind != "U":
+        raise TypeError(f"action must be strings or Action, got dtype {arr.dtype}")
+    return arr
+
+
+def _result_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("allowed", pa.bool_()),
+            ("action", pa.string()),
+            ("guard", pa.int8()),
+            ("reason", pa.int8()),
+        ]
+    )
@@ -0,0 +1,99 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC offline kernel: guard evaluation split into policy-independent row features and a
+cheap per-policy threshold step (requires numpy).
+
+Features are computed once per chunk; reason_ids can then be evaluated for any number
+of policies. Thresholds may be scalars (one policy) or column vectors of shape (P, 1)
+(P policies, broadcast against the rows). Results equal modulate_batch's reason ids.
+
+INVARIANT 3: Reason resolution follows GUARD_ORDER (first failing guard wins).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import NamedTuple
+
+import numpy as np
+
+from dmc_core.dmc.batch import (
+    _num_column,
+    _numeric,
+    _optional_ts_column,
+    _red_column,
+    _true_column,
+)
+from dmc_core.dmc.policy import GuardPolicy
+
+# Policy fields the guards read (all others are ignored offline).
+THRESHOLD_FIELDS: tuple[str, ...] = (
+    "staleness_ms",
+    "max_error_rate",
+    "rate_limit_events_max",
+    "circuit_breaker_failures",
+)
+
+
+class GuardFeatures(NamedTuple):
+    """Per-row inputs of the threshold guards plus the policy-independent outcomes."""
+
+    fixed_reason: np.ndarray  # int8: ops_health reason id (1..3), cooldown (8) or 0
+    age_ms: np.ndarray  # now_ms - last_event_ts_ms
+    error_rate: np.ndarray  # errors / steps; -inf when steps <= 0 (guard passes)
+    rate_limit_events: np.ndarray
+    recent_failures: np.ndarray
+
+
+def features(columns: Mapping[str, object], n: int) -> GuardFeatures:
+    now = _num_column(columns, "now_ms", n, 0)
+    if "last_event_ts_ms" not in columns:
+        last = now
+    else:
+        last = _numeric(columns["last_event_ts_ms"], n, "last_event_ts_ms")
+    errors = _num_column(columns, "errors_in_window", n, 0)
+    steps = _num_column(columns, "steps_in_window", n, 1)
+    has_steps = steps > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = np.where(has_steps, errors / np.where(has_steps, steps, 1), -np.inf)
+    fixed = np.select(
+        [
+            _true_column(columns.get("ops_deny_actions"), n),
+            _red_column(columns.get("ops_state"), n),
+            now < _optional_ts_column(columns.get("ops_cooldown_until_ms"), n),
+            now < _optional_ts_column(columns.get("cooldown_until_ms"), n),
+        ],
+        [1, 2, 3, 8],
+        0,
+    ).astype(np.int8, copy=False)
+    return GuardFeatures(
+        fixed_reason=fixed,
+        age_ms=now - last,
+        error_rate=rate,
+        rate_limit_events=_num_column(columns, "rate_limit_events", n, 0),
+        recent_failures=_num_column(columns, "recent_failures", n, 0),
+    )
+
+
+def reason_ids(
+    f: GuardFeatures,
+    staleness_ms,
+    max_error_rate,
+    rate_limit_events_max,
+    circuit_breaker_failures,
+) -> np.ndarray:
+    """Reason id (REASON_CODES index) per row, broadcast over threshold shapes."""
+    ops = (f.fixed_reason > 0) & (f.fixed_reason < 8)
+    out = np.where(f.fixed_reason == 8, np.int8(8), np.int8(0))
+    # Later guards first, so earlier guards overwrite (first failing guard wins).
+    out = np.where(f.recent_failures >= circuit_breaker_failures, np.int8(7), out)
+    out = np.where(f.rate_limit_events > rate_limit_events_max, np.int8(6), out)
+    out = np.where(f.error_rate > max_error_rate, np.int8(5), out)
+    out = np.where(f.age_ms > staleness_ms, np.int8(4), out)
+    return np.where(ops, f.fixed_reason, out)
+
+
+def policy_reason_ids(f: GuardFeatures, policy: GuardPolicy) -> np.ndarray:
+    return reason_ids(f, *(getattr(policy, name) for name in THRESHOLD_FIELDS))
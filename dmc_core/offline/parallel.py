@@ -0,0 +1,178 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC parallel batch: modulate_batch over a process pool with shared-memory columns
+(requires numpy).
+
+The parent normalizes each array column to the values modulate_batch would use
+(object columns become bool / "RED" / UNSET arrays) and copies them once into one
+multiprocessing.shared_memory block, followed by an int8 output array. Workers attach
+to the block, run the batch guard kernel on contiguous index ranges and write reason
+ids into their slice of the output; only (block name, layout, range, policy) is
+pickled per range. Every row is computed independently, so results do not depend on
+the number of workers or the range size.
+
+INVARIANT 4: Any exception (packing or in a worker) → every row fail-closed, as in
+modulate_batch.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from decision_schema.types import Proposal
+
+from dmc_core.dmc.batch import (
+    _REASON_GUARD,
+    GUARD_EXCEPTION,
+    BatchResult,
+    _numeric,
+    _optional_ts_column,
+    _reason_ids,
+    _red_column,
+    _true_column,
+    modulate_batch,
+)
+from dmc_core.dmc.context import CONTEXT_KEYS, OPTIONAL_KEYS
+from dmc_core.dmc.policy import GuardPolicy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RANGE = 1 << 18
+
+_ALIGN = 64
+# (key, dtype str, byte offset); the output array uses key None.
+Layout = list[tuple[str | None, str, int]]
+
+
+def modulate_parallel(
+    proposals: Sequence[Proposal],
+    policy: GuardPolicy,
+    columns: Mapping[str, object],
+    *,
+    workers: int | None = None,
+    range_size: int = DEFAULT_RANGE,
+    executor: Executor | None = None,
+) -> BatchResult:
+    """
+    modulate_batch(proposals, policy, columns) evaluated on a process pool.
+
+    columns are modulate_batch columns (a GuardContextBatch, offline.columns_of(...)
+    records, or a dict of arrays/scalars). workers=None uses os.cpu_count(); with
+    workers=1 and no executor the batch runs inline. Pass a ProcessPoolExecutor to reuse
+    worker processes across calls (pool start-up dominates small batches).
+    """
+    n = len(proposals)
+    workers = workers or os.cpu_count() or 1
+    if executor is None and workers == 1:
+        return modulate_batch(proposals, policy, columns)
+    shm = None
+    try:
+        arrays, scalars = _normalize(columns, n)
+        layout, size = _layout(arrays, n)
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for key, dtype, offset in layout:
+            if key is not None:
+                np.ndarray(n, dtype=dtype, buffer=shm.buf, offset=offset)[:] = arrays[key]
+        del arrays
+        ranges = [(lo, min(lo + range_size, n)) for lo in range(0, n, range_size)]
+        pool = executor or ProcessPoolExecutor(min(workers, max(len(ranges), 1)))
+        try:
+            futures = [
+                pool.submit(_run_range, shm.name, layout, scalars, policy, n, lo, hi)
+                for lo, hi in ranges
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            if executor is None:
+                pool.shutdown()
+        out_dtype, out_offset = layout[-1][1:]
+        reason = np.ndarray(n, dtype=out_dtype, buffer=shm.buf, offset=out_offset).copy()
+    except Exception as e:  # noqa: BLE001
+        logger.warning("DMC modulate_parallel exception, fail-closed: %s", type(e).__name__)
+        return BatchResult(
+            allowed=np.zeros(n, dtype=bool),
+            guard=np.full(n, GUARD_EXCEPTION, dtype=np.int8),
+            reason=np.zeros(n, dtype=np.int8),
+            proposals=proposals,
+            policy=policy,
+            exception=type(e).__name__,
+        )
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    return BatchResult(
+        allowed=reason == 0,
+        guard=_REASON_GUARD[reason],
+        reason=reason,
+        proposals=proposals,
+        policy=policy,
+    )
+
+
+def _normalize(
+    columns: Mapping[str, object], n: int
+) -> tuple[dict[str, np.ndarray], dict[str, object]]:
+    """Split into fixed-dtype arrays (to share) and scalars (pickled as they are)."""
+    arrays: dict[str, np.ndarray] = {}
+    scalars: dict[str, object] = {}
+    for key in CONTEXT_KEYS:
+        if key not in columns:
+            continue
+        value = columns[key]
+        if value is None and key in OPTIONAL_KEYS:
+            continue  # optional timestamp / ops field not set
+        if value is not None and np.ndim(value) == 0:
+            scalars[key] = value
+        elif key == "ops_deny_actions":
+            arrays[key] = _true_column(value, n)
+        elif key == "ops_state":
+            arrays[key] = np.where(_red_column(value, n), "RED", "")
+        elif key in ("ops_cooldown_until_ms", "cooldown_until_ms"):
+            arrays[key] = _optional_ts_column(value, n)
+        else:
+            # None raises here, failing the batch closed as modulate_batch does
+            arrays[key] = _numeric(value, n, key)
+    return arrays, scalars
+
+
+def _layout(arrays: dict[str, np.ndarray], n: int) -> tuple[Layout, int]:
+    layout: Layout = []
+    offset = 0
+    for key, dtype in [(k, a.dtype) for k, a in arrays.items()] + [(None, np.dtype(np.int8))]:
+        layout.append((key, dtype.str, offset))
+        offset += -(-(n * dtype.itemsize) // _ALIGN) * _ALIGN
+    return layout, offset
+
+
+def _run_range(
+    name: str,
+    layout: Layout,
+    scalars: dict[str, object],
+    policy: GuardPolicy,
+    n: int,
+    lo: int,
+    hi: int,
+) -> None:
+    """Worker: reason ids of rows lo..hi into the shared output. Module-level so it pickles."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        views = {
+            key: np.ndarray(n, dtype=dtype, buffer=shm.buf, offset=offset)
+            for key, dtype, offset in layout
+        }
+        out = views.pop(None)
+        columns = dict(scalars)
+        columns.update((key, view[lo:hi]) for key, view in views.items())
+        out[lo:hi] = _reason_ids(policy, columns, hi - lo)
+        del views, out, columns
+    finally:
+        shm.close()
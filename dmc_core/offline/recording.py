@@ -0,0 +1,184 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC context recording: generic contexts as fixed-width records on disk (requires numpy).
+
+A recording is a 64-byte header followed by CONTEXT_DTYPE records. Readers memory-map
+the file and hand out fixed-size chunks as modulate_batch columns, so memory is bounded
+by the chunk size, not the recording size. Encoding follows GuardContextBatch: None
+timestamps are UNSET, a missing last_event_ts_ms is stored as now_ms, ops_state "" = None.
+Values a record cannot hold exactly (0.5 counts, long ops_state) raise on append.
+"""
+
+from __future__ import annotations
+
+import operator
+import os
+import struct
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+
+from dmc_core.dmc.batch import UNSET
+from dmc_core.dmc.context import CONTEXT_KEYS, GuardContext
+
+MAGIC = b"DMCCTX01"
+HEADER = struct.Struct("<8sII")  # magic, version, record size
+HEADER_SIZE = 64
+VERSION = 1
+
+CONTEXT_DTYPE = np.dtype(
+    [
+        ("now_ms", "<i8"),
+        ("last_event_ts_ms", "<i8"),
+        ("ops_deny_actions", "?"),
+        ("ops_state", "<U8"),
+        ("ops_cooldown_until_ms", "<i8"),
+        ("errors_in_window", "<i8"),
+        ("steps_in_window", "<i8"),
+        ("rate_limit_events", "<i8"),
+        ("recent_failures", "<i8"),
+        ("cooldown_until_ms", "<i8"),
+    ]
+)
+assert CONTEXT_DTYPE.names == CONTEXT_KEYS
+
+DEFAULT_CHUNK = 1 << 20
+
+
+# Characters of ops_state a record holds.
+OPS_STATE_CHARS = CONTEXT_DTYPE["ops_state"].itemsize // 4
+
+
+def _encode(context: GuardContext | Mapping) -> tuple:
+    """
+    One CONTEXT_DTYPE row. Raises instead of letting numpy truncate: TypeError for a
+    non-integer time or count (0.5 would be stored as 0) or a non-str ops_state,
+    ValueError for an ops_state longer than OPS_STATE_CHARS.
+    """
+    c = context if type(context) is GuardContext else GuardContext.from_dict(context)
+    row = (
+        c.now_ms,
+        c.now_ms if c.last_event_ts_ms is None else c.last_event_ts_ms,
+        c.ops_deny_actions is True,
+        c.ops_state or "",
+        UNSET if c.ops_cooldown_until_ms is None else c.ops_cooldown_until_ms,
+        c.errors_in_window,
+        c.steps_in_window,
+        c.rate_limit_events,
+        c.recent_failures,
+        UNSET if c.cooldown_until_ms is None else c.cooldown_until_ms,
+    )
+    for key, value in zip(CONTEXT_KEYS, row):
+        if key == "ops_state":
+            if type(value) is not str:
+                raise TypeError(f"ops_state must be a str, got {type(value).__name__}")
+            if len(value) > OPS_STATE_CHARS:
+                raise ValueError(f"ops_state {value!r} exceeds {OPS_STATE_CHARS} characters")
+        elif key != "ops_deny_actions":
+            try:
+                operator.index(value)
+            except TypeError:
+                raise TypeError(
+                    f"context key {key!r} must be an integer, got {type(value).__name__}"
+                ) from None
+    return row
+
+
+class ContextRecorder:
+    """Append contexts to a recording file; rows are buffered and written per chunk."""
+
+    def __init__(self, path: str | os.PathLike, *, buffer_rows: int = 1 << 16) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "wb")  # noqa: SIM115
+        self._file.write(
+            HEADER.pack(MAGIC, VERSION, CONTEXT_DTYPE.itemsize).ljust(HEADER_SIZE, b"\0")
+        )
+        self._buffer = np.empty(buffer_rows, dtype=CONTEXT_DTYPE)
+        self._n = 0
+        self.records = 0
+
+    def append(self, context: GuardContext | Mapping) -> None:
+        self._buffer[self._n] = _encode(context)
+        self._n += 1
+        self.records += 1
+        if self._n == len(self._buffer):
+            self.flush()
+
+    def append_records(self, records: np.ndarray) -> None:
+        """Append rows that are already CONTEXT_DTYPE records."""
+        self.flush()
+        records.astype(CONTEXT_DTYPE, copy=False).tofile(self._file)
+        self.records += len(records)
+
+    def flush(self) -> None:
+        if self._n:
+            self._buffer[: self._n].tofile(self._file)
+            self._n = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_contexts(path: str | os.PathLike, contexts: Iterable[GuardContext | Mapping]) -> int:
+    """Write a recording; returns the number of records."""
+    with ContextRecorder(path) as recorder:
+        for context in contexts:
+            recorder.append(context)
+    return recorder.records
+
+
+def open_recording(path: str | os.PathLike) -> np.ndarray:
+    """All records of a recording as a read-only memory map (no data is read yet)."""
+    with open(path, "rb") as f:
+        magic, version, size = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION or size != CONTEXT_DTYPE.itemsize:
+        raise ValueError(f"not a DMC context recording: {path}")
+    count = (os.path.getsize(path) - HEADER_SIZE) // CONTEXT_DTYPE.itemsize
+    if count == 0:
+        return np.empty(0, dtype=CONTEXT_DTYPE)
+    return np.memmap(path, dtype=CONTEXT_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+
+def columns_of(records: np.ndarray) -> dict[str, np.ndarray]:
+    """modulate_batch columns (field views, no copy) for CONTEXT_DTYPE records."""
+    return {key: records[key] for key in CONTEXT_KEYS}
+
+
+def iter_chunks(
+    path: str | os.PathLike, chunk_size: int = DEFAULT_CHUNK
+) -> Iterator[dict[str, np.ndarray]]:
+    """Consecutive chunks of a recording as modulate_batch columns."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    records = open_recording(path)
+    for start in range(0, len(records), chunk_size):
+        yield columns_of(records[start : start + chunk_size])
+
+
+def iter_source(
+    source: str | os.PathLike | Iterable[Mapping[str, object]], chunk_size: int = DEFAULT_CHUNK
+) -> Iterable[Mapping[str, object]]:
+    """Column chunks of a recording path, or `source` itself if it already yields chunks."""
+    if isinstance(source, (str, os.PathLike)):
+        return iter_chunks(source, chunk_size)
+    return source
+
+
+def chunk_len(columns: Mapping[str, object]) -> int:
+    """Row count of a column chunk (0 if it has no columns)."""
+    for value in columns.values():
+        return len(value)
+    return 0
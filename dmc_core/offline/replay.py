@@ -0,0 +1,153 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC replay: re-run recorded contexts against candidate GuardPolicy objects and report
+how decisions change relative to a baseline policy (requires numpy).
+
+Contexts are streamed chunk by chunk; per chunk the policy-independent guard features
+are computed once and every policy is evaluated against them, so memory is bounded by
+chunk size (times a small constant) whatever the recording size. Guard outcomes do not
+depend on the proposal, so only contexts are replayed.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from dmc_core.dmc.guards_generic import GUARD_ORDER, REASON_CODES, REASON_GUARD
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.offline.kernel import features, policy_reason_ids
+from dmc_core.offline.recording import DEFAULT_CHUNK, chunk_len, iter_source
+
+_N_REASONS = len(REASON_CODES)
+_REASON_GUARD = np.array(REASON_GUARD, dtype=np.int8)
+
+
+@dataclass
+class PolicyOutcome:
+    """Totals for one policy: allowed rows and per-reason / per-guard trigger counts."""
+
+    records: int = 0
+    allowed: int = 0
+    reason_counts: np.ndarray = field(default_factory=lambda: np.zeros(_N_REASONS, np.int64))
+
+    @property
+    def pass_rate(self) -> float:
+        return self.allowed / self.records if self.records else 0.0
+
+    def guard_triggers(self) -> dict[str, int]:
+        out = dict.fromkeys(GUARD_ORDER, 0)
+        for rid in range(1, _N_REASONS):
+            out[GUARD_ORDER[REASON_GUARD[rid]]] += int(self.reason_counts[rid])
+        return out
+
+    def reasons(self) -> dict[str, int]:
+        return {REASON_CODES[i]: int(c) for i, c in enumerate(self.reason_counts) if i and c}
+
+
+@dataclass
+class PolicyDiff:
+    """Row-level changes of a candidate vs the baseline."""
+
+    allowed_to_denied: int = 0
+    denied_to_allowed: int = 0
+    guard_changed: int = 0  # denied by both, different first failing guard
+    samples: list[int] = field(default_factory=list)  # first flipped row indices
+
+
+@dataclass
+class ReplayReport:
+    baseline: PolicyOutcome
+    candidates: dict[str, PolicyOutcome]
+    diffs: dict[str, PolicyDiff]
+
+    @property
+    def records(self) -> int:
+        return self.baseline.records
+
+    def trigger_deltas(self, name: str) -> dict[str, int]:
+        """Per-guard trigger count of candidate `name` minus the baseline."""
+        base = self.baseline.guard_triggers()
+        cand = self.candidates[name].guard_triggers()
+        return {g: cand[g] - base[g] for g in GUARD_ORDER}
+
+    def to_dict(self) -> dict:
+        return {
+            "records": self.records,
+            "baseline": {
+                "pass_rate": self.baseline.pass_rate,
+                "guard_triggers": self.baseline.guard_triggers(),
+            },
+            "candidates": {
+                name: {
+                    "pass_rate": out.pass_rate,
+                    "guard_triggers": out.guard_triggers(),
+                    "trigger_deltas": self.trigger_deltas(name),
+                    "allowed_to_denied": self.diffs[name].allowed_to_denied,
+                    "denied_to_allowed": self.diffs[name].denied_to_allowed,
+                    "guard_changed": self.diffs[name].guard_changed,
+                    "sample_rows": list(self.diffs[name].samples),
+                }
+                for name, out in self.candidates.items()
+            },
+        }
+
+
+def replay(
+    source: str | os.PathLike | Iterable[Mapping[str, object]],
+    baseline: GuardPolicy,
+    candidates: Mapping[str, GuardPolicy],
+    *,
+    chunk_size: int = DEFAULT_CHUNK,
+    max_samples: int = 100,
+) -> ReplayReport:
+    """
+    Evaluate baseline and candidates over every recorded context.
+
+    source is a recording path (see recording.py) or an iterable of modulate_batch
+    column chunks (e.g. GuardContextBatch objects). Keeps up to max_samples indices of
+    flipped rows per candidate for drill-down.
+    """
+    base_out = PolicyOutcome()
+    outs = {name: PolicyOutcome() for name in candidates}
+    diffs = {name: PolicyDiff() for name in candidates}
+    offset = 0
+    for columns in iter_source(source, chunk_size):
+        n = chunk_len(columns)
+        if n == 0:
+            continue
+        f = features(columns, n)
+        base = policy_reason_ids(f, baseline)
+        base_allowed = base == 0
+        _accumulate(base_out, base, base_allowed)
+        for name, policy in candidates.items():
+            cand = policy_reason_ids(f, policy)
+            allowed = cand == 0
+            _accumulate(outs[name], cand, allowed)
+            d = diffs[name]
+            to_denied = base_allowed & ~allowed
+            to_allowed = ~base_allowed & allowed
+            d.allowed_to_denied += int(np.count_nonzero(to_denied))
+            d.denied_to_allowed += int(np.count_nonzero(to_allowed))
+            d.guard_changed += int(
+                np.count_nonzero(
+                    ~base_allowed & ~allowed & (_REASON_GUARD[base] != _REASON_GUARD[cand])
+                )
+            )
+            room = max_samples - len(d.samples)
+            if room > 0:
+                flipped = np.flatnonzero(to_denied | to_allowed)[:room]
+                d.samples.extend((flipped + offset).tolist())
+        offset += n
+    return ReplayReport(baseline=base_out, candidates=outs, diffs=diffs)
+
+
+def _accumulate(out: PolicyOutcome, reasons: np.ndarray, allowed: np.ndarray) -> None:
+    out.records += len(reasons)
+    out.allowed += int(np.count_nonzero(allowed))
+    out.reason_counts += np.bincount(reasons.astype(np.intp), minlength=_N_REASONS)
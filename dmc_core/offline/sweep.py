@@ -0,0 +1,151 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+DMC policy sweep: pass rates and trigger breakdowns for many GuardPolicy variants over
+one recorded context set (requires numpy).
+
+Thresholds of a block of policies are stacked as (B, 1) columns and broadcast against
+each chunk's guard features, giving a (B, chunk) reason-id matrix per block instead of
+B separate passes. Blocks are sized so one matrix stays under max_cells and run on a
+thread pool (NumPy releases the GIL), so peak memory is about
+workers x max_cells x a few bytes, independent of the number of policies and contexts.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import os
+import random
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from dmc_core.dmc.guards_generic import GUARD_ORDER, REASON_CODES, REASON_GUARD
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.offline.kernel import THRESHOLD_FIELDS, GuardFeatures, features, reason_ids
+from dmc_core.offline.recording import DEFAULT_CHUNK, chunk_len, iter_source
+
+_N_REASONS = len(REASON_CODES)
+
+DEFAULT_MAX_CELLS = 1 << 24
+
+
+def grid(base: GuardPolicy | None = None, **axes: Sequence) -> list[GuardPolicy]:
+    """Cartesian product of parameter values, e.g. grid(staleness_ms=[1000, 5000], ...)."""
+    base = base or GuardPolicy()
+    names = list(axes)
+    return [
+        dataclasses.replace(base, **dict(zip(names, values)))
+        for values in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+def random_policies(
+    n: int, base: GuardPolicy | None = None, *, seed: int = 0, **ranges: tuple
+) -> list[GuardPolicy]:
+    """n policies with parameters drawn uniformly from (low, high); ints if both are ints."""
+    base = base or GuardPolicy()
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        values = {}
+        for name, (low, high) in ranges.items():
+            if isinstance(low, int) and isinstance(high, int):
+                values[name] = rng.randint(low, high)
+            else:
+                values[name] = rng.uniform(low, high)
+        out.append(dataclasses.replace(base, **values))
+    return out
+
+
+@dataclass
+class SweepResult:
+    """reason_counts[p, r]: rows of policy p whose first failing reason id is r (0 = pass)."""
+
+    policies: list[GuardPolicy]
+    records: int
+    reason_counts: np.ndarray
+
+    @property
+    def allowed(self) -> np.ndarray:
+        return self.reason_counts[:, 0]
+
+    @property
+    def pass_rate(self) -> np.ndarray:
+        return self.allowed / self.records if self.records else np.zeros(len(self.policies))
+
+    def guard_triggers(self) -> np.ndarray:
+        """(P, len(GUARD_ORDER)) trigger counts per guard."""
+        out = np.zeros((len(self.policies), len(GUARD_ORDER)), dtype=np.int64)
+        for rid in range(1, _N_REASONS):
+            out[:, REASON_GUARD[rid]] += self.reason_counts[:, rid]
+        return out
+
+    def table(self) -> list[dict]:
+        """One row per policy: threshold values, pass_rate and per-guard triggers."""
+        triggers = self.guard_triggers()
+        rates = self.pass_rate
+        return [
+            {
+                **{name: getattr(p, name) for name in THRESHOLD_FIELDS},
+                "pass_rate": float(rates[i]),
+                **{g: int(triggers[i, j]) for j, g in enumerate(GUARD_ORDER)},
+            }
+            for i, p in enumerate(self.policies)
+        ]
+
+
+def sweep(
+    source: str | os.PathLike | Iterable[Mapping[str, object]],
+    policies: Sequence[GuardPolicy],
+    *,
+    chunk_size: int = DEFAULT_CHUNK,
+    max_cells: int = DEFAULT_MAX_CELLS,
+    workers: int | None = None,
+) -> SweepResult:
+    """
+    Evaluate every policy over every context of `source` (recording path or column chunks).
+
+    workers=None uses os.cpu_count(); workers=1 runs inline.
+    """
+    policies = list(policies)
+    thresholds = [
+        np.array([getattr(p, name) for p in policies])[:, None] for name in THRESHOLD_FIELDS
+    ]
+    counts = np.zeros((len(policies), _N_REASONS), dtype=np.int64)
+    workers = workers or os.cpu_count() or 1
+    records = 0
+    pool = ThreadPoolExecutor(workers) if workers > 1 else None
+    try:
+        for columns in iter_source(source, chunk_size):
+            n = chunk_len(columns)
+            if n == 0 or not policies:
+                records += n
+                continue
+            f = features(columns, n)
+            block = max(1, max_cells // n)
+            starts = range(0, len(policies), block)
+            if pool is None:
+                parts = [_block_counts(f, thresholds, s, s + block) for s in starts]
+            else:
+                futures = [pool.submit(_block_counts, f, thresholds, s, s + block) for s in starts]
+                parts = [fut.result() for fut in futures]
+            for s, part in zip(starts, parts):
+                counts[s : s + len(part)] += part
+            records += n
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return SweepResult(policies=policies, records=records, reason_counts=counts)
+
+
+def _block_counts(
+    f: GuardFeatures, thresholds: list[np.ndarray], start: int, stop: int
+) -> np.ndarray:
+    ids = reason_ids(f, *(t[start:stop] for t in thresholds))
+    ids = np.broadcast_to(ids, (len(thresholds[0][start:stop]), ids.shape[-1]))
+    return np.stack([np.count_nonzero(ids == r, axis=1) for r in range(_N_REASONS)], axis=1)
@@ -18,16 +18,15 @@ New code should import directly from `decision_schema`:
 See INTEGRATION_GUIDE.md for migration instructions.
 """
 
-import warnings
-
-# Re-export from decision-schema for backward compatibility
-from decision_schema.packet_v2 import PacketV2
-from decision_schema.types import (
-    Action,
-    FinalDecision,
-    MismatchInfo,
-    Proposal,
-)
+# Re-exports from decision-schema for backward compatibility. Resolved on first access
+# (PEP 562) so importing this module does not import decision_schema.
+_EXPORTS: dict[str, str] = {
+    "Action": "decision_schema.types",
+    "Proposal": "decision_schema.types",
+    "FinalDecision": "decision_schema.types",
+    "MismatchInfo": "decision_schema.types",
+    "PacketV2": "decision_schema.packet_v2",
+}
 
 # Domain-free public surface only (INVARIANT 0). Legacy names not in __all__.
 __all__ = [
@@ -38,6 +37,22 @@ __all__ = [
     "PacketV2",
 ]
 
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
 # Emit deprecation warning when DMC version >= 0.3 (DMC-owned sunset policy)
 try:
     from dmc_core.version import __version__ as _dmc_version
@@ -47,6 +62,8 @@ _parts = _dmc_version.split(".")
 if len(_parts) >= 2:
     _minor = int(_parts[1])
     if _minor >= 3:
+        import warnings
+
         warnings.warn(
             "Importing from dmc_core.schema is deprecated. "
             "Import directly from decision_schema instead. "
@@ -0,0 +1,100 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""modulate_batch(adaptive=True): property test against modulate for arbitrary contexts."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+hypothesis = pytest.importorskip("hypothesis")
+
+from decision_schema.types import Action, Proposal
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from dmc_core.dmc import batch as batch_module
+from dmc_core.dmc.batch import modulate_batch
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.5, reasons=["r"])
+ts = st.integers(min_value=-20_000, max_value=20_000)
+
+contexts = st.lists(
+    st.fixed_dictionaries(
+        {"now_ms": ts},
+        optional={
+            "last_event_ts_ms": ts,
+            "ops_deny_actions": st.sampled_from([None, True, False]),
+            "ops_state": st.sampled_from([None, "GREEN", "RED"]),
+            "ops_cooldown_until_ms": st.one_of(st.none(), ts),
+            "errors_in_window": st.integers(0, 20),
+            "steps_in_window": st.integers(-2, 50),
+            "rate_limit_events": st.integers(0, 20),
+            "recent_failures": st.integers(0, 8),
+            "cooldown_until_ms": st.one_of(st.none(), ts),
+        },
+    ),
+    min_size=1,
+    max_size=60,
+)
+policies = st.builds(
+    GuardPolicy,
+    staleness_ms=st.integers(0, 10_000),
+    max_error_rate=st.floats(0, 1),
+    rate_limit_events_max=st.integers(0, 20),
+    circuit_breaker_failures=st.integers(0, 8),
+)
+
+_DEFAULTS = {
+    "errors_in_window": 0,
+    "steps_in_window": 1,
+    "rate_limit_events": 0,
+    "recent_failures": 0,
+}
+
+
+def _columns(rows: list[dict]) -> dict:
+    """Object columns (None = key absent), numeric columns filled with modulate defaults."""
+    cols = {"now_ms": np.array([r["now_ms"] for r in rows])}
+    cols["last_event_ts_ms"] = np.array([r.get("last_event_ts_ms", r["now_ms"]) for r in rows])
+    for key in ("ops_deny_actions", "ops_state", "ops_cooldown_until_ms", "cooldown_until_ms"):
+        cols[key] = np.array([r.get(key) for r in rows], dtype=object)
+    for key, default in _DEFAULTS.items():
+        cols[key] = np.array([r.get(key, default) for r in rows])
+    return cols
+
+
+@settings(max_examples=200, deadline=None)
+@given(rows=contexts, policy=policies, min_resolved=st.sampled_from([0.0, 0.1, 0.5, 1.0]))
+def test_adaptive_matches_modulate(rows, policy, min_resolved):
+    original = batch_module.ADAPTIVE_MIN_RESOLVED
+    batch_module.ADAPTIVE_MIN_RESOLVED = min_resolved
+    try:
+        result = modulate_batch([PROPOSAL] * len(rows), policy, _columns(rows), adaptive=True)
+    finally:
+        batch_module.ADAPTIVE_MIN_RESOLVED = original
+    for i, context in enumerate(rows):
+        assert result.decision(i) == modulate(PROPOSAL, policy, context)
+
+
+def test_adaptive_equals_select_on_skewed_batch():
+    rng = np.random.default_rng(1)
+    n = 20_000
+    columns = {
+        "now_ms": 10_000,
+        "ops_state": np.where(rng.random(n) < 0.6, "RED", "GREEN").astype(object),
+        "rate_limit_events": rng.integers(0, 14, n),
+        "cooldown_until_ms": np.where(rng.random(n) < 0.1, 10_001, 0),
+    }
+    proposals = [PROPOSAL] * n
+    a = modulate_batch(proposals, GuardPolicy(), columns)
+    b = modulate_batch(proposals, GuardPolicy(), columns, adaptive=True)
+    assert np.array_equal(a.reason, b.reason)
+    assert np.array_equal(a.guard, b.guard)
+
+
+def test_adaptive_exception_fail_closed():
+    result = modulate_batch([PROPOSAL] * 2, GuardPolicy(), {"now_ms": "bad"}, adaptive=True)
+    assert result.exception == "TypeError"
+    assert not result.allowed.any()
@@ -0,0 +1,72 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Diagnostic mode: every failing guard is reported; the decision stays fail-fast."""
+
+import itertools
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.diagnostic import ALL_GUARDS_FAILED, failed_guard_names, modulate_all_guards
+from dmc_core.dmc.guards_generic import GUARD_ORDER
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.8, reasons=["r"])
+NOW = 10_000
+
+# One failing value per guard, in GUARD_ORDER.
+FAILURES = (
+    {"ops_state": "RED"},
+    {"last_event_ts_ms": NOW - 60_000},
+    {"errors_in_window": 9, "steps_in_window": 10},
+    {"rate_limit_events": 99},
+    {"recent_failures": 9},
+    {"cooldown_until_ms": NOW + 1},
+)
+
+
+def _contexts():
+    for k in range(len(FAILURES) + 1):
+        for chosen in itertools.combinations(range(len(FAILURES)), k):
+            ctx = {"now_ms": NOW}
+            for g in chosen:
+                ctx.update(FAILURES[g])
+            yield sum(1 << g for g in chosen), ctx
+
+
+def test_all_failing_guards_reported_decision_unchanged():
+    policy = GuardPolicy()
+    for expected_bits, ctx in _contexts():
+        for context in (ctx, GuardContext.from_dict(ctx)):
+            final, mi, bits = modulate_all_guards(PROPOSAL, policy, context)
+            assert bits == expected_bits
+            assert (final, mi) == modulate(PROPOSAL, policy, context)
+
+
+def test_failed_guard_names_follow_guard_order():
+    assert failed_guard_names(0) == ()
+    assert failed_guard_names(0b100010) == ("staleness", "cooldown")
+    assert failed_guard_names(ALL_GUARDS_FAILED) == GUARD_ORDER
+
+
+def test_raising_guard_counts_as_failed():
+    # staleness raises on None: fail closed like modulate, later guards still reported
+    ctx = {"now_ms": NOW, "last_event_ts_ms": None, "recent_failures": 9}
+    final, mi, bits = modulate_all_guards(PROPOSAL, GuardPolicy(), ctx)
+    assert (final, mi) == modulate(PROPOSAL, GuardPolicy(), ctx)
+    assert final.allowed is False and mi.flags == ["modulate_exception"]
+    assert failed_guard_names(bits) == ("staleness", "circuit_breaker")
+
+    # after an earlier failure the decision keeps the first failing guard
+    ctx = dict(ctx, ops_state="RED")
+    final, mi, bits = modulate_all_guards(PROPOSAL, GuardPolicy(), ctx)
+    assert mi.reason_codes == ["ops_health_red"]
+    assert failed_guard_names(bits) == ("ops_health", "staleness", "circuit_breaker")
+
+
+def test_unreadable_context_fails_closed():
+    final, mi, bits = modulate_all_guards(PROPOSAL, GuardPolicy(), None)
+    assert final.allowed is False and final.action == Action.HOLD
+    assert mi.flags == ["modulate_exception"] and bits == ALL_GUARDS_FAILED
@@ -0,0 +1,64 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""AsyncModulator: micro-batched results equal modulate; backpressure; fail-closed timeout."""
+
+import asyncio
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.async_modulator import AsyncModulator
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+POLICY = GuardPolicy(rate_limit_events_max=5, fail_closed_action=Action.STOP)
+
+
+def _context(i: int) -> dict:
+    return {"now_ms": 1000 + i, "last_event_ts_ms": 1000, "rate_limit_events": i % 10}
+
+
+def test_async_results_match_modulate_in_order() -> None:
+    """Concurrent calls are coalesced; each gets its own modulate result."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+
+    async def run() -> tuple[list, AsyncModulator]:
+        am = AsyncModulator(POLICY, max_batch=32, max_wait_us=1000)
+        out = await asyncio.gather(*(am.modulate(proposal, _context(i)) for i in range(100)))
+        return out, am
+
+    out, am = asyncio.run(run())
+    assert out == [modulate(proposal, POLICY, _context(i)) for i in range(100)]
+    assert am.items == 100
+    assert am.batches == 4  # 32 + 32 + 32 + 4
+
+
+def test_backpressure_bounds_pending() -> None:
+    """With max_pending=4 no batch holds more than 4 calls."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+
+    async def run() -> AsyncModulator:
+        am = AsyncModulator(POLICY, max_batch=100, max_wait_us=2000, max_pending=4)
+        await asyncio.gather(*(am.modulate(proposal, _context(i)) for i in range(10)))
+        return am
+
+    am = asyncio.run(run())
+    assert am.items == 10
+    assert am.batches == 3  # 4 + 4 + 2
+
+
+def test_timeout_fail_closed() -> None:
+    """INVARIANT 4: a call not evaluated within timeout_s is fail-closed."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+
+    async def run():
+        am = AsyncModulator(POLICY, max_batch=100, max_wait_us=200_000, timeout_s=0.01)
+        result = await am.modulate(proposal, _context(0))
+        am.flush()
+        return result, am
+
+    (final, mismatch), am = asyncio.run(run())
+    assert final.allowed is False
+    assert final.action == Action.STOP
+    assert mismatch.flags == ["modulate_timeout"]
+    assert am.items == 0
@@ -0,0 +1,116 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""modulate_columnar: structured arrays and Arrow batches decide like modulate, as columns."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.batch import GUARD_EXCEPTION, GUARD_PASS
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.guards_generic import GUARD_ORDER, REASON_CODES
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.offline.columnar import RESULT_FIELDS, modulate_columnar
+from dmc_core.offline.recording import CONTEXT_DTYPE, _encode
+
+POLICY = GuardPolicy(fail_closed_action=Action.STOP)
+
+
+def _contexts(n: int, seed: int = 3) -> list[dict]:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        now = rng.randint(0, 20_000)
+        out.append(
+            {
+                "now_ms": now,
+                "last_event_ts_ms": now - rng.randint(-100, 8000),
+                "ops_deny_actions": rng.choice([None, False, True, None, None]),
+                "ops_state": rng.choice([None, "GREEN", "RED", None]),
+                "ops_cooldown_until_ms": rng.choice([None, None, now + 10, now - 10]),
+                "errors_in_window": rng.randint(0, 10),
+                "steps_in_window": rng.randint(-1, 60),
+                "rate_limit_events": rng.randint(0, 14),
+                "recent_failures": rng.randint(0, 6),
+                "cooldown_until_ms": rng.choice([None, None, now + 1, now]),
+                "action": rng.choice(["ACT", "EXIT"]),
+            }
+        )
+    return out
+
+
+def _expected(contexts: list[dict]) -> list[tuple]:
+    rows = []
+    for c in contexts:
+        fields = {k: v for k, v in c.items() if k != "action"}
+        final, mismatch = modulate(
+            Proposal(action=Action(c["action"]), confidence=0.9),
+            POLICY,
+            GuardContext.from_dict(fields),
+        )
+        guard = GUARD_ORDER.index(mismatch.flags[0]) if mismatch.flags else GUARD_PASS
+        reason = REASON_CODES.index(mismatch.reason_codes[0]) if mismatch.flags else 0
+        rows.append((final.allowed, final.action.value, guard, reason))
+    return rows
+
+
+def test_structured_array_matches_modulate() -> None:
+    """CONTEXT_DTYPE records plus an action field: one output row per input row."""
+    contexts = _contexts(1500)
+    dtype = np.dtype(CONTEXT_DTYPE.descr + [("action", "<U4")])
+    records = np.empty(len(contexts), dtype=dtype)
+    for i, c in enumerate(contexts):
+        fields = {k: v for k, v in c.items() if k != "action"}
+        records[i] = (*_encode(fields), c["action"])
+    out = modulate_columnar(records, POLICY)
+    assert out.dtype.names == RESULT_FIELDS
+    assert [tuple(r) for r in out.tolist()] == _expected(contexts)
+
+    out = modulate_columnar(records[list(CONTEXT_DTYPE.names)], POLICY, action=Action.ACT)
+    assert set(out["action"][out["allowed"]]) == {"ACT"}
+    assert set(out["action"][~out["allowed"]]) == {"STOP"}
+
+
+def test_arrow_batches_and_nulls_match_modulate() -> None:
+    """Arrow nulls read like None in GuardContext; Tables are decided per record batch."""
+    pa = pytest.importorskip("pyarrow")
+    contexts = _contexts(1500, seed=5)
+    table = pa.Table.from_pylist(contexts)
+    table = pa.concat_tables([table.slice(0, 700), table.slice(700)])
+    assert table.column("now_ms").num_chunks == 2
+
+    out = modulate_columnar(table, POLICY)
+    assert isinstance(out, pa.Table)
+    assert tuple(out.column_names) == RESULT_FIELDS
+    assert list(zip(*(out.column(f).to_pylist() for f in RESULT_FIELDS))) == _expected(contexts)
+
+    batch = table.to_batches()[0].drop_columns(["action"])
+    out = modulate_columnar(batch, POLICY, action="EXIT")
+    assert isinstance(out, pa.RecordBatch)
+    assert out.num_rows == 700
+    with pytest.raises(ValueError):
+        modulate_columnar(batch, POLICY)
+
+
+def test_columnar_fail_closed() -> None:
+    """Nulls in counters, last_event_ts_ms or non-numeric columns fail the batch closed."""
+    pa = pytest.importorskip("pyarrow")
+    contexts = _contexts(10)
+    for key in ("errors_in_window", "last_event_ts_ms"):
+        rows = [dict(c) for c in contexts]
+        rows[4][key] = None
+        out = modulate_columnar(pa.RecordBatch.from_pylist(rows), POLICY)
+        assert out.column("allowed").to_pylist() == [False] * 10
+        assert out.column("guard").to_pylist() == [GUARD_EXCEPTION] * 10
+        assert out.column("action").to_pylist() == ["STOP"] * 10
+
+    records = np.zeros(3, dtype=[("now_ms", "<U4"), ("action", "<U3")])
+    out = modulate_columnar(records, POLICY)
+    assert not out["allowed"].any()
+    assert (out["guard"] == GUARD_EXCEPTION).all()
@@ -0,0 +1,108 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""compile_policy: compiled pipeline must return exactly what modulate returns."""
+
+import math
+import random
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.compiled import compile_policy
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+
+def _random_context(rng: random.Random) -> dict:
+    now = rng.randint(0, 20_000)
+    context = {
+        "now_ms": now,
+        "last_event_ts_ms": now - rng.randint(-100, 8000),
+        "ops_deny_actions": rng.choice([None, False, True, None, None, None]),
+        "ops_state": rng.choice([None, "GREEN", "RED", None, None]),
+        "ops_cooldown_until_ms": rng.choice([None, None, None, now + 10, now - 10]),
+        "errors_in_window": rng.randint(0, 10),
+        "steps_in_window": rng.randint(-1, 60),
+        "rate_limit_events": rng.randint(0, 14),
+        "recent_failures": rng.randint(0, 6),
+        "cooldown_until_ms": rng.choice([None, None, now + 1, now]),
+    }
+    # Drop some keys so defaults are exercised too.
+    for key in rng.sample(sorted(context), rng.randint(0, 3)):
+        del context[key]
+    return context
+
+
+def test_compiled_matches_modulate() -> None:
+    """Same (FinalDecision, MismatchInfo) as modulate for random contexts."""
+    rng = random.Random(3)
+    proposal = Proposal(action=Action.ACT, confidence=0.5, reasons=["r"])
+    for policy in (
+        GuardPolicy(),
+        GuardPolicy(staleness_ms=100, fail_closed_action=Action.STOP),
+        GuardPolicy(max_error_rate=0.5, rate_limit_events_max=3, circuit_breaker_failures=2),
+    ):
+        fn = compile_policy(policy)
+        for _ in range(3000):
+            context = _random_context(rng)
+            assert fn(proposal, context) == modulate(proposal, policy, context)
+
+
+def test_compiled_exception_fail_closed() -> None:
+    """INVARIANT 4: exception in compiled check -> same fail-closed result as modulate."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    policy = GuardPolicy(fail_closed_action=Action.STOP)
+    context = {"now_ms": 1000, "last_event_ts_ms": "not_an_int"}
+    final, mismatch = compile_policy(policy)(proposal, context)
+    assert (final, mismatch) == modulate(proposal, policy, context)
+    assert final.allowed is False
+    assert final.action == Action.STOP
+    assert "modulate_exception" in mismatch.flags
+
+
+def test_infinite_threshold_elided() -> None:
+    """A guard with an infinite threshold never triggers."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    policy = GuardPolicy(staleness_ms=math.inf, rate_limit_events_max=math.inf)
+    context = {"now_ms": 10**9, "last_event_ts_ms": 0, "rate_limit_events": 10**6}
+    final, mismatch = compile_policy(policy)(proposal, context)
+    assert final.allowed is True
+    assert (final, mismatch) == modulate(proposal, policy, context)
+
+
+def test_elided_guards_check_value_types() -> None:
+    """Elided guards still fail or fail closed like modulate for non-int values."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    policy = GuardPolicy(
+        staleness_ms=math.inf,
+        max_error_rate=math.inf,
+        rate_limit_events_max=math.inf,
+        circuit_breaker_failures=math.inf,
+    )
+    fn = compile_policy(policy)
+    keys = (
+        "last_event_ts_ms",
+        "errors_in_window",
+        "steps_in_window",
+        "rate_limit_events",
+        "recent_failures",
+    )
+    values = (None, "x", math.nan, math.inf, -math.inf, 1.5, True, 10**400, -(10**400))
+    denied = 0
+    for key in keys:
+        for value in values:
+            context = {"now_ms": 1000, key: value}
+            expected = modulate(proposal, policy, context)
+            assert fn(proposal, context) == expected, (key, value)
+            denied += not expected[0].allowed
+    assert denied  # e.g. recent_failures=inf (inf >= inf) and every None / str
+
+
+def test_policy_snapshot_at_compile_time() -> None:
+    """Mutating the policy after compile does not change the compiled function."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    policy = GuardPolicy(staleness_ms=1000)
+    fn = compile_policy(policy)
+    policy.staleness_ms = 10
+    final, _ = fn(proposal, {"now_ms": 500, "last_event_ts_ms": 0})
+    assert final.allowed is True
@@ -0,0 +1,128 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""DecisionCache: cached results equal modulate at every now_ms; bounded LRU."""
+
+import random
+
+import pytest
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.cache import DecisionCache
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.8, reasons=["r"])
+
+
+def _idle_contexts(rng: random.Random, n: int) -> list[dict]:
+    """Time-independent parts of idle keys; timestamps near the 0..2000 sweep below."""
+    out = []
+    for _ in range(n):
+        ctx = {
+            "ops_state": rng.choice([None, None, "GREEN", "RED"]),
+            "ops_cooldown_until_ms": rng.choice([None, None, rng.randint(0, 2000)]),
+            "errors_in_window": rng.randint(0, 3),
+            "steps_in_window": rng.choice([0, 10]),
+            "rate_limit_events": rng.randint(0, 12),
+            "recent_failures": rng.randint(0, 6),
+            "cooldown_until_ms": rng.choice([None, None, rng.randint(0, 2000)]),
+        }
+        if rng.random() < 0.8:
+            ctx["last_event_ts_ms"] = rng.randint(-1200, 800)
+        out.append(ctx)
+    return out
+
+
+def test_cached_equals_modulate_over_time():
+    rng = random.Random(5)
+    policy = GuardPolicy(staleness_ms=1000)
+    cache = DecisionCache(policy)
+    keys = _idle_contexts(rng, 40)
+    for now in range(0, 2000, 7):
+        for base in keys:
+            ctx = dict(base, now_ms=now)
+            assert cache.modulate(PROPOSAL, ctx) == modulate(PROPOSAL, policy, ctx)
+            typed = GuardContext.from_dict(ctx)
+            assert cache.modulate(PROPOSAL, typed) == modulate(PROPOSAL, policy, typed)
+    stats = cache.stats()
+    assert stats.hit_rate > 0.9
+    assert stats.expired > 0 and stats.uncacheable == 0
+
+
+def test_horizon_boundaries_are_exact():
+    policy = GuardPolicy(staleness_ms=100)
+    cache = DecisionCache(policy)
+    ctx = {"last_event_ts_ms": 1000, "cooldown_until_ms": 1050}
+    for now in range(990, 1200):
+        c = dict(ctx, now_ms=now)
+        assert cache.modulate(PROPOSAL, c) == modulate(PROPOSAL, policy, c), now
+    # the edges are re-evaluated, everything else is served from the cache
+    assert cache.stats().misses <= 4
+
+
+def test_time_going_backwards_reevaluates():
+    policy = GuardPolicy()
+    cache = DecisionCache(policy)
+    ctx = {"cooldown_until_ms": 500}
+    assert cache.modulate(PROPOSAL, dict(ctx, now_ms=600))[0].allowed
+    final, _ = cache.modulate(PROPOSAL, dict(ctx, now_ms=400))
+    assert not final.allowed and cache.stats().expired == 1
+
+
+def test_lru_eviction_and_stats():
+    cache = DecisionCache(GuardPolicy(), maxsize=2)
+    for failures in (0, 1, 0, 2, 1):
+        cache.modulate(PROPOSAL, {"now_ms": 1, "recent_failures": failures})
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 4, 2, 2)
+    assert stats.hit_rate == pytest.approx(0.2)
+    cache.clear()
+    assert len(cache) == 0 and cache.stats().lookups == 0
+    with pytest.raises(ValueError):
+        DecisionCache(GuardPolicy(), maxsize=0)
+
+
+def test_exceptions_and_unhashable_not_cached():
+    policy = GuardPolicy()
+    cache = DecisionCache(policy)
+    ctx = {"now_ms": 5, "last_event_ts_ms": None}
+    for _ in range(2):
+        final, mi = cache.modulate(PROPOSAL, ctx)
+        assert not final.allowed and mi.flags == ["modulate_exception"]
+    assert len(cache) == 0
+    final, _ = cache.modulate(PROPOSAL, {"now_ms": 5, "ops_state": ["RED"]})
+    assert final == modulate(PROPOSAL, policy, {"now_ms": 5, "ops_state": ["RED"]})[0]
+    assert cache.stats().uncacheable == 1
+
+
+def test_proposal_is_part_of_the_key():
+    cache = DecisionCache(GuardPolicy())
+    other = Proposal(action=Action.HOLD, confidence=0.1, reasons=["x"])
+    assert cache.modulate(PROPOSAL, {"now_ms": 1})[0].action == Action.ACT
+    assert (
+        cache.modulate(other, {"now_ms": 1})[0] == modulate(other, GuardPolicy(), {"now_ms": 1})[0]
+    )
+
+
+def test_non_integer_now_bypasses_cache():
+    policy = GuardPolicy(staleness_ms=100)
+    cache = DecisionCache(policy)
+    for now in (1099, 1100.5, 1100, 1101):
+        ctx = {"now_ms": now, "last_event_ts_ms": 1000}
+        assert cache.modulate(PROPOSAL, ctx) == modulate(PROPOSAL, policy, ctx)
+    assert cache.stats().uncacheable == 1
+
+
+def test_equal_values_of_other_types_are_distinct_keys():
+    """True == 1, but modulate denies only on ops_deny_actions is True."""
+    policy = GuardPolicy()
+    for first, second in ((True, 1), (1, True)):
+        cache = DecisionCache(policy)
+        for value in (first, second):
+            ctx = {"now_ms": 5, "ops_deny_actions": value}
+            assert cache.modulate(PROPOSAL, ctx) == modulate(PROPOSAL, policy, ctx)
+        typed = GuardContext(now_ms=5, ops_deny_actions=first)
+        assert cache.modulate(PROPOSAL, typed) == modulate(PROPOSAL, policy, typed)
+        assert cache.stats().hits == 0
@@ -0,0 +1,115 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Decision journal: binary records round-trip, rotation, group commit, zero-copy reader."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.guards_generic import GUARD_ORDER, REASON_CODES
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.journal import (
+    GUARD_EXCEPTION,
+    GUARD_PASS,
+    REASON_OTHER,
+    DecisionJournal,
+    iter_segments,
+    key_hash,
+    read_journal,
+)
+
+PASS_CONTEXT = {
+    "now_ms": 5000,
+    "last_event_ts_ms": 4000,
+    "errors_in_window": 0,
+    "steps_in_window": 100,
+    "rate_limit_events": 0,
+    "recent_failures": 0,
+}
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.8)
+CONTEXTS = [
+    PASS_CONTEXT,
+    dict(PASS_CONTEXT, cooldown_until_ms=9000),
+    dict(PASS_CONTEXT, errors_in_window=90),
+    dict(PASS_CONTEXT, last_event_ts_ms="bad"),
+]
+
+
+def test_round_trip(tmp_path):
+    policy = GuardPolicy()
+    with DecisionJournal(tmp_path) as journal:
+        for i, ctx in enumerate(CONTEXTS):
+            final, mismatch = modulate(PROPOSAL, policy, ctx)
+            journal.append(1000 + i, final, mismatch, key=("acct", i))
+    records = read_journal(tmp_path)
+    assert records["ts_ms"].tolist() == [1000, 1001, 1002, 1003]
+    assert records["allowed"].tolist() == [1, 0, 0, 0]
+    assert records["guard"].tolist() == [
+        GUARD_PASS,
+        GUARD_ORDER.index("cooldown"),
+        GUARD_ORDER.index("error_rate"),
+        GUARD_EXCEPTION,
+    ]
+    assert records["reason"].tolist() == [
+        0,
+        REASON_CODES.index("cooldown_active"),
+        REASON_CODES.index("error_rate_high"),
+        REASON_OTHER,
+    ]
+    assert records["key_hash"].tolist() == [key_hash(("acct", i)) for i in range(4)]
+    (segment,) = iter_segments(tmp_path)
+    assert segment.action_names().tolist() == ["ACT", "HOLD", "HOLD", "HOLD"]
+    assert segment.reason_names().tolist() == ["", "cooldown_active", "error_rate_high", "other"]
+
+
+def test_key_hash_follows_repr_not_equality():
+    """1, True and 1.0 are equal dict keys but distinct journal keys, cached or not."""
+    for keys in ((1, True, 1.0), ((1, "a"), (True, "a"))):
+        for _ in range(2):
+            assert len({key_hash(k) for k in keys}) == len(keys)
+    assert key_hash(None) == 0
+
+
+def test_segment_rotation_and_new_journal_appends_segments(tmp_path):
+    final, mismatch = modulate(PROPOSAL, GuardPolicy(), PASS_CONTEXT)
+    with DecisionJournal(tmp_path, segment_records=4, group_commit=2) as journal:
+        for i in range(10):
+            journal.append(i, final, mismatch)
+    assert [len(s) for s in iter_segments(tmp_path)] == [4, 4, 2]
+    with DecisionJournal(tmp_path, segment_records=4) as journal:
+        journal.append(10, final, mismatch)
+    assert read_journal(tmp_path)["ts_ms"].tolist() == list(range(11))
+
+
+def test_group_commit_publishes_count(tmp_path):
+    final, mismatch = modulate(PROPOSAL, GuardPolicy(), PASS_CONTEXT)
+    journal = DecisionJournal(tmp_path, segment_records=100, group_commit=3)
+    try:
+        for i in range(4):
+            journal.append(i, final, mismatch)
+        assert len(read_journal(tmp_path)) == 3  # 4th record not committed yet
+        journal.commit()
+        assert len(read_journal(tmp_path)) == 4
+    finally:
+        journal.close()
+    with pytest.raises(ValueError):
+        journal.append(5, final, mismatch)
+
+
+def test_reader_is_zero_copy(tmp_path):
+    final, mismatch = modulate(PROPOSAL, GuardPolicy(), PASS_CONTEXT)
+    with DecisionJournal(tmp_path, segment_records=8) as journal:
+        journal.append(1, final, mismatch)
+    (segment,) = iter_segments(tmp_path)
+    assert isinstance(segment.records, np.memmap)
+    assert not segment.records.flags.writeable
+
+
+def test_rejects_foreign_file(tmp_path):
+    (tmp_path / "journal-00000000.dmcj").write_bytes(b"\0" * 512)
+    with pytest.raises(ValueError):
+        read_journal(tmp_path)
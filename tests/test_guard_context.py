@@ -0,0 +1,83 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""GuardContext: typed context accepted by modulate with dict-identical results."""
+
+import pytest
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.compiled import compile_policy
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+CONTEXTS = [
+    {"now_ms": 5000, "last_event_ts_ms": 4000, "steps_in_window": 10},
+    {"now_ms": 5000},
+    {"now_ms": 10_000, "last_event_ts_ms": 1},
+    {"now_ms": 1000, "ops_state": "RED"},
+    {"now_ms": 1000, "errors_in_window": 5, "steps_in_window": 10},
+    {"now_ms": 1000, "rate_limit_events": 50},
+    {"now_ms": 1000, "recent_failures": 9},
+    {"now_ms": 1000, "cooldown_until_ms": 2000},
+    {"now_ms": 1000, "ops_cooldown_until_ms": 2000},
+]
+
+
+def test_guard_context_same_result_as_dict() -> None:
+    """modulate(GuardContext) == modulate(dict) for every guard outcome."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8, reasons=["r"])
+    policy = GuardPolicy(fail_closed_action=Action.STOP)
+    fn = compile_policy(policy)
+    for context in CONTEXTS:
+        typed = GuardContext.from_dict(context)
+        expected = modulate(proposal, policy, context)
+        assert modulate(proposal, policy, typed) == expected
+        assert fn(proposal, typed) == expected
+        assert modulate(proposal, policy, typed.to_dict()) == expected
+
+
+def test_from_dict_rejects_typos() -> None:
+    """A misspelled key raises instead of silently disabling a guard."""
+    with pytest.raises(KeyError):
+        GuardContext.from_dict({"now_ms": 1, "cooldown_untill_ms": 5})
+    typed = GuardContext.from_dict({"now_ms": 1, "extra": 5}, strict=False)
+    assert typed.now_ms == 1
+
+
+def test_from_dict_rejects_none_for_required() -> None:
+    """None for a non-optional key would fail closed in modulate; from_dict raises."""
+    with pytest.raises(ValueError):
+        GuardContext.from_dict({"now_ms": None})
+
+
+def test_last_event_none_fails_closed_on_every_path() -> None:
+    """An explicit None last_event_ts_ms never reads as "same as now_ms" (the typed default)."""
+    pytest.importorskip("numpy")
+    from dmc_core.dmc.batch import GuardContextBatch, modulate_batch
+    from dmc_core.offline.recording import _encode
+
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    policy = GuardPolicy()
+    context = {"now_ms": 1000, "last_event_ts_ms": None}
+    final, mismatch = modulate(proposal, policy, context)
+    assert not final.allowed and mismatch.flags == ["modulate_exception"]
+    assert compile_policy(policy)(proposal, context) == (final, mismatch)
+    for convert in (
+        GuardContext.from_dict,
+        _encode,
+        lambda c: GuardContextBatch.from_contexts([c]),
+    ):
+        with pytest.raises(ValueError):
+            convert(context)
+    for adaptive in (False, True):
+        columns = {"now_ms": [1000], "last_event_ts_ms": None}
+        assert not modulate_batch([proposal], policy, columns, adaptive=adaptive).allowed[0]
+    # a missing key (typed: None) is "same as now_ms" everywhere
+    assert modulate(proposal, policy, {"now_ms": 1000})[0].allowed
+    assert modulate(proposal, policy, GuardContext(now_ms=1000))[0].allowed
+
+
+def test_guard_context_slotted() -> None:
+    """No per-instance __dict__."""
+    assert not hasattr(GuardContext(), "__dict__")
@@ -0,0 +1,136 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Guard registry: registered guards run at their position; generic order is fixed."""
+
+import math
+from dataclasses import dataclass
+
+import pytest
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.compiled import compile_policy
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.guards_generic import GUARD_ORDER
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.registry import GuardRegistry, GuardSpec, build_plan
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.8, reasons=["r"])
+PASS_CONTEXT = {"now_ms": 5000, "last_event_ts_ms": 4000}
+
+
+@dataclass
+class LatencyPolicy(GuardPolicy):
+    max_latency_ms: float = 100.0
+
+
+def latency_guard(latency_ms: float, max_latency_ms: float) -> tuple[bool, str]:
+    if latency_ms > max_latency_ms:
+        return False, "latency_high"
+    return True, ""
+
+
+LATENCY = GuardSpec(
+    name="latency",
+    position=250,  # between staleness and error_rate
+    fn=latency_guard,
+    reason_codes=("latency_high",),
+    context_keys=("latency_ms",),
+    policy_fields=("max_latency_ms",),
+    context_defaults={"latency_ms": 0.0},
+    elide_when=lambda policy: policy.max_latency_ms == math.inf,
+)
+
+
+def test_default_plan_is_generic_order():
+    plan = build_plan(GuardPolicy())
+    assert plan.guards == GUARD_ORDER
+    assert "registry" not in plan.source
+
+
+def test_registered_guard_runs_at_its_position():
+    registry = GuardRegistry([LATENCY])
+    assert registry.order == GUARD_ORDER[:2] + ("latency",) + GUARD_ORDER[2:]
+    fn = compile_policy(LatencyPolicy(), registry=registry)
+
+    final, mi = fn(PROPOSAL, dict(PASS_CONTEXT, latency_ms=500.0))
+    assert not final.allowed and mi.flags == ["latency"] and mi.reason_codes == ["latency_high"]
+    # staleness (200) comes first, error_rate (300) after
+    _, mi = fn(PROPOSAL, dict(PASS_CONTEXT, latency_ms=500.0, last_event_ts_ms=-10_000))
+    assert mi.flags == ["staleness"]
+    _, mi = fn(PROPOSAL, dict(PASS_CONTEXT, latency_ms=500.0, errors_in_window=9))
+    assert mi.flags == ["latency"]
+
+
+def test_generic_results_unchanged_with_registry():
+    fn = compile_policy(LatencyPolicy(), registry=GuardRegistry([LATENCY]))
+    for ctx in (
+        PASS_CONTEXT,
+        dict(PASS_CONTEXT, recent_failures=9),
+        dict(PASS_CONTEXT, ops_state="RED"),
+        dict(PASS_CONTEXT, cooldown_until_ms=9000),
+    ):
+        assert fn(PROPOSAL, ctx) == modulate(PROPOSAL, LatencyPolicy(), ctx)
+
+
+def test_typed_context_without_guard_key_fails_closed():
+    """latency_ms is no GuardContext field: typed contexts fail closed, not pass the default."""
+    registry = GuardRegistry([LATENCY])
+    typed = GuardContext.from_dict(dict(PASS_CONTEXT, ops_state="RED"))
+    _, mi = compile_policy(LatencyPolicy(), registry=registry)(PROPOSAL, typed)
+    # guards before the registered one still decide first
+    assert mi.flags == ["ops_health"]
+    final, mi = compile_policy(LatencyPolicy(), registry=registry)(
+        PROPOSAL, GuardContext.from_dict(PASS_CONTEXT)
+    )
+    assert final.allowed is False
+    assert mi.flags == ["modulate_exception"] and mi.reason_codes == ["TypeError"]
+    # an elided guard reads nothing, so typed contexts work again
+    fn = compile_policy(LatencyPolicy(max_latency_ms=math.inf), registry=registry)
+    typed = GuardContext.from_dict(PASS_CONTEXT)
+    assert fn(PROPOSAL, typed) == modulate(PROPOSAL, LatencyPolicy(), typed)
+
+
+def test_elided_guard_not_in_plan():
+    registry = GuardRegistry([LATENCY])
+    plan = build_plan(LatencyPolicy(max_latency_ms=math.inf, staleness_ms=math.inf), registry)
+    assert "latency" not in plan.guards and "staleness" not in plan.guards
+    assert "_g" not in plan.source
+
+
+def test_undeclared_reason_code_fails_closed():
+    spec = GuardSpec(
+        name="odd",
+        position=700,
+        fn=lambda: (False, "not_declared"),
+        reason_codes=("declared",),
+    )
+    fn = compile_policy(GuardPolicy(), registry=GuardRegistry([spec]))
+    final, mi = fn(PROPOSAL, PASS_CONTEXT)
+    assert final.allowed is False and final.action == Action.HOLD
+    assert mi.flags == ["modulate_exception"] and mi.reason_codes == ["KeyError"]
+
+
+def test_low_alloc_shares_registered_mismatch():
+    fn = compile_policy(LatencyPolicy(), low_alloc=True, registry=GuardRegistry([LATENCY]))
+    ctx = dict(PASS_CONTEXT, latency_ms=500.0)
+    (_, a), (_, b) = fn(PROPOSAL, ctx), fn(PROPOSAL, ctx)
+    assert a is b and a.reason_codes == ["latency_high"]
+
+
+def test_registry_rejects_conflicts():
+    registry = GuardRegistry([LATENCY])
+    with pytest.raises(ValueError):
+        registry.register(LATENCY)
+    with pytest.raises(ValueError):
+        registry.register(GuardSpec("other", 300, latency_guard, ("x",)))
+    with pytest.raises(ValueError):
+        registry.register(GuardSpec("empty", 900, latency_guard, ()))
+    for key in ('x", 0) or __import__("os") and get("x', "a.b", 1):
+        with pytest.raises(ValueError):
+            registry.register(GuardSpec("bad_key", 900, latency_guard, ("x",), (key,)))
+    with pytest.raises(ValueError):
+        registry.unregister("staleness")
+    registry.unregister("latency")
+    assert registry.order == GUARD_ORDER
@@ -0,0 +1,106 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""GuardState: sliding windows expire by now_ms; circuit breaker arms cooldown."""
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import GuardState, WindowCounter
+
+
+def test_window_counter_expires() -> None:
+    """Counts leave the window after window_ms (bucket resolution)."""
+    c = WindowCounter(window_ms=1000, buckets=10)
+    for t in range(0, 1000, 100):
+        c.add(t)
+    assert c.total(999) == 10
+    assert c.total(1000) == 9
+    assert c.total(1850) == 1
+    assert c.total(1900) == 0
+    assert c.total(5000) == 0
+
+
+def test_window_counter_never_outlives_window() -> None:
+    """window_ms not a multiple of the bucket: counts still expire by window_ms."""
+    for window_ms in range(1, 40):
+        for buckets in range(1, 12):
+            for t in range(2 * window_ms):
+                c = WindowCounter(window_ms, buckets)
+                c.add(t)
+                expiry = c.next_expiry_ms(t)
+                span = len(c._counts) * c.bucket_ms
+                assert span <= window_ms and len(c._counts) <= buckets
+                gone = next(u for u in range(t, t + window_ms + 1) if c.total(u) == 0)
+                assert t + span - c.bucket_ms < gone <= t + window_ms
+                assert expiry == gone
+
+
+def test_window_counter_bounded_memory() -> None:
+    """Ring buffer size depends on buckets only."""
+    c = WindowCounter(window_ms=60_000, buckets=60)
+    for t in range(0, 10_000_000, 7):
+        c.add(t)
+    assert len(c._counts) == 60
+    assert c.total(10_000_000) <= 60_000 // 7 + 1
+
+
+def test_window_counter_drops_too_old() -> None:
+    """Out-of-order counts older than the window are ignored."""
+    c = WindowCounter(window_ms=1000, buckets=10)
+    c.add(5000)
+    c.add(100)
+    assert c.total(5000) == 1
+
+
+def test_rate_limit_enforced_over_window() -> None:
+    """rate_limit_events comes from the window; HOLD until events expire."""
+    policy = GuardPolicy(rate_limit_events_max=3, rate_limit_window_ms=1000, staleness_ms=10_000)
+    state = GuardState(policy, buckets=10)
+    proposal = Proposal(action=Action.ACT, confidence=0.9)
+    for t in (0, 10, 20, 30):
+        state.record_event(t)
+    final, mismatch = state.modulate(proposal, 40)
+    assert final.allowed is False
+    assert mismatch.flags == ["rate_limit"]
+    final, _ = state.modulate(proposal, 1100)
+    assert final.allowed is True
+
+
+def test_circuit_breaker_arms_cooldown() -> None:
+    """Reaching circuit_breaker_failures arms cooldown_until_ms = now + cooldown_ms."""
+    policy = GuardPolicy(
+        circuit_breaker_failures=2,
+        cooldown_ms=5000,
+        rate_limit_window_ms=1000,
+        staleness_ms=100_000,
+    )
+    state = GuardState(policy, buckets=10)
+    proposal = Proposal(action=Action.ACT, confidence=0.9)
+    state.record_failure(100)
+    assert state.cooldown_until_ms is None
+    state.record_failure(200)
+    assert state.cooldown_until_ms == 5200
+
+    _, mismatch = state.modulate(proposal, 300)
+    assert mismatch.flags == ["circuit_breaker"]
+    _, mismatch = state.modulate(proposal, 3000)
+    assert mismatch.flags == ["cooldown"]
+    final, _ = state.modulate(proposal, 5200)
+    assert final.allowed is True
+
+
+def test_context_keys() -> None:
+    """context() produces the generic keys consumed by modulate."""
+    state = GuardState(GuardPolicy())
+    state.record_event(1000)
+    state.record_step(1000, error=True)
+    state.record_step(1001)
+    state.set_ops(ops_state="GREEN")
+    context = state.context(1002)
+    assert context["last_event_ts_ms"] == 1000
+    assert context["errors_in_window"] == 1
+    assert context["steps_in_window"] == 2
+    assert context["rate_limit_events"] == 1
+    assert context["recent_failures"] == 0
+    assert context["ops_state"] == "GREEN"
@@ -0,0 +1,93 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""next_change_ms: the decision is constant until the horizon; horizons are exact."""
+
+import math
+import random
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.context import GuardContext
+from dmc_core.dmc.horizon import NEVER, next_change_ms
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import GuardState, WindowCounter
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.8, reasons=["r"])
+
+
+def _at(ctx: dict, now: int) -> dict:
+    return dict(ctx, now_ms=now)
+
+
+def test_decision_constant_until_horizon():
+    rng = random.Random(2)
+    policy = GuardPolicy(staleness_ms=300)
+    for _ in range(300):
+        ctx = {
+            "now_ms": 1000,
+            "ops_state": rng.choice([None, None, "RED"]),
+            "ops_cooldown_until_ms": rng.choice([None, rng.randint(900, 1600)]),
+            "recent_failures": rng.choice([0, 0, 9]),
+            "cooldown_until_ms": rng.choice([None, rng.randint(900, 1600)]),
+        }
+        if rng.random() < 0.8:
+            ctx["last_event_ts_ms"] = rng.randint(500, 1300)
+        result = modulate(PROPOSAL, policy, ctx)
+        for mismatch in (None, result[1]):
+            for context in (ctx, GuardContext.from_dict(ctx)):
+                horizon = next_change_ms(policy, context, mismatch)
+                assert horizon > 1000
+                for now in range(1000, int(min(horizon, 2000))):
+                    assert modulate(PROPOSAL, policy, _at(ctx, now)) == result
+
+
+def test_horizon_is_exact_for_single_time_guards():
+    policy = GuardPolicy(staleness_ms=100)
+    cases = [
+        ({"now_ms": 0, "last_event_ts_ms": 0}, 101),  # stale from 101 (age > 100)
+        ({"now_ms": 0, "cooldown_until_ms": 50}, 50),
+        ({"now_ms": 0, "ops_cooldown_until_ms": 70}, 70),
+    ]
+    for ctx, expected in cases:
+        mismatch = modulate(PROPOSAL, policy, ctx)[1]
+        assert next_change_ms(policy, ctx, mismatch) == expected
+        before = modulate(PROPOSAL, policy, _at(ctx, expected - 1))
+        after = modulate(PROPOSAL, policy, _at(ctx, expected))
+        assert before[0].allowed != after[0].allowed
+
+
+def test_later_guards_ignored_with_mismatch():
+    policy = GuardPolicy()
+    ctx = {"now_ms": 0, "recent_failures": 99, "cooldown_until_ms": 500}
+    mismatch = modulate(PROPOSAL, policy, ctx)[1]
+    assert mismatch.flags == ["circuit_breaker"]
+    assert next_change_ms(policy, ctx) == 500
+    assert next_change_ms(policy, ctx, mismatch) == NEVER
+    assert next_change_ms(GuardPolicy(staleness_ms=math.inf), {"last_event_ts_ms": 0}) == NEVER
+
+
+def test_window_counter_next_expiry():
+    c = WindowCounter(window_ms=1000, buckets=10)
+    assert c.next_expiry_ms(0) == math.inf
+    c.add(250)
+    c.add(730)
+    assert c.next_expiry_ms(800) == 1200
+    assert c.total(1199) == 2 and c.total(1200) == 1
+    assert c.next_expiry_ms(1200) == 1700
+    assert c.next_expiry_ms(1700) == math.inf
+
+
+def test_guard_state_horizon_includes_window_expiry():
+    policy = GuardPolicy(rate_limit_events_max=2, rate_limit_window_ms=1000, staleness_ms=math.inf)
+    state = GuardState(policy, buckets=10)
+    for t in (100, 200, 300):
+        state.record_event(t)
+    _, mismatch = state.modulate(PROPOSAL, 400)
+    assert mismatch.flags == ["rate_limit"]
+    horizon = state.next_change_ms(400, mismatch)
+    assert horizon == 1100
+    assert not state.modulate(PROPOSAL, horizon - 1)[0].allowed
+    assert state.modulate(PROPOSAL, horizon)[0].allowed
+    assert state.next_change_ms(horizon, state.modulate(PROPOSAL, horizon)[1]) == NEVER
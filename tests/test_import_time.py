@@ -0,0 +1,116 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+Import-time regression: `python -X importtime` budgets for the hot-path import.
+
+Module sets are checked exactly; the microsecond budget is generous (CI noise) and can
+be overridden with DMC_IMPORT_BUDGET_US.
+"""
+
+import os
+import subprocess
+import sys
+
+BUDGET_US = int(os.environ.get("DMC_IMPORT_BUDGET_US", "150000"))
+
+# Never imported by `from dmc_core.dmc import modulate`
+NOT_ON_HOT_PATH = (
+    "asyncio",
+    "concurrent.futures",
+    "numpy",
+    "dmc_core.dmc.async_modulator",
+    "dmc_core.dmc.batch",
+    "dmc_core.dmc.cache",
+    "dmc_core.dmc.compiled",
+    "dmc_core.dmc.diagnostic",
+    "dmc_core.dmc.horizon",
+    "dmc_core.dmc.keyed",
+    "dmc_core.dmc.policy_store",
+    "dmc_core.dmc.state",
+    "dmc_core.dmc.stream",
+    "dmc_core.dmc.threaded",
+    "dmc_core.dmc.timer_wheel",
+    "dmc_core.metrics",
+    "dmc_core.schema",
+    "decision_schema.packet_v2",
+)
+
+
+def _importtime(statement: str) -> dict[str, int]:
+    """Module name -> cumulative import time (us) for a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        check=True,
+    )
+    out = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            out[name.strip()] = int(cumulative)
+    return out
+
+
+def test_hot_path_import_is_minimal() -> None:
+    modules = _importtime("from dmc_core.dmc import modulate")
+    assert "dmc_core.dmc.modulator" in modules
+    loaded = sorted(m for m in NOT_ON_HOT_PATH if m in modules)
+    assert not loaded, f"hot-path import pulled in {loaded}"
+    assert modules["dmc_core.dmc"] <= BUDGET_US
+
+
+def test_package_import_does_not_load_schema() -> None:
+    modules = _importtime("import dmc_core, dmc_core.compat, dmc_core.schema")
+    assert not any(m.startswith("decision_schema") for m in modules)
+    assert modules["dmc_core"] <= BUDGET_US
+
+
+def test_lazy_names_resolve() -> None:
+    from decision_schema.packet_v2 import PacketV2
+    from decision_schema.types import FinalDecision, Proposal
+
+    import dmc_core
+    import dmc_core.compat
+    import dmc_core.dmc
+    import dmc_core.schema
+
+    assert dmc_core.dmc.compile_policy.__module__ == "dmc_core.dmc.compiled"
+    assert dmc_core.dmc.KeyedModulator.__name__ == "KeyedModulator"
+    assert dmc_core.compat.ProposalLike is Proposal
+    assert dmc_core.compat.DecisionLike is FinalDecision
+    assert dmc_core.schema.PacketV2 is PacketV2
+    assert dmc_core.metrics.enable is not None
+    assert set(dmc_core.dmc.__all__) <= set(dir(dmc_core.dmc))
+    for module in (dmc_core, dmc_core.dmc, dmc_core.compat, dmc_core.schema):
+        try:
+            module.no_such_name  # noqa: B018
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError(f"{module.__name__}.no_such_name resolved")
+
+
+def test_star_import_without_numpy() -> None:
+    """__all__ has no numpy-only names; those raise ImportError only when accessed."""
+    statement = (
+        "import sys; sys.modules['numpy'] = None\n"
+        "from dmc_core.dmc import *\n"
+        "import dmc_core.dmc as dmc\n"
+        "try:\n"
+        "    dmc.modulate_batch\n"
+        "except ImportError:\n"
+        "    print('ok')\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", statement],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        check=True,
+    )
+    assert proc.stdout.strip() == "ok"
@@ -0,0 +1,129 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""KeyedModulator: per-key state, sharded execution, deterministic per-key order."""
+
+import random
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.keyed import KeyedModulator, shard_of
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import GuardEvent, GuardState
+
+POLICY = GuardPolicy(
+    rate_limit_events_max=4,
+    rate_limit_window_ms=1000,
+    circuit_breaker_failures=3,
+    cooldown_ms=500,
+    staleness_ms=10_000,
+)
+
+
+def _items(n: int, keys: int, seed: int = 11) -> list:
+    rng = random.Random(seed)
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    items = []
+    for t in range(n):
+        key = f"k{rng.randrange(keys)}"
+        event = GuardEvent(
+            now_ms=t * 10,
+            events=rng.randint(0, 2),
+            steps=1,
+            errors=rng.randint(0, 1),
+            failures=1 if rng.random() < 0.1 else 0,
+        )
+        items.append((key, proposal, event))
+    return items
+
+
+def _reference(items: list) -> list:
+    states: dict = {}
+    out = []
+    for key, proposal, event in items:
+        state = states.setdefault(key, GuardState(POLICY))
+        state.apply(event)
+        out.append(state.modulate(proposal, event.now_ms))
+    return out
+
+
+def test_shard_of_stable() -> None:
+    """Shard assignment does not depend on the process hash seed."""
+    assert shard_of("abc", 16) == shard_of("abc", 16)
+    assert 0 <= shard_of(("a", 1), 7) < 7
+
+
+def test_inline_matches_per_key_reference() -> None:
+    """Inline processing equals sequential per-key GuardState evaluation."""
+    items = _items(2000, keys=50)
+    km = KeyedModulator(POLICY, shards=8)
+    assert km.process(items) == _reference(items)
+    assert len(km) == 50
+
+
+def test_thread_and_process_pools_deterministic() -> None:
+    """Same results across executors and across consecutive batches (state carried)."""
+    items = _items(3000, keys=64)
+    expected = _reference(items)
+    for make in (lambda: ThreadPoolExecutor(4), lambda: ProcessPoolExecutor(2)):
+        km = KeyedModulator(POLICY, shards=8)
+        with make() as pool:
+            got = km.process(items[:1500], executor=pool)
+            got += km.process(items[1500:], executor=pool)
+        assert got == expected
+        assert km.state("k0").policy is POLICY
+
+
+def test_single_item_modulate() -> None:
+    """modulate(key, ...) applies the event then decides."""
+    km = KeyedModulator(POLICY)
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    final, mismatch = km.modulate("a", proposal, GuardEvent(now_ms=0, events=5))
+    assert final.allowed is False
+    assert mismatch.flags == ["rate_limit"]
+    final, _ = km.modulate("b", proposal, GuardEvent(now_ms=0, events=1))
+    assert final.allowed is True
+
+
+def test_bad_item_fails_closed_and_failed_worker_changes_nothing() -> None:
+    """A bad event fails only its item closed; a failed shard job merges no state."""
+    items = _items(400, keys=10)
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    # valid events count before the bad errors value: nothing of it may be recorded
+    bad = ("k1", proposal, GuardEvent(now_ms=2000, events=1, steps=1, errors="x"))
+    km = KeyedModulator(POLICY, shards=4)
+    got = km.process(items[:200] + [bad] + items[200:])
+    assert got[:200] + got[201:] == _reference(items)
+    final, mismatch = got[200]
+    assert final.allowed is False and final.action == POLICY.fail_closed_action
+    assert mismatch.flags == ["modulate_exception"] and mismatch.reason_codes == ["TypeError"]
+
+    class FailingSecondJob:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def submit(self, fn, *args):
+            self.calls += 1
+            future = Future()
+            if self.calls == 2:
+                future.set_exception(RuntimeError("worker died"))
+            else:
+                future.set_result(fn(*args))
+            return future
+
+    km = KeyedModulator(POLICY, shards=4)
+    with pytest.raises(RuntimeError):
+        km.process(items, executor=FailingSecondJob())
+    assert len(km) == 0
+
+    # keys that already exist keep their counters (workers only touch copies)
+    km = KeyedModulator(POLICY, shards=4)
+    km.process(items[:200])
+    keys = sorted({key for key, _, _ in items[:200]})
+    before = [km.state(key).context(2000) for key in keys]
+    with pytest.raises(RuntimeError):
+        km.process(items[200:], executor=FailingSecondJob())
+    assert [km.state(key).context(2000) for key in keys] == before
+    assert km.process(items[200:]) == _reference(items)[200:]
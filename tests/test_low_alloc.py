@@ -0,0 +1,113 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""low_alloc mode: same values as modulate; only the FinalDecision is allocated per call."""
+
+import pickle
+import tracemalloc
+
+import pytest
+from decision_schema.types import Action, FinalDecision, Proposal
+
+from dmc_core.dmc.compiled import compile_policy
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+N = 2000
+PASS_CONTEXT = {
+    "now_ms": 5000,
+    "last_event_ts_ms": 4000,
+    "errors_in_window": 0,
+    "steps_in_window": 100,
+    "rate_limit_events": 0,
+    "recent_failures": 0,
+}
+FAIL_CONTEXT = dict(PASS_CONTEXT, cooldown_until_ms=6000)
+
+
+def _retained(fn) -> int:
+    """Bytes still allocated after N calls whose results are kept."""
+    fn()  # warm-up (lazy caches)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [fn() for _ in range(N)]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(kept) == N
+    return used
+
+
+def test_low_alloc_same_values() -> None:
+    """low_alloc results compare equal to the default mode."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8, reasons=["r"])
+    policy = GuardPolicy(fail_closed_action=Action.STOP)
+    fn = compile_policy(policy, low_alloc=True)
+    for context in (PASS_CONTEXT, FAIL_CONTEXT, {"now_ms": 1, "ops_state": "RED"}):
+        expected = modulate(proposal, policy, context)
+        assert modulate(proposal, policy, context, low_alloc=True) == expected
+        assert fn(proposal, context) == expected
+
+
+def test_low_alloc_shares_mismatch() -> None:
+    """Pass and override paths return shared MismatchInfo instances."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    policy = GuardPolicy()
+    a = modulate(proposal, policy, PASS_CONTEXT, low_alloc=True)[1]
+    b = modulate(proposal, policy, PASS_CONTEXT, low_alloc=True)[1]
+    assert a is b
+    a = modulate(proposal, policy, FAIL_CONTEXT, low_alloc=True)[1]
+    b = modulate(proposal, policy, FAIL_CONTEXT, low_alloc=True)[1]
+    assert a is b
+
+
+def test_low_alloc_only_decision_allocated() -> None:
+    """Retained memory per call equals a bare (FinalDecision, shared) tuple."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8, reasons=["r"])
+    policy = GuardPolicy()
+    fn = compile_policy(policy, low_alloc=True)
+    shared = modulate(proposal, policy, PASS_CONTEXT, low_alloc=True)[1]
+
+    baseline = _retained(
+        lambda: (
+            FinalDecision(action=proposal.action, allowed=True, reasons=proposal.reasons),
+            shared,
+        )
+    )
+    for call in (
+        lambda: modulate(proposal, policy, PASS_CONTEXT, low_alloc=True),
+        lambda: modulate(proposal, policy, FAIL_CONTEXT, low_alloc=True),
+        lambda: fn(proposal, PASS_CONTEXT),
+        lambda: fn(proposal, FAIL_CONTEXT),
+    ):
+        assert _retained(call) <= baseline * 1.02 + 512
+    # Default mode allocates a fresh MismatchInfo (and lists) per call.
+    assert _retained(lambda: modulate(proposal, policy, FAIL_CONTEXT)) > baseline * 1.5
+
+
+def test_low_alloc_shared_results_read_only() -> None:
+    """Mutating a returned decision raises instead of leaking into later calls."""
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    policy = GuardPolicy()
+    fn = compile_policy(policy, low_alloc=True)
+    for call in (
+        lambda c: modulate(proposal, policy, c, low_alloc=True),
+        lambda c: fn(proposal, c),
+    ):
+        for context in (PASS_CONTEXT, FAIL_CONTEXT):
+            expected = modulate(proposal, policy, context)
+            final, mismatch = call(context)
+            with pytest.raises(TypeError):
+                final.reasons.append("x")
+            with pytest.raises(TypeError):
+                mismatch.flags.append("x")
+            with pytest.raises(TypeError):
+                mismatch.reason_codes[:] = ["x"]
+            with pytest.raises(TypeError):
+                mismatch.flags.clear()
+            with pytest.raises(AttributeError):
+                mismatch.flags = ["x"]
+            assert call(context) == expected
+            assert pickle.loads(pickle.dumps(call(context))) == expected
+            assert list(final.reasons) == expected[0].reasons
@@ -0,0 +1,143 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Instrumentation: per-guard / per-reason counts, latency histogram, snapshot merge."""
+
+import threading
+
+import pytest
+from decision_schema.types import Action, Proposal
+
+from dmc_core import metrics
+from dmc_core.dmc import modulator
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.metrics.instrumentation import (
+    HISTOGRAM_BUCKETS,
+    LatencyHistogram,
+    bucket_bounds,
+    bucket_index,
+)
+
+PASS_CONTEXT = {
+    "now_ms": 5000,
+    "last_event_ts_ms": 4000,
+    "errors_in_window": 0,
+    "steps_in_window": 100,
+    "rate_limit_events": 0,
+    "recent_failures": 0,
+}
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.8, reasons=["x"])
+
+
+@pytest.fixture
+def instr():
+    inst = metrics.enable()
+    yield inst
+    metrics.disable()
+
+
+def test_disabled_by_default():
+    assert modulator._recorder is None
+
+
+def test_counts_per_guard_and_reason(instr):
+    policy = GuardPolicy()
+    modulate(PROPOSAL, policy, PASS_CONTEXT)
+    modulate(PROPOSAL, policy, dict(PASS_CONTEXT, cooldown_until_ms=9000))
+    modulate(PROPOSAL, policy, dict(PASS_CONTEXT, ops_deny_actions=True))
+    modulate(PROPOSAL, policy, dict(PASS_CONTEXT, ops_state="RED"))
+    modulate(PROPOSAL, policy, dict(PASS_CONTEXT, last_event_ts_ms="bad"))
+    snap = instr.snapshot()
+    assert snap.decisions == 5
+    assert snap.allowed == 1
+    assert snap.exceptions == 1
+    assert snap.guard_triggers == {"cooldown": 1, "ops_health": 2, "modulate_exception": 1}
+    assert snap.reason_codes == {
+        "cooldown_active": 1,
+        "ops_deny_actions": 1,
+        "ops_health_red": 1,
+        "TypeError": 1,
+    }
+    assert snap.latency.total == 5
+
+
+def test_results_unchanged_when_enabled(instr):
+    policy = GuardPolicy()
+    ctx = dict(PASS_CONTEXT, recent_failures=10)
+    enabled = modulate(PROPOSAL, policy, ctx)
+    metrics.disable()
+    assert modulate(PROPOSAL, policy, ctx) == enabled
+
+
+def test_recorder_error_does_not_break_modulate():
+    class Broken:
+        def record(self, *args):
+            raise RuntimeError("boom")
+
+    modulator.set_recorder(Broken())
+    try:
+        final, _ = modulate(PROPOSAL, GuardPolicy(), PASS_CONTEXT)
+    finally:
+        modulator.set_recorder(None)
+    assert final.allowed is True
+
+
+def test_per_thread_shards_merge(instr):
+    policy = GuardPolicy()
+
+    def work():
+        for _ in range(200):
+            modulate(PROPOSAL, policy, PASS_CONTEXT)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(instr._shards) == 4
+    assert instr.snapshot().allowed == 800
+    # shards of exited threads are folded into one retired shard, counts kept
+    assert instr._shards == []
+    work()
+    assert instr.snapshot().allowed == 1000
+    assert len(instr._shards) == 1
+
+
+def test_snapshot_merge(instr):
+    policy = GuardPolicy()
+    modulate(PROPOSAL, policy, PASS_CONTEXT)
+    a = instr.snapshot()
+    instr.reset()
+    modulate(PROPOSAL, policy, dict(PASS_CONTEXT, rate_limit_events=99))
+    b = instr.snapshot()
+    merged = a.merge(b)
+    assert merged.decisions == 2
+    assert merged.allowed == 1
+    assert merged.guard_triggers == {"rate_limit": 1}
+    assert merged.latency.total == 2
+    assert set(merged.to_dict()["latency_ns"]) == {"p50", "p90", "p99", "p999"}
+
+
+def test_histogram_buckets_cover_values():
+    prev = -1
+    for i in range(HISTOGRAM_BUCKETS):
+        low, high = bucket_bounds(i)
+        assert low == prev + 1
+        assert bucket_index(low) == i and bucket_index(high) == i
+        # log-linear: bucket width at most 1/16 of its lower bound (beyond the exact range)
+        assert high - low + 1 <= max(1, low // 16)
+        prev = high
+    assert bucket_index(1 << 60) == HISTOGRAM_BUCKETS - 1
+    # the top bucket starts at 31 * 2**36 (just under 2**41)
+    assert bucket_bounds(HISTOGRAM_BUCKETS - 1) == (31 << 36, (1 << 41) - 1)
+    assert bucket_index((31 << 36) - 1) == HISTOGRAM_BUCKETS - 2
+
+
+def test_histogram_quantile():
+    h = LatencyHistogram()
+    for v in range(1, 1001):
+        h.record(v * 1000)
+    p50 = h.quantile(0.5)
+    assert 500_000 <= p50 <= 500_000 * 17 / 16
+    assert LatencyHistogram().quantile(0.5) == 0
@@ -0,0 +1,192 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""modulate_batch: columnar guards must match looping modulate row by row."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.batch import (
+    ALL_GUARDS_FAILED,
+    GUARD_EXCEPTION,
+    GUARD_PASS,
+    UNSET,
+    guard_cooccurrence,
+    modulate_batch,
+)
+from dmc_core.dmc.diagnostic import modulate_all_guards
+from dmc_core.dmc.guards_generic import GUARD_ORDER
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+
+def _random_contexts(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    contexts = []
+    for _ in range(n):
+        now = rng.randint(0, 20_000)
+        contexts.append(
+            {
+                "now_ms": now,
+                "last_event_ts_ms": now - rng.randint(-100, 8000),
+                "ops_deny_actions": rng.choice([None, False, True, None, None, None]),
+                "ops_state": rng.choice([None, "GREEN", "YELLOW", "RED", None, None]),
+                "ops_cooldown_until_ms": rng.choice([None, None, None, now + 10, now - 10]),
+                "errors_in_window": rng.randint(0, 10),
+                "steps_in_window": rng.randint(-1, 60),
+                "rate_limit_events": rng.randint(0, 14),
+                "recent_failures": rng.randint(0, 6),
+                "cooldown_until_ms": rng.choice([None, None, now + 1, now]),
+            }
+        )
+    return contexts
+
+
+def _to_columns(contexts: list[dict]) -> dict:
+    cols = {}
+    for key in ("now_ms", "last_event_ts_ms", "errors_in_window", "steps_in_window"):
+        cols[key] = np.array([c[key] for c in contexts], dtype=np.int64)
+    for key in ("rate_limit_events", "recent_failures"):
+        cols[key] = np.array([c[key] for c in contexts], dtype=np.int64)
+    for key in ("ops_cooldown_until_ms", "cooldown_until_ms"):
+        cols[key] = np.array(
+            [UNSET if c[key] is None else c[key] for c in contexts], dtype=np.int64
+        )
+    cols["ops_deny_actions"] = np.array([c["ops_deny_actions"] is True for c in contexts])
+    cols["ops_state"] = np.array([c["ops_state"] or "" for c in contexts])
+    return cols
+
+
+def _assert_same(result, proposals, policy, contexts) -> None:
+    for i, (proposal, context) in enumerate(zip(proposals, contexts)):
+        final, mismatch = modulate(proposal, policy, context)
+        b_final, b_mismatch = result.decision(i)
+        assert bool(result.allowed[i]) is final.allowed
+        assert b_final == final
+        assert b_mismatch == mismatch
+        if final.allowed:
+            assert result.guard[i] == GUARD_PASS
+        else:
+            assert GUARD_ORDER[result.guard[i]] == mismatch.flags[0]
+
+
+def test_batch_matches_modulate_loop() -> None:
+    """Every row equals modulate on the same context (all guard positions hit)."""
+    contexts = _random_contexts(2000)
+    proposals = [Proposal(action=Action.ACT, confidence=0.5, reasons=["r"]) for _ in contexts]
+    policy = GuardPolicy(staleness_ms=5000, max_error_rate=0.1, fail_closed_action=Action.STOP)
+    result = modulate_batch(proposals, policy, _to_columns(contexts))
+    _assert_same(result, proposals, policy, contexts)
+    assert set(result.guard.tolist()) == {GUARD_PASS, *range(len(GUARD_ORDER))}
+
+
+def test_batch_object_columns_and_defaults() -> None:
+    """None in object columns and missing columns behave like absent context keys."""
+    contexts = [
+        {"now_ms": 1000, "cooldown_until_ms": None, "ops_deny_actions": None},
+        {"now_ms": 1000, "cooldown_until_ms": 2000, "ops_deny_actions": False},
+        {"now_ms": 1000, "cooldown_until_ms": None, "ops_deny_actions": True},
+    ]
+    proposals = [Proposal(action=Action.ACT, confidence=0.5) for _ in contexts]
+    policy = GuardPolicy()
+    columns = {
+        "now_ms": 1000,
+        "cooldown_until_ms": np.array([None, 2000, None], dtype=object),
+        "ops_deny_actions": np.array([None, False, True], dtype=object),
+    }
+    result = modulate_batch(proposals, policy, columns)
+    assert result.allowed.tolist() == [True, False, False]
+    _assert_same(result, proposals, policy, contexts)
+
+
+def test_batch_exception_fail_closed() -> None:
+    """INVARIANT 4: invalid column -> all rows fail-closed with modulate_exception."""
+    proposals = [Proposal(action=Action.ACT, confidence=0.5) for _ in range(3)]
+    policy = GuardPolicy(fail_closed_action=Action.HOLD)
+    result = modulate_batch(proposals, policy, {"now_ms": 1000, "last_event_ts_ms": "bad"})
+    assert not result.allowed.any()
+    assert (result.guard == GUARD_EXCEPTION).all()
+    final, mismatch = result.decision(0)
+    assert final.allowed is False
+    assert final.action == Action.HOLD
+    assert "modulate_exception" in mismatch.flags
+
+
+def test_batch_none_numeric_column_fails_closed() -> None:
+    """A numeric key given as None fails closed as in modulate; only a missing key defaults."""
+    proposals = [Proposal(action=Action.ACT, confidence=0.5) for _ in range(4)]
+    policy = GuardPolicy()
+    keys = ("now_ms", "errors_in_window", "steps_in_window", "rate_limit_events", "recent_failures")
+    for key in keys:
+        context = {"now_ms": 1000, key: None}
+        assert modulate(proposals[0], policy, context)[0].allowed is False
+        for mode in ({}, {"adaptive": True}, {"all_guards": True}):
+            result = modulate_batch(proposals, policy, context, **mode)
+            assert result.allowed.tolist() == [False] * 4
+            assert (result.guard == GUARD_EXCEPTION).all()
+    assert modulate_batch(proposals, policy, {"now_ms": 1000}).allowed.all()
+
+
+def test_batch_decisions_lazy_iteration() -> None:
+    """decisions() yields one materialized pair per row, in order."""
+    proposals = [Proposal(action=Action.ACT, confidence=0.5) for _ in range(4)]
+    columns = {"now_ms": 100, "rate_limit_events": np.array([0, 11, 0, 11])}
+    result = modulate_batch(proposals, GuardPolicy(), columns)
+    allowed = [final.allowed for final, _ in result.decisions()]
+    assert allowed == [True, False, True, False]
+    assert len(result) == 4
+
+
+def test_guard_context_batch_roundtrip() -> None:
+    """GuardContextBatch packs contexts into columns usable by modulate_batch."""
+    from dmc_core.dmc.batch import GuardContextBatch
+    from dmc_core.dmc.context import GuardContext
+
+    contexts = _random_contexts(500, seed=5)
+    batch = GuardContextBatch.from_contexts(contexts)
+    assert batch.size == 500
+    proposals = [Proposal(action=Action.ACT, confidence=0.5) for _ in contexts]
+    policy = GuardPolicy()
+    for i in range(0, 500, 25):
+        assert isinstance(batch.row(i), GuardContext)
+        assert modulate(proposals[i], policy, batch.row(i)) == modulate(
+            proposals[i], policy, contexts[i]
+        )
+    result = modulate_batch(proposals, policy, batch)
+    _assert_same(result, proposals, policy, contexts)
+
+
+def test_batch_all_guards_matches_scalar() -> None:
+    """all_guards=True: failed_bits as modulate_all_guards, reasons as the default mode."""
+    policy = GuardPolicy(staleness_ms=3000, rate_limit_events_max=8)
+    contexts = _random_contexts(2000, seed=11)
+    proposals = [Proposal(action=Action.ACT, confidence=0.5)] * len(contexts)
+    result = modulate_batch(proposals, policy, _to_columns(contexts), all_guards=True)
+    plain = modulate_batch(proposals, policy, _to_columns(contexts))
+    assert plain.failed_bits is None
+    assert np.array_equal(result.reason, plain.reason)
+    _assert_same(result, proposals, policy, contexts)
+    expected = [modulate_all_guards(p, policy, c)[2] for p, c in zip(proposals, contexts)]
+    assert result.failed_bits.tolist() == expected
+    assert len(set(expected)) > 10  # many guard combinations covered
+
+
+def test_guard_cooccurrence_counts() -> None:
+    rng = np.random.default_rng(3)
+    bits = rng.integers(0, ALL_GUARDS_FAILED + 1, 5000).astype(np.uint8)
+    failed = ((bits[:, None] >> np.arange(len(GUARD_ORDER))) & 1).astype(np.int64)
+    assert np.array_equal(guard_cooccurrence(bits), failed.T @ failed)
+
+
+def test_batch_all_guards_exception_and_adaptive() -> None:
+    proposals = [Proposal(action=Action.ACT, confidence=0.5)] * 3
+    result = modulate_batch(proposals, GuardPolicy(), {"now_ms": "x"}, all_guards=True)
+    assert not result.allowed.any()
+    assert (result.failed_bits == ALL_GUARDS_FAILED).all()
+    with pytest.raises(ValueError):
+        modulate_batch(proposals, GuardPolicy(), {}, adaptive=True, all_guards=True)
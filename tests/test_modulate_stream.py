@@ -0,0 +1,116 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""modulate_stream: same decisions as per-key GuardState, lazy chunks, fail-closed events."""
+
+import itertools
+import operator
+import random
+
+import pytest
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import GuardEvent, GuardState
+from dmc_core.dmc.stream import modulate_stream
+
+POLICY = GuardPolicy(
+    rate_limit_events_max=5,
+    rate_limit_window_ms=1000,
+    circuit_breaker_failures=3,
+    cooldown_ms=2000,
+    staleness_ms=500,
+)
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.9)
+
+
+def _events(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        event = {"now_ms": i * 37, "id": rng.choice("abc")}
+        kind = rng.random()
+        if kind < 0.4:
+            event["events"] = 1
+        elif kind < 0.6:
+            event["steps"] = 1
+            event["errors"] = int(rng.random() < 0.3)
+        elif kind < 0.7:
+            event["failures"] = 1
+        elif kind < 0.75:
+            event["ops_state"] = rng.choice(["GREEN", "RED"])
+        if rng.random() < 0.5:
+            event["proposal"] = PROPOSAL
+        out.append(event)
+    return out
+
+
+def test_matches_guard_state() -> None:
+    """Decisions equal applying each event to its key's GuardState, then modulating."""
+    events = _events(2000)
+    got = [d for chunk in modulate_stream(events, POLICY, lambda e: e["id"]) for d in chunk]
+
+    states: dict[str, GuardState] = {}
+    expected = []
+    for position, raw in enumerate(events):
+        state = states.setdefault(raw["id"], GuardState(POLICY))
+        fields = {k: v for k, v in raw.items() if k not in ("id", "proposal")}
+        state.apply(GuardEvent(**fields))
+        if "proposal" in raw:
+            expected.append((position, raw["id"], *state.modulate(PROPOSAL, raw["now_ms"])))
+    assert got == expected
+    assert {mismatch.flags[0] for *_, mismatch in got if mismatch.flags} >= {
+        "ops_health",
+        "staleness",
+        "rate_limit",
+    }
+
+
+def test_chunks_are_lazy() -> None:
+    """An unbounded stream yields full chunks as it is read."""
+    endless = ({"now_ms": t, "events": 1, "proposal": PROPOSAL} for t in itertools.count())
+    chunks = modulate_stream(endless, GuardPolicy(), chunk_size=100)
+    first, second = next(chunks), next(chunks)
+    assert len(first) == len(second) == 100
+    assert [d[0] for d in second] == list(range(100, 200))
+
+    tail = list(modulate_stream(_events(250), POLICY, chunk_size=64))
+    assert [len(c) for c in tail[:-1]] == [64] * (len(tail) - 1)
+    assert 0 < len(tail[-1]) <= 64
+
+
+def test_bad_event_fails_closed() -> None:
+    """A malformed event fails its proposal closed; later events are still decided."""
+    states: dict = {}
+    events = [
+        {"now_ms": 0, "events": 1},
+        {"events": 1, "proposal": PROPOSAL},  # no now_ms
+        {"now_ms": "x", "steps": 1},  # no proposal: skipped
+        {"now_ms": 10, "proposal": PROPOSAL},
+    ]
+    (chunk,) = modulate_stream(events, POLICY, states=states)
+    assert [d[0] for d in chunk] == [1, 3]
+    assert chunk[0][2].allowed is False
+    assert chunk[0][2].action in (Action.HOLD, Action.STOP)
+    assert chunk[0][3].flags == ["modulate_exception"]
+    assert chunk[1][2].allowed is True
+    assert states[None].last_event_ts_ms == 0
+
+
+def test_max_keys_evicts_least_recently_seen() -> None:
+    """states stays bounded; a bound above the live key count changes no decision."""
+    events = _events(400, seed=5)
+    key_fn = operator.itemgetter("id")
+    unbounded = list(modulate_stream(events, POLICY, key_fn))
+    assert list(modulate_stream(events, POLICY, key_fn, max_keys=3)) == unbounded
+
+    states: dict = {}
+    keys = ["a", "b", "a", "c", "d"]
+    raw = [{"now_ms": i, "id": k, "events": 1} for i, k in enumerate(keys)]
+    assert list(modulate_stream(raw, POLICY, key_fn, states=states, max_keys=2)) == []
+    assert list(states) == ["c", "d"]
+    states = {}
+    list(modulate_stream(raw[:4], POLICY, key_fn, states=states, max_keys=2))
+    assert list(states) == ["a", "c"]
+    with pytest.raises(ValueError):
+        list(modulate_stream(raw, POLICY, key_fn, max_keys=0))
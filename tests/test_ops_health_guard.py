@@ -3,8 +3,9 @@
 # SPDX-License-Identifier: MIT
 """Tests for ops-health guard."""
 
-from dmc_core.dmc.guards_generic import ops_health_guard
 from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.guards_generic import ReasonCode, ops_health_guard
 from dmc_core.dmc.modulator import modulate
 from dmc_core.dmc.policy import GuardPolicy
 
@@ -15,7 +16,8 @@ def test_ops_health_guard_deny_actions() -> None:
         ops_deny_actions=True, ops_state=None, ops_cooldown_until_ms=None, now_ms=1000
     )
     assert ok is False
-    assert code == "ops_deny_actions"
+    assert code == ReasonCode.OPS_DENY_ACTIONS
+    assert code.code == "ops_deny_actions"
 
 
 def test_ops_health_guard_red_state() -> None:
@@ -24,7 +26,8 @@ def test_ops_health_guard_red_state() -> None:
         ops_deny_actions=None, ops_state="RED", ops_cooldown_until_ms=None, now_ms=1000
     )
     assert ok is False
-    assert code == "ops_health_red"
+    assert code == ReasonCode.OPS_HEALTH_RED
+    assert code.code == "ops_health_red"
 
 
 def test_ops_health_guard_cooldown() -> None:
@@ -33,7 +36,8 @@ def test_ops_health_guard_cooldown() -> None:
         ops_deny_actions=None, ops_state=None, ops_cooldown_until_ms=2000, now_ms=1000
     )
     assert ok is False
-    assert code == "ops_cooldown_active"
+    assert code == ReasonCode.OPS_COOLDOWN_ACTIVE
+    assert code.code == "ops_cooldown_active"
 
 
 def test_ops_health_guard_cooldown_expired() -> None:
@@ -42,7 +46,7 @@ def test_ops_health_guard_cooldown_expired() -> None:
         ops_deny_actions=None, ops_state=None, ops_cooldown_until_ms=1000, now_ms=2000
     )
     assert ok is True
-    assert code == ""
+    assert code == ReasonCode.NONE
 
 
 def test_ops_health_guard_passes() -> None:
@@ -54,7 +58,7 @@ def test_ops_health_guard_passes() -> None:
         now_ms=1000,
     )
     assert ok is True
-    assert code == ""
+    assert code == ReasonCode.NONE
 
 
 def test_modulator_with_ops_health_deny() -> None:
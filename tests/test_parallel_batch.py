@@ -0,0 +1,101 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""modulate_parallel: same results as modulate_batch for any worker count."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.batch import GUARD_EXCEPTION, UNSET, modulate_batch
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.offline.parallel import modulate_parallel
+
+N = 50_000
+
+
+def _columns(n: int) -> dict:
+    rng = np.random.default_rng(4)
+    now = rng.integers(10_000, 20_000, n)
+    return {
+        "now_ms": now,
+        "last_event_ts_ms": now - rng.integers(-100, 8000, n),
+        "ops_deny_actions": np.where(rng.random(n) < 0.02, True, None).astype(object),
+        "ops_state": rng.choice(np.array([None, "GREEN", "RED"], dtype=object), n),
+        "ops_cooldown_until_ms": np.where(rng.random(n) < 0.05, now + 10, UNSET),
+        "errors_in_window": rng.random(n) * 5,  # float column stays float
+        "steps_in_window": rng.integers(-1, 60, n),
+        "rate_limit_events": 4,  # scalar, broadcast
+        "recent_failures": rng.integers(0, 6, n),
+        "cooldown_until_ms": np.where(rng.random(n) < 0.03, now + 5, None).astype(object),
+    }
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(3) as executor:
+        yield executor
+
+
+def test_matches_modulate_batch_for_any_split(pool):
+    columns = _columns(N)
+    proposals = [Proposal(action=Action.ACT, confidence=0.5)] * N
+    policy = GuardPolicy(staleness_ms=4000)
+    expected = modulate_batch(proposals, policy, columns)
+    for range_size in (N, 7_919, 1_000):
+        result = modulate_parallel(proposals, policy, columns, executor=pool, range_size=range_size)
+        assert result.exception is None
+        assert np.array_equal(result.reason, expected.reason)
+        assert np.array_equal(result.guard, expected.guard)
+        assert result.decision(17) == expected.decision(17)
+    inline = modulate_parallel(proposals, policy, columns, workers=1)
+    assert np.array_equal(inline.reason, expected.reason)
+
+
+def test_own_pool_and_empty_batch():
+    columns = _columns(1000)
+    proposals = [Proposal(action=Action.ACT, confidence=0.5)] * 1000
+    result = modulate_parallel(proposals, GuardPolicy(), columns, workers=2, range_size=300)
+    assert np.array_equal(result.reason, modulate_batch(proposals, GuardPolicy(), columns).reason)
+    assert len(modulate_parallel([], GuardPolicy(), {}, workers=2)) == 0
+
+
+def test_fail_closed(pool):
+    proposals = [Proposal(action=Action.ACT, confidence=0.5)] * 10
+    result = modulate_parallel(
+        proposals, GuardPolicy(), {"now_ms": np.array(["x"] * 10)}, executor=pool
+    )
+    assert result.exception == "TypeError"
+    assert not result.allowed.any() and (result.guard == GUARD_EXCEPTION).all()
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "now_ms",
+        "last_event_ts_ms",
+        "errors_in_window",
+        "steps_in_window",
+        "rate_limit_events",
+        "recent_failures",
+    ],
+)
+def test_none_numeric_column_fails_closed_like_modulate_batch(pool, key):
+    columns = {**_columns(1000), key: None}
+    proposals = [Proposal(action=Action.ACT, confidence=0.5)] * 1000
+    expected = modulate_batch(proposals, GuardPolicy(), columns)
+    result = modulate_parallel(proposals, GuardPolicy(), columns, executor=pool, range_size=300)
+    assert result.exception == expected.exception == "TypeError"
+    assert not result.allowed.any() and (result.guard == GUARD_EXCEPTION).all()
+
+
+def test_none_optional_column_means_not_set(pool):
+    optional = {**_columns(1000), "ops_state": None, "cooldown_until_ms": None}
+    proposals = [Proposal(action=Action.ACT, confidence=0.5)] * 1000
+    expected = modulate_batch(proposals, GuardPolicy(), optional)
+    result = modulate_parallel(proposals, GuardPolicy(), optional, executor=pool, range_size=300)
+    assert np.array_equal(result.reason, expected.reason)
@@ -0,0 +1,148 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""PolicyStore: validated JSON policies, versioned atomic swaps, polling reload."""
+
+import json
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.policy_store import PolicyStore, load_policy
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.9)
+CONTEXT = {"now_ms": 10_000, "last_event_ts_ms": 7000}  # 3000 ms old
+
+
+def _write(path, data: dict, mtime_s: int) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(tmp, (mtime_s, mtime_s))
+    os.replace(tmp, path)
+
+
+def test_load_validates(tmp_path) -> None:
+    """Unknown fields, bad values and bad actions are rejected; Infinity is allowed."""
+    path = tmp_path / "policy.json"
+    path.write_text('{"staleness_ms": Infinity, "fail_closed_action": "STOP"}')
+    policy = load_policy(path)
+    assert policy.staleness_ms == math.inf
+    assert policy.fail_closed_action is Action.STOP
+    assert policy.cooldown_ms == GuardPolicy().cooldown_ms
+    for bad in (
+        {"staleness": 5},
+        {"staleness_ms": -1},
+        {"staleness_ms": "5"},
+        {"cooldown_ms": True},
+        {"max_error_rate": 1.5},
+        {"fail_closed_action": "ACT"},
+        [],
+    ):
+        path.write_text(json.dumps(bad))
+        with pytest.raises((TypeError, ValueError)):
+            load_policy(path)
+
+
+def test_reload_swaps_versions_and_keeps_last_good(tmp_path) -> None:
+    """A changed file becomes the next version; an invalid one keeps the active version."""
+    path = tmp_path / "policy.json"
+    _write(path, {"staleness_ms": 5000}, 1000)
+    with PolicyStore(path) as store:
+        version, final, _ = store.modulate(PROPOSAL, CONTEXT)
+        assert (version, final.allowed) == (1, True)
+        assert not store.reload()
+
+        _write(path, {"staleness_ms": 1000}, 2000)
+        assert store.reload()
+        version, final, mismatch = store.modulate(PROPOSAL, CONTEXT)
+        assert version == 2
+        assert (final, mismatch) == modulate(PROPOSAL, GuardPolicy(staleness_ms=1000), CONTEXT)
+
+        path.write_text("{not json")
+        os.utime(path, (3000, 3000))
+        assert not store.reload()
+        path.unlink()
+        assert not store.reload()
+        assert store.active.version == 2 and store.policy.staleness_ms == 1000
+
+        active = store.set(GuardPolicy(staleness_ms=9000))
+        assert active.version == 3 == store.modulate(PROPOSAL, CONTEXT)[0]
+        with pytest.raises(ValueError):
+            store.set(GuardPolicy(max_error_rate=-0.5))
+        assert store.version == 3
+
+
+def test_same_mtime_replacement_is_a_change(tmp_path) -> None:
+    """A file renamed over the policy with the same mtime is still picked up."""
+    path = tmp_path / "policy.json"
+    _write(path, {"staleness_ms": 5000}, 1000)
+    with PolicyStore(path) as store:
+        _write(path, {"staleness_ms": 100}, 1000)
+        assert store.reload()
+        assert store.policy.staleness_ms == 100
+
+
+@dataclass
+class _PickyPolicy(GuardPolicy):
+    def __post_init__(self) -> None:
+        if self.cooldown_ms == 7:
+            raise RuntimeError("not this one")
+
+
+def test_watcher_survives_any_build_error(tmp_path) -> None:
+    """Errors beyond OSError/ValueError keep the last good version and the watcher alive."""
+    path = tmp_path / "policy.json"
+    _write(path, {"staleness_ms": 5000}, 1000)
+    with PolicyStore(path, policy_type=_PickyPolicy) as store:
+        _write(path, {"cooldown_ms": 7}, 2000)
+        assert not store.reload()
+        assert store.version == 1
+        store.watch(interval_s=0.005)
+        _write(path, {"cooldown_ms": 7, "staleness_ms": 1}, 3000)
+        time.sleep(0.05)
+        _write(path, {"staleness_ms": 100}, 4000)
+        deadline = time.monotonic() + 5
+        while store.version < 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert store.version == 2 and store.policy.staleness_ms == 100
+
+
+def test_watcher_reloads_while_readers_run(tmp_path) -> None:
+    """Readers never lock and always see a consistent (version, policy) pair."""
+    path = tmp_path / "policy.json"
+    _write(path, {"staleness_ms": 0}, 1000)
+    store = PolicyStore(path)
+    errors = []
+    stop = threading.Event()
+
+    def reader() -> None:
+        while not stop.is_set():
+            version, final, _ = store.modulate(PROPOSAL, CONTEXT)
+            # odd versions deny stale contexts, even versions allow them
+            if final.allowed != (version % 2 == 0):
+                errors.append(version)
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for t in readers:
+        t.start()
+    store.watch(interval_s=0.005)
+    try:
+        for v in range(2, 8):
+            _write(path, {"staleness_ms": 0 if v % 2 else 5000}, 1000 + v)
+            deadline = time.monotonic() + 5
+            while store.version < v and time.monotonic() < deadline:
+                time.sleep(0.005)
+            assert store.version == v
+    finally:
+        stop.set()
+        for t in readers:
+            t.join()
+        store.close()
+    assert errors == []
@@ -0,0 +1,96 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Policy sweep: broadcast policies x contexts must match per-policy modulate_batch."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.batch import UNSET, GuardContextBatch, modulate_batch
+from dmc_core.dmc.guards_generic import GUARD_ORDER, REASON_CODES
+from dmc_core.offline import (
+    CONTEXT_DTYPE,
+    ContextRecorder,
+    grid,
+    random_policies,
+    sweep,
+)
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.5)
+
+
+def _records(n: int, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    rec = np.zeros(n, dtype=CONTEXT_DTYPE)
+    now = rng.integers(10_000, 20_000, n)
+    rec["now_ms"] = now
+    rec["last_event_ts_ms"] = now - rng.integers(-100, 9000, n)
+    rec["ops_deny_actions"] = rng.random(n) < 0.03
+    rec["ops_state"] = np.where(rng.random(n) < 0.03, "RED", "")
+    rec["ops_cooldown_until_ms"] = np.where(rng.random(n) < 0.03, now + 5, UNSET)
+    rec["errors_in_window"] = rng.integers(0, 10, n)
+    rec["steps_in_window"] = rng.integers(-1, 60, n)
+    rec["rate_limit_events"] = rng.integers(0, 14, n)
+    rec["recent_failures"] = rng.integers(0, 7, n)
+    rec["cooldown_until_ms"] = np.where(rng.random(n) < 0.05, now + 1, UNSET)
+    return rec
+
+
+POLICIES = grid(
+    staleness_ms=[1000, 5000, 8000],
+    max_error_rate=[0.05, 0.2],
+    rate_limit_events_max=[5, 10],
+    circuit_breaker_failures=[3, 6],
+)
+
+
+def _expected_counts(columns, policies):
+    n = len(columns["now_ms"])
+    out = []
+    for policy in policies:
+        reason = modulate_batch([PROPOSAL] * n, policy, columns).reason
+        out.append(np.bincount(reason.astype(np.intp), minlength=len(REASON_CODES)))
+    return np.array(out)
+
+
+def test_grid_and_random_policies():
+    assert len(POLICIES) == 24
+    assert {p.staleness_ms for p in POLICIES} == {1000, 5000, 8000}
+    sampled = random_policies(5, seed=1, staleness_ms=(100, 9000), max_error_rate=(0.0, 0.5))
+    assert sampled == random_policies(
+        5, seed=1, staleness_ms=(100, 9000), max_error_rate=(0.0, 0.5)
+    )
+    assert all(isinstance(p.staleness_ms, int) and 0 <= p.max_error_rate <= 0.5 for p in sampled)
+
+
+@pytest.mark.parametrize("max_cells,workers", [(1 << 20, 1), (1000, 1), (1000, 4)])
+def test_sweep_matches_modulate_batch(tmp_path, max_cells, workers):
+    records = _records(2500)
+    path = tmp_path / "ctx.bin"
+    with ContextRecorder(path) as recorder:
+        recorder.append_records(records)
+    result = sweep(path, POLICIES, chunk_size=600, max_cells=max_cells, workers=workers)
+    expected = _expected_counts({k: records[k] for k in CONTEXT_DTYPE.names}, POLICIES)
+    assert result.records == 2500
+    assert np.array_equal(result.reason_counts, expected)
+    assert np.allclose(result.pass_rate, expected[:, 0] / 2500)
+    triggers = result.guard_triggers()
+    assert triggers.shape == (len(POLICIES), len(GUARD_ORDER))
+    assert np.array_equal(triggers.sum(axis=1) + result.allowed, np.full(len(POLICIES), 2500))
+
+
+def test_sweep_table_and_column_chunks():
+    batch = GuardContextBatch.from_contexts(
+        [{"now_ms": 100, "last_event_ts_ms": 0}, {"now_ms": 100, "recent_failures": 9}]
+    )
+    policies = grid(staleness_ms=[50, 500])
+    result = sweep([batch], policies, workers=1)
+    rows = result.table()
+    assert [r["staleness_ms"] for r in rows] == [50, 500]
+    assert [r["staleness"] for r in rows] == [1, 0]
+    assert [r["circuit_breaker"] for r in rows] == [1, 1]
+    assert rows[1]["pass_rate"] == 0.5
+    assert sweep([batch], [], workers=1).reason_counts.shape == (0, len(REASON_CODES))
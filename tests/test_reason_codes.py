@@ -0,0 +1,70 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""ReasonCode / GuardId: ids match the string tables; strings only at the schema boundary."""
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc import modulator
+from dmc_core.dmc.guards_generic import (
+    GUARD_ID,
+    GUARD_ORDER,
+    REASON_CODES,
+    REASON_GUARD,
+    REASON_ID,
+    GuardId,
+    ReasonCode,
+    cooldown_guard,
+    staleness_guard,
+)
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+
+
+def test_enums_match_tables() -> None:
+    """GuardId indexes GUARD_ORDER, ReasonCode indexes REASON_CODES / REASON_GUARD."""
+    assert [g.flag for g in GuardId] == list(GUARD_ORDER)
+    assert [r.code for r in ReasonCode] == list(REASON_CODES)
+    for r in ReasonCode:
+        assert (r.guard is None) == (REASON_GUARD[r] < 0)
+        if r:
+            assert r.guard == REASON_GUARD[r]
+            assert REASON_ID[r.code] is r
+    assert GUARD_ID["cooldown"] is GuardId.COOLDOWN
+    assert not ReasonCode.NONE
+
+
+def test_guards_return_codes_modulate_returns_strings() -> None:
+    """Guards return ReasonCode; MismatchInfo / FinalDecision keep the string contract."""
+    assert staleness_guard(0, 10, 5) == (False, ReasonCode.STALENESS_EXCEEDED)
+    assert cooldown_guard(None, 10) == (True, ReasonCode.NONE)
+
+    proposal = Proposal(action=Action.ACT, confidence=0.9)
+    context = {"now_ms": 10_000, "last_event_ts_ms": 0}
+    for low_alloc in (False, True):
+        final, mismatch = modulate(proposal, GuardPolicy(), context, low_alloc=low_alloc)
+        assert mismatch.flags == ["staleness"]
+        assert mismatch.reason_codes == ["staleness_exceeded"]
+        assert type(mismatch.reason_codes[0]) is str
+        assert final.reasons == ["staleness_exceeded"]
+
+
+def test_recorder_receives_reason_ids() -> None:
+    """The instrumentation hook gets the ReasonCode id (0 = allowed), not a string."""
+    seen = []
+
+    class Recorder:
+        def record(self, reason_id, exception, elapsed_ns):
+            seen.append((reason_id, exception))
+
+    proposal = Proposal(action=Action.ACT, confidence=0.9)
+    modulator.set_recorder(Recorder())
+    try:
+        modulate(proposal, GuardPolicy(), {"now_ms": 5, "cooldown_until_ms": 9})
+        modulate(proposal, GuardPolicy(), {"now_ms": 5})
+        modulate(proposal, GuardPolicy(), {"now_ms": "x"})
+    finally:
+        modulator.set_recorder(None)
+    assert seen[0] == (ReasonCode.COOLDOWN_ACTIVE, None)
+    assert seen[1] == (0, None)
+    assert seen[2][1] == "TypeError"
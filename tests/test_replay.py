@@ -0,0 +1,137 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Replay: chunked recordings evaluated against many policies must match modulate."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.batch import GuardContextBatch, modulate_batch
+from dmc_core.dmc.guards_generic import GUARD_ORDER
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.offline import (
+    ContextRecorder,
+    iter_chunks,
+    open_recording,
+    replay,
+    write_contexts,
+)
+from dmc_core.offline.kernel import features, policy_reason_ids
+
+PROPOSAL = Proposal(action=Action.ACT, confidence=0.5)
+BASELINE = GuardPolicy()
+CANDIDATES = {
+    "strict": GuardPolicy(staleness_ms=2000, max_error_rate=0.05, rate_limit_events_max=5),
+    "loose": GuardPolicy(staleness_ms=8000, circuit_breaker_failures=6),
+}
+
+
+def _random_contexts(n: int, seed: int = 11) -> list[dict]:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        now = rng.randint(0, 20_000)
+        out.append(
+            {
+                "now_ms": now,
+                "last_event_ts_ms": now - rng.randint(-100, 9000),
+                "ops_deny_actions": rng.choice([None, False, True, None, None, None, None]),
+                "ops_state": rng.choice([None, "GREEN", "RED", None, None, None, None]),
+                "ops_cooldown_until_ms": rng.choice([None, None, None, now + 10]),
+                "errors_in_window": rng.randint(0, 10),
+                "steps_in_window": rng.randint(-1, 60),
+                "rate_limit_events": rng.randint(0, 14),
+                "recent_failures": rng.randint(0, 6),
+                "cooldown_until_ms": rng.choice([None, None, None, now + 1, now]),
+            }
+        )
+        if rng.random() < 0.2:
+            del out[-1]["last_event_ts_ms"]  # defaults to now_ms
+    return out
+
+
+def _expected(contexts, policy):
+    return [modulate(PROPOSAL, policy, c)[0].allowed for c in contexts]
+
+
+def test_recording_round_trip(tmp_path):
+    contexts = _random_contexts(50)
+    path = tmp_path / "ctx.bin"
+    assert write_contexts(path, contexts) == 50
+    batch = GuardContextBatch(next(iter_chunks(path)))
+    for i, c in enumerate(contexts):
+        assert modulate(PROPOSAL, BASELINE, batch.row(i)) == modulate(PROPOSAL, BASELINE, c)
+
+
+@pytest.mark.parametrize(
+    ("change", "error"),
+    [
+        ({"errors_in_window": 0.5}, TypeError),
+        ({"now_ms": 1000.5}, TypeError),
+        ({"cooldown_until_ms": 2000.5}, TypeError),
+        ({"ops_state": 1}, TypeError),
+        ({"ops_state": "YELLOWISH"}, ValueError),
+    ],
+)
+def test_recorder_rejects_values_it_would_truncate(tmp_path, change, error):
+    valid = _random_contexts(1)[0]
+    with ContextRecorder(tmp_path / "ctx.bin") as recorder:
+        with pytest.raises(error):
+            recorder.append({**valid, **change})
+        recorder.append(valid)
+    assert len(open_recording(tmp_path / "ctx.bin")) == 1
+
+
+def test_kernel_matches_modulate_batch():
+    contexts = _random_contexts(1500)
+    batch = GuardContextBatch.from_contexts(contexts)
+    f = features(batch, batch.size)
+    for policy in [BASELINE, *CANDIDATES.values()]:
+        expected = modulate_batch([PROPOSAL] * batch.size, policy, batch).reason
+        assert np.array_equal(policy_reason_ids(f, policy), expected)
+
+
+def test_replay_matches_modulate_across_chunks(tmp_path):
+    contexts = _random_contexts(3000)
+    path = tmp_path / "ctx.bin"
+    with ContextRecorder(path, buffer_rows=256) as recorder:
+        for c in contexts:
+            recorder.append(c)
+    report = replay(path, BASELINE, CANDIDATES, chunk_size=700, max_samples=10**6)
+
+    base = _expected(contexts, BASELINE)
+    assert report.records == 3000
+    assert report.baseline.allowed == sum(base)
+    for name, policy in CANDIDATES.items():
+        cand = _expected(contexts, policy)
+        diff = report.diffs[name]
+        assert report.candidates[name].allowed == sum(cand)
+        assert diff.allowed_to_denied == sum(b and not c for b, c in zip(base, cand))
+        assert diff.denied_to_allowed == sum(c and not b for b, c in zip(base, cand))
+        assert diff.samples == [i for i, (b, c) in enumerate(zip(base, cand)) if b != c]
+        deltas = report.trigger_deltas(name)
+        assert set(deltas) == set(GUARD_ORDER)
+        assert sum(deltas.values()) == sum(base) - sum(cand)
+
+
+def test_replay_accepts_column_chunks():
+    contexts = _random_contexts(400)
+    chunks = [GuardContextBatch.from_contexts(contexts[i : i + 100]) for i in range(0, 400, 100)]
+    report = replay(chunks, BASELINE, CANDIDATES, max_samples=3)
+    assert report.records == 400
+    assert report.baseline.allowed == sum(_expected(contexts, BASELINE))
+    assert all(len(d.samples) <= 3 for d in report.diffs.values())
+    assert report.to_dict()["candidates"].keys() == CANDIDATES.keys()
+
+
+def test_open_recording_rejects_foreign_file(tmp_path):
+    path = tmp_path / "x.bin"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        open_recording(path)
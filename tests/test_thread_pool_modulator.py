@@ -0,0 +1,114 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""ThreadPoolModulator: same decisions as sequential evaluation for any thread count."""
+
+import random
+from collections import Counter
+
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.modulator import modulate
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import GuardEvent, GuardState
+from dmc_core.dmc.threaded import ThreadPoolModulator, default_threads, gil_enabled
+
+POLICY = GuardPolicy(
+    rate_limit_events_max=4,
+    rate_limit_window_ms=1000,
+    circuit_breaker_failures=3,
+    cooldown_ms=500,
+    staleness_ms=10_000,
+)
+
+
+def _items(n: int, keys: int, seed: int) -> list:
+    rng = random.Random(seed)
+    proposal = Proposal(action=Action.ACT, confidence=0.8)
+    items = []
+    for t in range(n):
+        event = GuardEvent(
+            now_ms=t * 10,
+            events=rng.randint(0, 2),
+            steps=1,
+            errors=rng.randint(0, 1),
+            failures=1 if rng.random() < 0.1 else 0,
+        )
+        items.append((f"k{rng.randrange(keys)}", proposal, event))
+    return items
+
+
+def _reference(items: list, states: dict) -> list:
+    out = []
+    for key, proposal, event in items:
+        state = states.setdefault(key, GuardState(POLICY))
+        state.apply(event)
+        out.append(state.modulate(proposal, event.now_ms))
+    return out
+
+
+def test_process_stress_matches_sequential() -> None:
+    """Repeated batches on 1..8 threads: per-key decisions and merged stats match."""
+    batches = [_items(1500, keys=40, seed=s) for s in range(4)]
+    reference_states: dict = {}
+    expected = [_reference(b, reference_states) for b in batches]
+    reasons = Counter(
+        m.reason_codes[0] if m.reason_codes else "" for batch in expected for _, m in batch
+    )
+    for threads in (1, 2, 3, 8):
+        with ThreadPoolModulator(POLICY, threads) as pool:
+            for batch, want in zip(batches, expected):
+                assert pool.process(batch) == want
+            assert len(pool) == len(reference_states)
+            stats = pool.stats()
+        assert stats.decisions == sum(len(b) for b in batches)
+        assert stats.exceptions == 0
+        assert stats.allowed == reasons[""]
+        assert stats.reason_counts() == {k: v for k, v in reasons.items() if k}
+
+
+def test_modulate_many_matches_modulate() -> None:
+    """Stateless contexts split into ranges; order kept, exceptions fail closed and counted."""
+    rng = random.Random(7)
+    proposal = Proposal(action=Action.ACT, confidence=0.9)
+    contexts = [
+        {
+            "now_ms": 20_000,
+            "last_event_ts_ms": rng.randint(0, 20_000),
+            "rate_limit_events": rng.randint(0, 6),
+            "cooldown_until_ms": rng.choice([None, 20_001]),
+        }
+        for _ in range(3000)
+    ]
+    contexts[1234] = {"now_ms": "x"}
+    proposals = [proposal] * len(contexts)
+    expected = [modulate(proposal, POLICY, c) for c in contexts]
+    with ThreadPoolModulator(POLICY, 4, min_range=100) as pool:
+        for _ in range(3):
+            assert pool.modulate_many(proposals, contexts) == expected
+        stats = pool.stats()
+    assert stats.decisions == 9000
+    assert stats.exceptions == 3
+    assert not expected[1234][0].allowed
+    assert ThreadPoolModulator(POLICY, 2).modulate_many([], []) == []
+
+
+def test_default_threads_follows_gil() -> None:
+    """With the GIL enabled threads cannot add throughput, so the default runs inline."""
+    assert (default_threads() == 1) or not gil_enabled()
+    assert ThreadPoolModulator(POLICY).threads == default_threads()
+
+
+def test_process_bad_item_fails_closed() -> None:
+    """An event that cannot be applied fails only its item closed, as in KeyedModulator."""
+    items = _items(200, keys=5, seed=3)
+    key, proposal, _ = items[50]
+    items[50] = (key, proposal, GuardEvent(now_ms="x"))
+    states: dict = {}
+    expected = _reference(items[:50], states) + _reference(items[51:], states)
+    with ThreadPoolModulator(POLICY, 3) as pool:
+        got = pool.process(items)
+        assert pool.stats().exceptions == 1
+    final, mismatch = got.pop(50)
+    assert not final.allowed and mismatch.flags == ["modulate_exception"]
+    assert got == expected
@@ -0,0 +1,84 @@
+# Decision Ecosystem — decision-modulation-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""TimerWheel: keys fire exactly when their deadline is reached, across all levels."""
+
+import random
+
+import pytest
+from decision_schema.types import Action, Proposal
+
+from dmc_core.dmc.policy import GuardPolicy
+from dmc_core.dmc.state import GuardEvent, GuardState
+from dmc_core.dmc.timer_wheel import TimerWheel
+
+
+@pytest.mark.parametrize("bits,levels,tick_ms", [(1, 1, 1), (2, 3, 3), (3, 2, 10), (8, 4, 1)])
+def test_matches_reference(bits, levels, tick_ms):
+    rng = random.Random(bits * 100 + levels)
+    now = rng.randint(0, 1000)
+    wheel = TimerWheel(now, tick_ms=tick_ms, bits=bits, levels=levels)
+    expected: dict[int, int] = {}
+    for _ in range(3000):
+        op = rng.random()
+        if op < 0.5:
+            key = rng.randint(0, 80)
+            deadline = now + rng.choice([rng.randint(-5, 20), rng.randint(0, 5000), 10**7])
+            wheel.schedule(key, deadline)
+            expected[key] = deadline
+        elif op < 0.6:
+            key = rng.randint(0, 80)
+            assert wheel.discard(key) == (expected.pop(key, None) is not None)
+        else:
+            now += rng.choice([0, 1, 2, 7, 300, rng.randint(0, 10**6)])
+            due = sorted(k for k, d in expected.items() if d <= now)
+            assert sorted(wheel.advance(now)) == due
+            for key in due:
+                del expected[key]
+        assert len(wheel) == len(expected)
+
+
+def test_fires_in_tick_order_with_callback():
+    seen = []
+    wheel = TimerWheel(0, on_expire=lambda key, deadline: seen.append((key, deadline)))
+    for key, deadline in (("c", 70_000), ("a", 5), ("b", 300)):
+        wheel.schedule(key, deadline)
+    assert wheel.advance(4) == []
+    assert wheel.advance(100_000) == ["a", "b", "c"]
+    assert seen == [("a", 5), ("b", 300), ("c", 70_000)]
+    assert len(wheel) == 0 and "a" not in wheel
+
+
+def test_reschedule_replaces_deadline():
+    wheel = TimerWheel(0)
+    wheel.schedule("k", 10)
+    wheel.schedule("k", 50)
+    assert wheel.deadline("k") == 50
+    assert wheel.advance(49) == []
+    assert wheel.advance(50) == ["k"]
+
+
+def test_arm_cooldown_uses_policy_and_never_shortens():
+    policy = GuardPolicy(cooldown_ms=1000)
+    wheel = TimerWheel(0)
+    assert wheel.arm_cooldown("k", 100, policy) == 1100
+    assert wheel.arm_cooldown("k", 50, policy) == 1100
+    assert wheel.arm_cooldown("k", 500, policy) == 1500
+    assert wheel.advance(1499) == [] and wheel.advance(1500) == ["k"]
+
+
+def test_fired_keys_are_the_ones_whose_cooldown_lifted():
+    # window (1 s) shorter than the cooldown (2 s): only the cooldown keeps keys denied
+    policy = GuardPolicy(circuit_breaker_failures=1, cooldown_ms=2000, rate_limit_window_ms=1000)
+    proposal = Proposal(action=Action.ACT, confidence=0.5)
+    states = {k: GuardState(policy) for k in range(50)}
+    wheel = TimerWheel(0)
+    for k, state in states.items():
+        state.apply(GuardEvent(now_ms=k * 37, failures=1))
+        wheel.schedule(k, state.cooldown_until_ms)
+    for now in range(0, 5000, 25):
+        for k in wheel.advance(now):
+            assert states[k].modulate(proposal, now)[0].allowed
+        for k, state in states.items():
+            assert state.modulate(proposal, now)[0].allowed == (k not in wheel)
+    assert len(wheel) == 0